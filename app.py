@@ -4,7 +4,13 @@ Project Tracker - Main Application
 """
 
 import streamlit as st
-from config import PAGE_CONFIG
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from config import PAGE_CONFIG, get_metrics_config
+import metrics
+import db_manager as db
+import startup
+import session
 
 # Components
 from components import (
@@ -14,7 +20,7 @@ from components import (
 )
 
 # Views
-from views import show_auth_page
+from views import show_auth_page, render_my_retrospectives_page
 
 
 # ========================================
@@ -25,34 +31,22 @@ st.set_page_config(**PAGE_CONFIG)
 
 
 # ========================================
-# 세션 상태 초기화
+# 메트릭 서버 (secrets.toml에 [metrics]가 있을 때만)
 # ========================================
 
-# 인증 관련
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
-
-if 'user' not in st.session_state:
-    st.session_state.user = None
-
-# 프로젝트 관련
-if 'current_project_id' not in st.session_state:
-    st.session_state.current_project_id = None
-
-if 'show_create_project' not in st.session_state:
-    st.session_state.show_create_project = False
+metrics_config = get_metrics_config()
+if metrics_config:
+    metrics.start_metrics_server(metrics_config['port'], metrics_config['host'])
+    # 세션 상태 크기는 브라우저 연결이 끊길 때까지 집계
+    if Runtime.exists():
+        metrics.set_session_check(Runtime.instance().is_active_session)
 
-if 'show_create_task' not in st.session_state:
-    st.session_state.show_create_task = False
 
-if 'view_task_id' not in st.session_state:
-    st.session_state.view_task_id = None
-
-if 'edit_task_id' not in st.session_state:
-    st.session_state.edit_task_id = None
+# ========================================
+# 세션 상태 초기화
+# ========================================
 
-if 'edit_project_id' not in st.session_state:
-    st.session_state.edit_project_id = None
+session.init_session_state()
 
 
 # ========================================
@@ -62,6 +56,55 @@ if 'edit_project_id' not in st.session_state:
 def main():
     """메인 함수"""
 
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        metrics.touch_session(ctx.session_id)
+
+    db.reset_request_state()
+
+    # 다른 화면으로 이동했으면 이전 화면의 플래그/화면별 데이터 정리
+    session.prune_transient_state()
+
+    # 프로세스 시작 후 첫 실행에서 스키마 확인, 연결 풀/캐시 준비 (스키마가 맞지 않으면 중단)
+    startup.ensure_ready()
+
+    # 데이터베이스 장애 배너 자리 (화면을 그린 뒤 상태에 따라 채움)
+    status_banner = st.empty()
+
+    with metrics.RERUN_DURATION.time(view=_current_view()):
+        _render_page()
+
+    _render_connection_banner(status_banner)
+
+    if ctx is not None:
+        metrics.record_session_state(ctx.session_id, *session.measure_state(st.session_state.to_dict()))
+
+
+def _render_connection_banner(placeholder):
+    """데이터베이스 연결 장애 시 최근 데이터 표시 중임을 알리는 배너"""
+
+    status = db.get_connection_status()
+    if status['state'] == 'closed' and not status['stale']:
+        return
+
+    retry = f" ({status['retry_in']:.0f}초 후 다시 연결을 시도합니다)" if status['retry_in'] else ""
+    if status['stale']:
+        placeholder.warning(
+            "⚠️ 데이터베이스에 연결할 수 없어 최근에 불러온 데이터를 표시하고 있습니다. "
+            f"변경 사항은 저장되지 않습니다.{retry}"
+        )
+    else:
+        placeholder.warning(f"⚠️ 데이터베이스에 연결할 수 없습니다.{retry}")
+
+
+def _current_view() -> str:
+    """메트릭 레이블로 쓸 현재 화면 이름"""
+    return session.current_view()[0]
+
+
+def _render_page():
+    """현재 화면 렌더링"""
+
     # 로그인 체크
     if not st.session_state.authenticated:
         show_auth_page()
@@ -73,6 +116,9 @@ def main():
     # 프로젝트 생성 폼 표시
     if st.session_state.show_create_project:
         show_create_project_form()
+    elif st.session_state.show_my_retrospectives:
+        # 내 회고 모아보기
+        render_my_retrospectives_page()
     else:
         # 메인 컨텐츠 렌더링
         render_main_content()
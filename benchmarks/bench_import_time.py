@@ -0,0 +1,129 @@
+"""
+Project Tracker - Import Time Benchmark
+앱 모듈의 콜드 스타트 import 시간 측정 (python -X importtime)
+
+app.py가 로그인 화면 전에 불러오는 모듈(components, views, db_manager)을 새 인터프리터에서
+import하고, 모듈별 누적 import 시간 상위 N개와 전체 시간을 출력한다.
+첫 화면에 필요 없는 무거운 모듈(pandas, plotly.express)이 미리 로드되면 실패(종료 코드 1)한다.
+
+streamlit 자체가 plotly(plotly.graph_objects)를 불러오므로 기본 plotly 패키지는 검사하지 않는다.
+
+사용 예시:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --top 30 --runs 5
+    python benchmarks/bench_import_time.py --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 로그인 화면 전에 import되는 앱 모듈 (app.py 상단 import와 같음)
+APP_MODULES = ('config', 'metrics', 'db_manager', 'components', 'views')
+
+# 첫 화면에서 로드되면 안 되는 모듈 (대시보드/DataFrame이 처음 필요할 때 로드)
+LAZY_MODULES = ('pandas', 'numpy', 'plotly.express')
+
+IMPORT_SCRIPT = f"""
+import json, sys, time
+sys.path.insert(0, {ROOT!r})
+start = time.perf_counter()
+import {', '.join(APP_MODULES)}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [name for name in {LAZY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+# ========================================
+# 측정
+# ========================================
+
+def parse_importtime(stderr: str) -> list:
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        list: (모듈 이름, self 마이크로초, cumulative 마이크로초) 리스트
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # 헤더 줄 ("self [us] | cumulative | imported package")
+            continue
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def run_once() -> dict:
+    """새 인터프리터에서 앱 모듈을 한 번 import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        sys.exit(result.returncode)
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report['modules'] = parse_importtime(result.stderr)
+    return report
+
+
+# ========================================
+# 출력
+# ========================================
+
+def print_top_modules(modules: list, top: int) -> None:
+    print(f"\n누적 import 시간 상위 {top}개 (마지막 실행)")
+    print(f"{'cumulative(ms)':>15} {'self(ms)':>9}  모듈")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda row: row[2], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>15.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 모듈 콜드 스타트 import 시간 측정")
+    parser.add_argument("--runs", type=int, default=3, help="측정 반복 횟수 (기본: 3)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 모듈 수 (기본: 20)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="import 시간 중앙값 상한 (ms), 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    reports = [run_once() for _ in range(args.runs)]
+    timings = [report['elapsed'] * 1000 for report in reports]
+    median_ms = statistics.median(timings)
+
+    print(f"앱 모듈 import ({', '.join(APP_MODULES)})")
+    print(f"  실행 {args.runs}회: 중앙값 {median_ms:.0f}ms, 최소 {min(timings):.0f}ms, "
+          f"최대 {max(timings):.0f}ms")
+
+    print_top_modules(reports[-1]['modules'], args.top)
+
+    failed = False
+
+    loaded = reports[-1]['loaded']
+    if loaded:
+        print(f"\n❌ 첫 화면 전에 로드된 무거운 모듈: {', '.join(loaded)}")
+        failed = True
+    else:
+        print(f"\n✅ 지연 로드 확인: {', '.join(LAZY_MODULES)}")
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"❌ import 시간 {median_ms:.0f}ms가 예산 {args.budget_ms:.0f}ms를 넘었습니다.")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Project Tracker - Row Type Benchmark
+딕셔너리 행과 models.Task(__slots__) 행의 메모리/속도 비교
+
+데이터베이스 없이 tasks 테이블과 같은 모양의 가짜 튜플 행으로 측정한다.
+
+사용 예시:
+    python benchmarks/bench_row_types.py
+    python benchmarks/bench_row_types.py --rows 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Task  # noqa: E402
+
+
+COLUMN_NAMES = ('id', 'project_id', 'title', 'description', 'status', 'priority',
+                'tags', 'estimated_hours', 'due_date', 'started_at', 'completed_at',
+                'created_at', 'updated_at')
+
+
+def make_rows(count: int) -> list:
+    """tasks 테이블 모양의 튜플 행 생성 (커서가 반환하는 형태)"""
+    now = datetime(2024, 11, 23, 12, 0, 0)
+    statuses = ('todo', 'in_progress', 'done')
+    priorities = ('low', 'medium', 'high')
+
+    return [
+        (
+            i, 1, f"태스크 {i}", None, statuses[i % 3], priorities[i % 3],
+            'Dev,API' if i % 2 else None, Decimal('2.50'),
+            date(2024, 12, 1) + timedelta(days=i % 30),
+            now, now if i % 3 == 2 else None, now, now
+        )
+        for i in range(count)
+    ]
+
+
+def build_dicts(rows: list) -> list:
+    """딕셔너리 커서와 같은 방식으로 행 생성"""
+    return [dict(zip(COLUMN_NAMES, row)) for row in rows]
+
+
+def build_tasks(rows: list) -> list:
+    """models.Task 행 생성"""
+    return Task.from_rows(COLUMN_NAMES, rows)
+
+
+def measure_memory(builder, rows: list) -> int:
+    """행 객체 생성에 사용된 메모리 (바이트, 원본 튜플 제외)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = builder(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return after - before
+
+
+def measure_time(func, repeat: int = 5) -> float:
+    """최소 실행 시간 (밀리초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def access_pattern(tasks: list) -> int:
+    """views/utils에서 자주 쓰는 접근 패턴 (상태 분류 + 태그 조회)"""
+    count = 0
+    for task in tasks:
+        if task['status'] == 'done':
+            count += 1
+        if task.get('tags'):
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="행 타입 메모리/속도 비교")
+    parser.add_argument("--rows", type=int, default=5000, help="행 개수 (기본: 5000)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    dicts = build_dicts(rows)
+    tasks = build_tasks(rows)
+
+    results = [
+        ("dict", measure_memory(build_dicts, rows),
+         measure_time(lambda: build_dicts(rows)),
+         measure_time(lambda: access_pattern(dicts))),
+        ("Task", measure_memory(build_tasks, rows),
+         measure_time(lambda: build_tasks(rows)),
+         measure_time(lambda: access_pattern(tasks))),
+    ]
+
+    print(f"행 개수: {args.rows}")
+    print(f"{'타입':<6} {'메모리(KB)':>12} {'행당(B)':>9} {'생성(ms)':>10} {'접근(ms)':>10}")
+    for name, memory, build_ms, access_ms in results:
+        print(f"{name:<6} {memory / 1024:>12.1f} {memory / args.rows:>9.0f} "
+              f"{build_ms:>10.2f} {access_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Project Tracker - Shared Cache Benchmark
+레플리카 수를 늘렸을 때 프로세스 캐시만 쓸 때와 공유 캐시를 함께 쓸 때의 적중률 비교
+
+레플리카마다 st.cache_data처럼 프로세스 안 LRU 캐시를 두고, 요청을 레플리카에 무작위로
+나눠 보낸다. 일부 요청은 쓰기로 사용자의 data_version을 올린다 (다른 레플리카의 캐시 무효화).
+쿼리 실행 횟수, 적중률, 오래된 결과를 돌려준 횟수(항상 0이어야 함)를 출력하고,
+마지막으로 invalidate_all() 후 앱과 같은 st.cache_data + 공유 캐시 구성의 조회가
+새로 계산되는지 확인한다.
+
+--redis를 주지 않으면 같은 프로세스에서 Redis 프로토콜 대역 서버(GET/SET EX/INCR)를 띄워
+cache_backend.RedisBackend를 그대로 사용한다.
+
+사용 예시:
+    python benchmarks/bench_shared_cache.py
+    python benchmarks/bench_shared_cache.py --replicas 1,2,4,8 --requests 20000
+    python benchmarks/bench_shared_cache.py --backend sqlite
+    python benchmarks/bench_shared_cache.py --redis 127.0.0.1:6379
+"""
+
+import argparse
+import os
+import random
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import streamlit as st  # noqa: E402
+
+import cache_backend  # noqa: E402
+import metrics  # noqa: E402
+
+
+# ========================================
+# Redis 프로토콜 대역 서버
+# ========================================
+
+class _StandInHandler(socketserver.StreamRequestHandler):
+    """RESP 명령 처리 (GET, SET [EX], INCR, PING, SELECT, FLUSHDB)"""
+
+    def handle(self):
+        while True:
+            try:
+                args = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if args is None:
+                return
+            self.wfile.write(self.server.execute(args))
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+
+class StandInRedis(socketserver.ThreadingTCPServer):
+    """테스트용 Redis 프로토콜 서버 (메모리 딕셔너리, 만료 시각 지원)"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        super().__init__(address, _StandInHandler)
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def execute(self, args) -> bytes:
+        command = args[0].upper()
+        with self._lock:
+            if command == b"PING":
+                return b"+PONG\r\n"
+            if command in (b"SELECT", b"AUTH"):
+                return b"+OK\r\n"
+            if command == b"FLUSHDB":
+                self._data.clear()
+                return b"+OK\r\n"
+            if command == b"GET":
+                value, expires_at = self._data.get(args[1], (None, None))
+                if value is None or (expires_at and expires_at <= time.time()):
+                    return b"$-1\r\n"
+                return b"$%d\r\n%s\r\n" % (len(value), value)
+            if command == b"SET":
+                expires_at = None
+                if len(args) >= 5 and args[3].upper() == b"EX":
+                    expires_at = time.time() + int(args[4])
+                self._data[args[1]] = (args[2], expires_at)
+                return b"+OK\r\n"
+            if command == b"INCR":
+                value, _ = self._data.get(args[1], (b"0", None))
+                value = int(value) + 1
+                self._data[args[1]] = (str(value).encode(), None)
+                return b":%d\r\n" % value
+        return b"-ERR unknown command\r\n"
+
+
+# ========================================
+# 시뮬레이션
+# ========================================
+
+_queries = 0
+
+
+@cache_backend.shared("bench_portfolio")
+def load_portfolio(user_id: int, data_version: int, cache_generation: int) -> dict:
+    """쿼리 대신 실행 횟수만 세는 조회 함수"""
+    global _queries
+    _queries += 1
+    return {'user_id': user_id, 'data_version': data_version, 'rows': list(range(50))}
+
+
+class Replica:
+    """프로세스 캐시(st.cache_data 대신 LRU)를 가진 레플리카"""
+
+    def __init__(self, local_size: int, use_shared: bool):
+        self.local = OrderedDict()
+        self.local_size = local_size
+        self.use_shared = use_shared
+        self.local_hits = 0
+
+    def get_portfolio(self, user_id: int, data_version: int) -> dict:
+        key = (user_id, data_version)
+        if key in self.local:
+            self.local.move_to_end(key)
+            self.local_hits += 1
+            return self.local[key]
+
+        if self.use_shared:
+            value = load_portfolio(user_id, data_version, cache_backend.generation("bench_portfolio"))
+        else:
+            value = load_portfolio.__wrapped__(user_id, data_version, 0)
+
+        self.local[key] = value
+        if len(self.local) > self.local_size:
+            self.local.popitem(last=False)
+        return value
+
+
+def simulate(replica_count: int, use_shared: bool, args) -> dict:
+    """요청을 레플리카에 나눠 보내고 쿼리 실행 횟수와 오래된 결과 수 집계"""
+    global _queries
+    _queries = 0
+
+    rng = random.Random(args.seed)
+    replicas = [Replica(args.local_size, use_shared) for _ in range(replica_count)]
+    versions = {user_id: 0 for user_id in range(args.users)}
+    stale = 0
+    reads = 0
+
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        user_id = min(int(rng.paretovariate(1.2)) - 1, args.users - 1)
+        if rng.random() < args.write_ratio:
+            versions[user_id] += 1
+            continue
+
+        reads += 1
+        result = rng.choice(replicas).get_portfolio(user_id, versions[user_id])
+        if result['data_version'] != versions[user_id]:
+            stale += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'reads': reads,
+        'queries': _queries,
+        'hit_rate': 1 - _queries / reads if reads else 0,
+        'local_hit_rate': sum(r.local_hits for r in replicas) / reads if reads else 0,
+        'stale': stale,
+        'per_read_us': elapsed / reads * 1e6 if reads else 0,
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("bench_portfolio")
+def load_portfolio_cached(user_id: int, data_version: int, cache_generation: int) -> dict:
+    """앱의 조회 함수와 같은 st.cache_data + 공유 캐시 구성"""
+    return load_portfolio.__wrapped__(user_id, data_version, cache_generation)
+
+
+def check_invalidation() -> bool:
+    """
+    invalidate_all() 후 st.cache_data + 공유 캐시를 거친 조회가 새로 계산되는지 확인
+
+    st.cache_data는 이 프로세스(레플리카)의 캐시이므로, 여기서 새로 계산되면
+    다른 레플리카의 st.cache_data 항목도 세대가 바뀌어 쓰이지 않는다.
+    """
+    def read():
+        return load_portfolio_cached(0, 999, cache_backend.generation("bench_portfolio"))
+
+    read()
+    before = _queries
+    read()
+    cached = _queries == before
+
+    cache_backend.invalidate_all(["bench_portfolio"])
+    read()
+    return cached and _queries == before + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 캐시 레플리카 적중률 비교")
+    parser.add_argument("--backend", choices=("redis", "sqlite"), default="redis",
+                        help="공유 캐시 백엔드 (기본: redis)")
+    parser.add_argument("--redis", default=None,
+                        help="host:port (생략하면 내장 Redis 프로토콜 대역 서버 사용)")
+    parser.add_argument("--replicas", default="1,2,4,8", help="레플리카 수 목록 (기본: 1,2,4,8)")
+    parser.add_argument("--requests", type=int, default=20000, help="요청 수 (기본: 20000)")
+    parser.add_argument("--users", type=int, default=500, help="사용자 수 (기본: 500)")
+    parser.add_argument("--local-size", type=int, default=256,
+                        help="레플리카별 프로세스 캐시 크기 (기본: 256, st.cache_data max_entries)")
+    parser.add_argument("--write-ratio", type=float, default=0.05, help="쓰기 비율 (기본: 0.05)")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드 (기본: 7)")
+    args = parser.parse_args()
+
+    server = None
+    if args.backend == "sqlite":
+        path = os.path.join(tempfile.mkdtemp(), "bench_cache.sqlite3")
+        backend = cache_backend.SQLiteBackend(path)
+        print(f"공유 캐시: SQLite ({path})")
+    elif args.redis:
+        host, port = args.redis.rsplit(":", 1)
+        backend = cache_backend.RedisBackend(host, int(port))
+        print(f"공유 캐시: Redis ({args.redis})")
+    else:
+        server = StandInRedis()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        backend = cache_backend.RedisBackend(host, port)
+        print(f"공유 캐시: Redis 프로토콜 대역 서버 ({host}:{port})")
+
+    cache_backend.configure(cache_backend.SharedCache(backend, ttl=600))
+
+    print(f"요청 {args.requests}개, 사용자 {args.users}명, 쓰기 {args.write_ratio:.0%}, "
+          f"레플리카별 캐시 {args.local_size}개\n")
+    print(f"{'replicas':>8} {'mode':>14} {'queries':>8} {'hit rate':>9} {'local hits':>11} "
+          f"{'stale':>6} {'us/read':>8}")
+
+    failed = False
+    for replica_count in [int(value) for value in args.replicas.split(",")]:
+        for use_shared in (False, True):
+            # 실행마다 공유 캐시를 비움 (세대 증가)
+            cache_backend.invalidate_all(["bench_portfolio"])
+            result = simulate(replica_count, use_shared, args)
+            mode = "local+shared" if use_shared else "local only"
+            print(f"{replica_count:>8} {mode:>14} {result['queries']:>8} {result['hit_rate']:>9.1%} "
+                  f"{result['local_hit_rate']:>11.1%} {result['stale']:>6} {result['per_read_us']:>8.1f}")
+            failed = failed or result['stale'] > 0
+
+    invalidated = check_invalidation()
+    errors = metrics.SHARED_CACHE_ERRORS.value(backend=backend.name)
+    print(f"\n{'✅' if invalidated else '❌'} invalidate_all() 후 st.cache_data + 공유 캐시 조회를 새로 계산")
+    print(f"{'✅' if not failed else '❌'} 오래된 결과 없음, 백엔드 오류 {errors:.0f}회")
+
+    if server is not None:
+        server.shutdown()
+
+    sys.exit(0 if invalidated and not failed and not errors else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Project Tracker - Concurrent Session Load Test
+streamlit AppTest로 여러 학생 세션을 동시에 실행해 한 프로세스(레플리카)의 처리량 측정
+
+세션마다 로그인 → 프로젝트 열기 → 카드 이동 → 체크리스트 체크 → 대시보드 재실행을
+반복하고, 동시 세션 수를 늘려가며 rerun 지연 시간(p50/p95/p99), 처리량,
+쿼리 수(metrics.py 카운터)를 출력한다. 모든 세션이 같은 프로세스에서 실행되므로
+st.cache_data 등 프로세스 단위 캐시도 실제 서버처럼 공유된다.
+
+로컬 MySQL(.streamlit/secrets.toml)에 부하 테스트용 사용자/프로젝트를 만든 뒤 실행한다.
+
+사용 예시:
+    python benchmarks/load_test.py --seed
+    python benchmarks/load_test.py --levels 1,5,10,20 --iterations 5
+    python benchmarks/load_test.py --levels 10 --by-step
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.runtime import Runtime  # noqa: E402
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager  # noqa: E402
+from streamlit.runtime.media_file_manager import MediaFileManager  # noqa: E402
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import db_manager as db  # noqa: E402
+import metrics  # noqa: E402
+
+
+APP_PATH = os.path.join(ROOT, "app.py")
+
+LOADTEST_EMAIL = "loadtest{index}@example.com"
+LOADTEST_PASSWORD = "loadtest1234"
+
+
+# ========================================
+# 데이터 준비
+# ========================================
+
+def seed_database(users: int, tasks_per_project: int, checklist_per_task: int) -> list:
+    """
+    부하 테스트용 사용자와 프로젝트 생성 (이미 있으면 재사용)
+
+    Args:
+        users: 사용자 수 (최대 동시 세션 수 이상)
+        tasks_per_project: 프로젝트당 태스크 수
+        checklist_per_task: 태스크당 체크리스트 항목 수
+
+    Returns:
+        list: (이메일, 프로젝트 ID) 리스트
+    """
+    accounts = []
+
+    for index in range(users):
+        email = LOADTEST_EMAIL.format(index=index)
+        user = db.get_user_by_email(email)
+        user_id = user['id'] if user else db.create_user(email, LOADTEST_PASSWORD, f"부하테스트{index}")
+        if not user_id:
+            break
+
+        projects = db.get_projects(status='active', user_id=user_id)
+        if projects:
+            accounts.append((email, projects[0]['id']))
+            continue
+
+        project_id = db.insert_project(name=f"부하 테스트 {index}", user_id=user_id)
+        statuses = ('todo', 'in_progress', 'done')
+        for task_index in range(tasks_per_project):
+            task_id = db.insert_task(project_id, f"태스크 {task_index}",
+                                     status=statuses[task_index % 3], tags='Dev',
+                                     estimated_hours=2)
+            for item_index in range(checklist_per_task):
+                db.insert_checklist_item(task_id, f"항목 {item_index}")
+
+        accounts.append((email, project_id))
+
+    return accounts
+
+
+def load_accounts(users: int) -> list:
+    """이미 만들어 둔 부하 테스트 계정 조회"""
+    accounts = []
+
+    for index in range(users):
+        email = LOADTEST_EMAIL.format(index=index)
+        user = db.get_user_by_email(email)
+        if not user:
+            break
+        projects = db.get_projects(status='active', user_id=user['id'])
+        if projects:
+            accounts.append((email, projects[0]['id']))
+
+    return accounts
+
+
+# ========================================
+# 세션 시나리오
+# ========================================
+
+def pin_shared_runtime() -> None:
+    """
+    AppTest를 여러 스레드에서 동시에 실행할 수 있도록 Runtime을 고정
+
+    AppTest는 실행마다 전역 Runtime._instance를 가짜 런타임으로 바꿨다가 끝날 때
+    None으로 되돌린다. 실행이 겹치면 먼저 끝난 세션이 다른 세션의 런타임을 지우므로,
+    비어 있을 때는 공유 가짜 런타임을 돌려주도록 한다.
+    """
+    shared = MagicMock(spec=Runtime)
+    shared.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    shared.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: cls._instance or shared)
+
+
+class Recorder:
+    """단계별 rerun 지연 시간 기록 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = []
+        self.errors = 0
+
+    def step(self, name: str, action) -> bool:
+        start = time.perf_counter()
+        try:
+            at = action()
+            failed = bool(at.exception)
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.samples.append((name, elapsed))
+            if failed:
+                self.errors += 1
+        return not failed
+
+
+def _find(elements, key_prefix: str):
+    """키가 key_prefix로 시작하는 첫 위젯"""
+    for element in elements:
+        if element.key and element.key.startswith(key_prefix):
+            return element
+    return None
+
+
+def run_session(email: str, project_id: int, iterations: int, recorder: Recorder,
+                timeout: float) -> None:
+    """
+    학생 한 명의 사용 흐름 실행
+
+    로그인 → 프로젝트 열기 → (카드 이동 → 태스크 열기 → 체크리스트 체크 → 대시보드)
+    를 iterations번 반복한다. 프로젝트 화면은 탭 내용을 모두 렌더링하므로
+    재실행 한 번이 대시보드 열기에 해당한다.
+    """
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    if not recorder.step("open", at.run):
+        return
+
+    # 로그인
+    inputs = {element.label: element for element in at.text_input}
+    inputs["이메일"].input(email)
+    inputs["비밀번호"].input(LOADTEST_PASSWORD)
+    login = next(button for button in at.button if button.label == "로그인")
+    if not recorder.step("login", login.click().run) or not at.session_state.authenticated:
+        return
+
+    # 프로젝트 열기
+    if not recorder.step("open_project", at.button(key=f"project_{project_id}").click().run):
+        return
+
+    for _ in range(iterations):
+        # 카드 이동 (To Do → 진행중, 진행중 → To Do로 되돌려 보드 모양 유지)
+        for prefix in ("status_", "prev_"):
+            button = _find(at.button, prefix)
+            if button is not None:
+                recorder.step("move_card", button.click().run)
+
+        # 태스크 상세 열기 → 체크리스트 체크
+        view = _find(at.button, "view_")
+        if view is not None:
+            recorder.step("open_task", view.click().run)
+            checkbox = _find(at.checkbox, "check_")
+            if checkbox is not None:
+                toggle = checkbox.uncheck if checkbox.value else checkbox.check
+                recorder.step("tick_checklist", toggle().run)
+            at.session_state["view_task_id"] = None
+
+        # 대시보드 (프로젝트 화면 재실행)
+        recorder.step("dashboard", at.run)
+
+
+# ========================================
+# 측정 및 출력
+# ========================================
+
+def percentile(values: list, pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def query_count() -> int:
+    """지금까지 execute_query가 실행된 횟수 (metrics.py)"""
+    return metrics.QUERY_DURATION.count(kind="read") + metrics.QUERY_DURATION.count(kind="write")
+
+
+def run_level(accounts: list, sessions: int, iterations: int, timeout: float) -> dict:
+    """동시 세션 sessions개로 한 번 측정"""
+    recorder = Recorder()
+    queries_before = query_count()
+
+    threads = [
+        threading.Thread(target=run_session,
+                         args=(email, project_id, iterations, recorder, timeout),
+                         name=f"session-{i}")
+        for i, (email, project_id) in enumerate(accounts[:sessions])
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = [seconds for _, seconds in recorder.samples]
+    by_step = defaultdict(list)
+    for name, seconds in recorder.samples:
+        by_step[name].append(seconds)
+
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'elapsed': elapsed,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'queries': query_count() - queries_before,
+        'errors': recorder.errors,
+        'by_step': by_step,
+    }
+
+
+def print_results(results: list, by_step: bool) -> None:
+    print(f"{'세션':>5} {'실행 수':>8} {'처리량(회/초)':>13} {'p50(ms)':>9} {'p95(ms)':>9} "
+          f"{'p99(ms)':>9} {'쿼리 수':>8} {'실행당 쿼리':>10} {'오류':>5}")
+
+    for r in results:
+        throughput = r['reruns'] / r['elapsed'] if r['elapsed'] else 0
+        per_rerun = r['queries'] / r['reruns'] if r['reruns'] else 0
+        print(f"{r['sessions']:>5} {r['reruns']:>8} {throughput:>13.1f} {r['p50'] * 1000:>9.0f} "
+              f"{r['p95'] * 1000:>9.0f} {r['p99'] * 1000:>9.0f} {r['queries']:>8} "
+              f"{per_rerun:>10.1f} {r['errors']:>5}")
+
+    if by_step:
+        for r in results:
+            print(f"\n[동시 세션 {r['sessions']}] 단계별")
+            print(f"{'단계':<16} {'횟수':>6} {'p50(ms)':>9} {'p95(ms)':>9}")
+            for name, values in r['by_step'].items():
+                print(f"{name:<16} {len(values):>6} {percentile(values, 50) * 1000:>9.0f} "
+                      f"{percentile(values, 95) * 1000:>9.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 세션 부하 테스트 (streamlit AppTest)")
+    parser.add_argument("--levels", default="1,5,10,20",
+                        help="동시 세션 수 목록, 쉼표 구분 (기본: 1,5,10,20)")
+    parser.add_argument("--iterations", type=int, default=3,
+                        help="세션당 시나리오 반복 횟수 (기본: 3)")
+    parser.add_argument("--seed", action="store_true",
+                        help="부하 테스트용 사용자/프로젝트를 먼저 생성")
+    parser.add_argument("--tasks", type=int, default=30,
+                        help="--seed 시 프로젝트당 태스크 수 (기본: 30)")
+    parser.add_argument("--checklist", type=int, default=3,
+                        help="--seed 시 태스크당 체크리스트 항목 수 (기본: 3)")
+    parser.add_argument("--timeout", type=float, default=60,
+                        help="rerun 한 번의 제한 시간, 초 (기본: 60)")
+    parser.add_argument("--by-step", action="store_true", help="단계별 지연 시간도 출력")
+    args = parser.parse_args()
+
+    # .streamlit/secrets.toml을 읽을 수 있도록 저장소 루트에서 실행
+    os.chdir(ROOT)
+
+    levels = sorted({int(level) for level in args.levels.split(",") if level.strip()})
+    users = max(levels)
+
+    if args.seed:
+        accounts = seed_database(users, args.tasks, args.checklist)
+    else:
+        accounts = load_accounts(users)
+
+    if len(accounts) < users:
+        print(f"부하 테스트 계정이 부족합니다 ({len(accounts)}/{users}). --seed로 먼저 생성하세요.")
+        sys.exit(1)
+
+    pin_shared_runtime()
+
+    results = [run_level(accounts, sessions, args.iterations, args.timeout) for sessions in levels]
+    print_results(results, args.by_step)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+"""
+Project Tracker - Shared Cache Backend
+여러 앱 프로세스(레플리카)가 함께 쓰는 조회 결과 캐시
+
+st.cache_data는 프로세스마다 따로 있어서, 레플리카를 늘리면 같은 집계를 레플리카마다
+다시 계산한다. db_manager/forecast의 캐시되는 조회 함수에 @shared("이름")를 붙이면
+st.cache_data에 없을 때 공유 캐시를 먼저 보고, 여기에도 없을 때만 쿼리를 실행한다.
+
+    @st.cache_data(show_spinner=False, max_entries=256)
+    @cache_backend.shared("portfolio")
+    def _load_portfolio(user_id, data_version, cache_generation): ...
+
+    _load_portfolio(user_id, data_version, cache_backend.generation("portfolio"))
+
+조회 함수는 마지막 인자로 세대(generation())를 받는다. 세대가 st.cache_data 키에도
+들어가야 무효화 후 각 프로세스의 st.cache_data 항목도 함께 버려진다.
+
+키 구성: project_tracker:{이름}:{함수 코드와 인자 해시}
+- 인자에 data_version이 들어 있으므로 어느 레플리카에서 쓰기가 일어나도
+  다른 레플리카는 다음 조회에서 새 키를 쓴다 (별도 삭제 요청 없음).
+- 세대는 공유 저장소의 카운터로, invalidate()로 올리면 모든 레플리카가 다음 조회부터
+  (st.cache_data와 공유 캐시 모두) 이전 항목을 버린다. 세대도 인자로 해시에 들어가므로
+  공유 캐시 조회마다 세대를 다시 읽지 않는다.
+- 함수 코드가 바뀌면(배포) 해시가 달라져 이전 버전이 저장한 항목을 읽지 않는다.
+
+백엔드:
+- SQLiteBackend: 같은 서버 또는 공유 볼륨의 SQLite 파일
+- RedisBackend: Redis 프로토콜(RESP) 서버 (표준 라이브러리 소켓으로 직접 통신)
+
+값은 pickle로 저장하므로 앱 프로세스만 접근할 수 있는 저장소를 사용해야 한다.
+공유 캐시가 응답하지 않으면 서킷 브레이커가 열려 잠시 건너뛰고 바로 쿼리를 실행한다.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+import metrics
+from circuit_breaker import CircuitBreaker
+from config import (
+    get_cache_config, SHARED_CACHE_TTL_SECONDS, SHARED_CACHE_FAILURE_THRESHOLD,
+    SHARED_CACHE_BASE_DELAY, SHARED_CACHE_MAX_DELAY
+)
+
+
+KEY_PREFIX = "project_tracker"
+
+
+class CacheBackendError(Exception):
+    """공유 캐시 저장소와 통신 실패"""
+
+
+# ========================================
+# 백엔드
+# ========================================
+
+class CacheBackend:
+    """공유 캐시 저장소 공통 인터페이스 (값은 bytes, 세대는 정수 카운터)"""
+
+    name = ""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 만료되었으면 None)"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """값 저장 (ttl초 뒤 만료)"""
+        raise NotImplementedError
+
+    def get_counter(self, key: str) -> int:
+        """카운터 조회 (없으면 0)"""
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """카운터를 1 올리고 새 값 반환"""
+        raise NotImplementedError
+
+
+class SQLiteBackend(CacheBackend):
+    """SQLite 파일 공유 캐시 (스레드마다 연결, WAL 모드)"""
+
+    name = "sqlite"
+
+    # 이 횟수만큼 저장할 때마다 만료된 항목 삭제
+    PURGE_EVERY = 500
+
+    def __init__(self, path: str, timeout: float = 1.0):
+        """
+        Args:
+            path: SQLite 파일 경로 (디렉터리가 없으면 생성)
+            timeout: 잠금 대기 시간 (초)
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        except OSError as e:
+            raise CacheBackendError(str(e)) from e
+
+        with self._execute() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_counters (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _execute(self):
+        """스레드의 연결 사용 (autocommit, sqlite3 오류는 CacheBackendError로)"""
+        try:
+            yield self._connection()
+        except sqlite3.Error as e:
+            raise CacheBackendError(str(e)) from e
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._execute() as connection:
+            row = connection.execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        now = time.time()
+        with self._execute() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl)
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+    def get_counter(self, key: str) -> int:
+        with self._execute() as connection:
+            row = connection.execute("SELECT value FROM cache_counters WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str) -> int:
+        with self._execute() as connection:
+            row = connection.execute("""
+                INSERT INTO cache_counters (key, value) VALUES (?, 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1
+                RETURNING value
+            """, (key,)).fetchone()
+        return row[0]
+
+
+class RedisBackend(CacheBackend):
+    """Redis 프로토콜(RESP2) 공유 캐시 (스레드마다 소켓 연결, GET/SET EX/INCR만 사용)"""
+
+    name = "redis"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0,
+                 password: str = None, timeout: float = 1.0):
+        """
+        Args:
+            host: 서버 주소
+            port: 서버 포트
+            db: 데이터베이스 번호 (SELECT)
+            password: 비밀번호 (AUTH, 없으면 생략)
+            timeout: 연결/응답 제한 시간 (초)
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    # ---- 연결 ----
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._local.sock = sock
+        self._local.reader = sock.makefile('rb')
+        if self.password:
+            self._send('AUTH', self.password)
+        if self.db:
+            self._send('SELECT', self.db)
+
+    def _disconnect(self) -> None:
+        sock = getattr(self._local, 'sock', None)
+        self._local.sock = None
+        if sock is not None:
+            try:
+                self._local.reader.close()
+                sock.close()
+            except OSError:
+                pass
+
+    def command(self, *args) -> Any:
+        """
+        명령 실행 (연결이 없으면 연결)
+
+        Returns:
+            응답 (bytes, int, list, None)
+
+        Raises:
+            CacheBackendError: 연결/통신 실패 또는 오류 응답
+        """
+        try:
+            if getattr(self._local, 'sock', None) is None:
+                self._connect()
+            return self._send(*args)
+        except (OSError, CacheBackendError) as e:
+            # 응답을 끝까지 읽지 못했을 수 있으므로 연결을 버림
+            self._disconnect()
+            if isinstance(e, CacheBackendError):
+                raise
+            raise CacheBackendError(str(e)) from e
+
+    # ---- RESP ----
+
+    def _send(self, *args) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._local.sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        reader = self._local.reader
+        line = reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise CacheBackendError("연결이 끊어졌습니다")
+
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            raise CacheBackendError(payload.decode('utf-8', 'replace'))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise CacheBackendError("연결이 끊어졌습니다")
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise CacheBackendError(f"알 수 없는 응답: {line[:20]!r}")
+
+    # ---- CacheBackend ----
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.command('GET', key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.command('SET', key, value, 'EX', ttl)
+
+    def get_counter(self, key: str) -> int:
+        value = self.command('GET', key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+        return self.command('INCR', key)
+
+
+# ========================================
+# 공유 캐시
+# ========================================
+
+class _Unavailable(Exception):
+    """공유 캐시를 사용할 수 없음 (서킷 브레이커 열림 또는 통신 실패)"""
+
+
+class SharedCache:
+    """세대 카운터로 버전이 붙은 키를 쓰는 공유 캐시"""
+
+    def __init__(self, backend: CacheBackend, ttl: int = SHARED_CACHE_TTL_SECONDS):
+        """
+        Args:
+            backend: 저장소
+            ttl: 항목 보관 시간 (초)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.breaker = CircuitBreaker(SHARED_CACHE_FAILURE_THRESHOLD, SHARED_CACHE_BASE_DELAY,
+                                      SHARED_CACHE_MAX_DELAY)
+        # 이름별 마지막으로 읽은 세대 (저장소를 사용할 수 없을 때 대신 사용)
+        self._generations: Dict[str, int] = {}
+
+    def _call(self, method: Callable, *args) -> Any:
+        """서킷 브레이커를 거쳐 저장소 호출"""
+        if not self.breaker.allow_request():
+            raise _Unavailable()
+
+        try:
+            result = method(*args)
+        except CacheBackendError:
+            metrics.SHARED_CACHE_ERRORS.inc(backend=self.backend.name)
+            self.breaker.record_failure()
+            raise _Unavailable()
+
+        self.breaker.record_success()
+        return result
+
+    def generation(self, namespace: str) -> int:
+        """
+        이름의 현재 세대 (저장소를 사용할 수 없으면 마지막으로 읽은 세대)
+
+        Args:
+            namespace: 캐시 이름
+        """
+        try:
+            value = self._call(self.backend.get_counter, f"{KEY_PREFIX}:generation:{namespace}")
+        except _Unavailable:
+            return self._generations.get(namespace, 0)
+        self._generations[namespace] = value
+        return value
+
+    def get_or_compute(self, namespace: str, digest: str, compute: Callable[[], Any]) -> Any:
+        """
+        공유 캐시에 있으면 반환, 없으면 계산해서 저장
+
+        compute()에서 발생한 예외는 그대로 전달하고 저장하지 않는다.
+        공유 캐시를 사용할 수 없으면 compute() 결과를 저장하지 않고 반환한다.
+
+        Args:
+            namespace: 캐시 이름
+            digest: 함수 코드와 인자(cache_generation 포함) 해시
+            compute: 결과를 계산하는 함수
+        """
+        key = f"{KEY_PREFIX}:{namespace}:{digest}"
+        try:
+            data = self._call(self.backend.get, key)
+        except _Unavailable:
+            return compute()
+
+        if data is not None:
+            try:
+                value = pickle.loads(data)
+                metrics.CACHE_REQUESTS.inc(cache=f"shared_{namespace}", result="hit")
+                return value
+            except Exception:
+                # 손상되었거나 읽을 수 없는 항목은 새로 계산해 덮어씀
+                pass
+
+        metrics.CACHE_REQUESTS.inc(cache=f"shared_{namespace}", result="miss")
+        value = compute()
+
+        try:
+            self._call(self.backend.set, key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.ttl)
+        except _Unavailable:
+            pass
+
+        return value
+
+    def invalidate(self, namespace: str) -> int:
+        """
+        이름의 세대를 올려 모든 레플리카가 저장된 항목을 버리게 함
+
+        Returns:
+            int: 새 세대
+
+        Raises:
+            CacheBackendError: 저장소 통신 실패
+        """
+        return self.backend.incr(f"{KEY_PREFIX}:generation:{namespace}")
+
+
+# ========================================
+# 설정 / 데코레이터
+# ========================================
+
+# shared()를 붙인 캐시 이름 (invalidate_all()용)
+NAMESPACES: list = []
+
+_shared_cache: Optional[SharedCache] = None
+_configured = False
+_config_lock = threading.Lock()
+
+
+def create_backend(cache_config: Dict) -> CacheBackend:
+    """
+    설정으로 백엔드 생성
+
+    Args:
+        cache_config: config.get_cache_config() 결과
+    """
+    if cache_config['backend'] == "redis":
+        return RedisBackend(cache_config['host'], cache_config['port'],
+                            cache_config.get('db', 0), cache_config.get('password'))
+    if cache_config['backend'] == "sqlite":
+        return SQLiteBackend(cache_config['path'])
+    raise ValueError(f"알 수 없는 공유 캐시 백엔드: {cache_config['backend']}")
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    프로세스 공용 공유 캐시 (처음 호출할 때 secrets.toml의 [cache]로 생성)
+
+    Returns:
+        SharedCache 또는 None (설정 없음, 생성 실패)
+    """
+    global _shared_cache, _configured
+
+    if _configured:
+        return _shared_cache
+
+    with _config_lock:
+        if not _configured:
+            cache_config = get_cache_config()
+            if cache_config:
+                try:
+                    _shared_cache = SharedCache(create_backend(cache_config), cache_config['ttl'])
+                except CacheBackendError:
+                    _shared_cache = None
+            _configured = True
+
+    return _shared_cache
+
+
+def configure(shared_cache: Optional[SharedCache]) -> None:
+    """공유 캐시 직접 지정 (None이면 사용 안 함, 벤치마크/관리 작업용)"""
+    global _shared_cache, _configured
+    with _config_lock:
+        _shared_cache = shared_cache
+        _configured = True
+
+
+def _code_digest(func: Callable) -> str:
+    """함수 소스 해시 (배포로 코드가 바뀌면 이전 항목을 쓰지 않도록 키에 포함)"""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__qualname__
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]
+
+
+def shared(namespace: str):
+    """
+    조회 함수 결과를 공유 캐시에 저장하는 데코레이터 (st.cache_data 안쪽에 붙임)
+
+    인자는 repr()이 값을 그대로 나타내는 타입(int, str, date, datetime 등)이어야 하고,
+    무효화가 적용되도록 마지막 인자로 generation(namespace)를 받아야 한다.
+
+    Args:
+        namespace: 캐시 이름 (키 접두사, 메트릭 레이블 shared_{이름})
+    """
+    NAMESPACES.append(namespace)
+
+    def decorator(func: Callable) -> Callable:
+        code = _code_digest(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_shared_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            digest = hashlib.sha256(
+                f"{code}:{args!r}:{sorted(kwargs.items())!r}".encode('utf-8')
+            ).hexdigest()
+            return cache.get_or_compute(namespace, digest, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def generation(namespace: str) -> int:
+    """
+    캐시 이름의 현재 세대 (캐시되는 조회 함수의 cache_generation 인자로 전달)
+
+    Args:
+        namespace: 캐시 이름
+
+    Returns:
+        int: 세대 (공유 캐시가 설정되지 않았으면 0)
+    """
+    cache = get_shared_cache()
+    return cache.generation(namespace) if cache is not None else 0
+
+
+def invalidate_all(namespaces: list = None) -> Dict[str, int]:
+    """
+    공유 캐시 항목 무효화 (세대 증가)
+
+    조회 함수가 cache_generation 인자로 세대를 받으므로 모든 레플리카의
+    st.cache_data와 공유 캐시 항목이 다음 조회부터 함께 무효화된다.
+
+    Args:
+        namespaces: 캐시 이름 리스트 (None이면 전체)
+
+    Returns:
+        dict: {캐시 이름: 새 세대} (공유 캐시가 설정되지 않았으면 빈 딕셔너리)
+
+    Raises:
+        CacheBackendError: 저장소 통신 실패
+    """
+    cache = get_shared_cache()
+    if cache is None:
+        return {}
+    return {namespace: cache.invalidate(namespace) for namespace in (namespaces or NAMESPACES)}
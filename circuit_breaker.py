@@ -0,0 +1,107 @@
+"""
+Project Tracker - Circuit Breaker
+연속으로 실패하는 대상(데이터베이스 등)에 대한 호출을 잠시 차단
+
+상태:
+    closed    - 정상. 연속 실패가 failure_threshold번이 되면 open으로 전환
+    open      - 차단. 대기 시간이 지날 때까지 시도하지 않고 바로 실패
+    half_open - 대기 시간이 지나 한 번만 시험 호출을 허용.
+                성공하면 closed, 실패하면 대기 시간을 두 배로 늘려 다시 open
+"""
+
+import threading
+import time
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """프로세스 전체에서 공유하는 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(self, failure_threshold: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 60.0):
+        """
+        Args:
+            failure_threshold: open으로 전환할 연속 실패 횟수
+            base_delay: 처음 open될 때의 대기 시간 (초)
+            max_delay: 대기 시간 상한 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._delay = base_delay
+        self._open_until = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed/open/half_open)"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() >= self._open_until:
+                return HALF_OPEN
+            return self._state
+
+    def retry_in(self) -> float:
+        """다음 시험 호출까지 남은 시간 (초, closed면 0)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._open_until - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        호출을 시도해도 되는지 확인
+
+        open 상태에서 대기 시간이 지났으면 half_open으로 바꾸고
+        한 스레드에만 시험 호출을 허용한다.
+
+        Returns:
+            bool: 시도해도 되면 True
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+
+            if self._state == OPEN:
+                if time.monotonic() < self._open_until:
+                    return False
+                self._state = HALF_OPEN
+                self._probing = False
+
+            # half_open: 시험 호출은 하나만
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (closed로 복구)"""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._delay = self.base_delay
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (기준을 넘으면 open, 시험 호출 실패 시 대기 시간 증가)"""
+        with self._lock:
+            self._failures += 1
+
+            if self._state == HALF_OPEN:
+                self._delay = min(self._delay * 2, self.max_delay)
+                self._open(self._delay)
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._delay = self.base_delay
+                self._open(self._delay)
+
+    def _open(self, delay: float) -> None:
+        self._state = OPEN
+        self._open_until = time.monotonic() + delay
+        self._probing = False
@@ -8,15 +8,22 @@ import db_manager as db
 import utils
 from config import PROJECT_STATUS
 from components.project_forms import show_edit_project_dialog
-from views import render_dashboard_tab, render_kanban_tab, render_retrospective_tab
+from views import (
+    render_dashboard_tab,
+    render_kanban_tab,
+    render_board_history_tab,
+    render_retrospective_tab,
+    render_portfolio_page,
+    render_archived_project
+)
 
 
 def render_main_content():
     """메인 컨텐츠 렌더링"""
 
-    # 프로젝트가 선택되지 않은 경우
+    # 프로젝트가 선택되지 않은 경우 - 전체 프로젝트 요약
     if not st.session_state.current_project_id:
-        st.info("👈 왼쪽 사이드바에서 프로젝트를 선택하거나 새로 만들어주세요.")
+        render_portfolio_page()
         return
 
     # 현재 프로젝트 정보
@@ -27,6 +34,11 @@ def render_main_content():
         st.session_state.current_project_id = None
         return
 
+    # 보관된 프로젝트 - 읽기 전용 화면
+    if project.get('archived_at'):
+        render_archived_project(project)
+        return
+
     # 프로젝트 헤더 렌더링
     _render_project_header(project)
 
@@ -40,7 +52,7 @@ def render_main_content():
     st.markdown("---")
 
     # 탭 구성
-    tab1, tab2, tab3 = st.tabs(["📊 대시보드", "📋 Kanban 보드", "📝 회고"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 대시보드", "📋 Kanban 보드", "🕰️ 지난 보드", "📝 회고"])
 
     with tab1:
         render_dashboard_tab(project)
@@ -49,6 +61,9 @@ def render_main_content():
         render_kanban_tab(project)
 
     with tab3:
+        render_board_history_tab(project)
+
+    with tab4:
         render_retrospective_tab(project)
 
     # 프로젝트 수정 다이얼로그
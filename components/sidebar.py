@@ -27,6 +27,21 @@ def render_sidebar():
         # 새 프로젝트 버튼
         if st.button("➕ 새 프로젝트", use_container_width=True):
             st.session_state.show_create_project = True
+            st.session_state.show_my_retrospectives = False
+
+        # 전체 프로젝트 보기 버튼
+        if st.button("🗂️ 전체 프로젝트", use_container_width=True):
+            st.session_state.current_project_id = None
+            st.session_state.show_create_project = False
+            st.session_state.show_my_retrospectives = False
+            st.rerun()
+
+        # 내 회고 모아보기 버튼
+        if st.button("📚 내 회고 모아보기", use_container_width=True):
+            st.session_state.show_my_retrospectives = True
+            st.session_state.show_create_project = False
+            st.session_state.my_retro_cursors = [None]
+            st.rerun()
 
         st.markdown("---")
 
@@ -41,9 +56,8 @@ def render_sidebar():
             st.info("프로젝트가 없습니다.\n새 프로젝트를 만들어보세요!")
         else:
             for project in projects:
-                # 진행률 계산
-                tasks = db.get_tasks(project['id'])
-                metrics = utils.calculate_project_metrics(tasks)
+                # 진행률 계산 (projects 테이블의 태스크 카운터 사용)
+                progress_rate = utils.calculate_progress_rate(project['task_total'], project['task_done'])
 
                 # 프로젝트 버튼
                 if st.button(
@@ -53,12 +67,13 @@ def render_sidebar():
                     type="primary" if st.session_state.current_project_id == project['id'] else "secondary"
                 ):
                     st.session_state.current_project_id = project['id']
+                    st.session_state.show_my_retrospectives = False
                     st.rerun()
 
                 # 진행률 및 마지막 업데이트
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.caption(f"📊 {metrics['progress_rate']:.0f}% 완료")
+                    st.caption(f"📊 {progress_rate:.0f}% 완료")
                 with col2:
                     if project.get('updated_at'):
                         relative_time = utils.get_relative_time(project['updated_at'])
@@ -66,9 +81,45 @@ def render_sidebar():
 
         st.markdown("---")
 
-        # 완료된 프로젝트 표시
+        # 내 마감일 (전체 프로젝트)
+        if user_id is not None:
+            _render_deadlines(user_id)
+
+        # 완료된 프로젝트 표시 (보관된 프로젝트 포함)
         completed_projects = db.get_projects(status='completed', user_id=user_id)
-        if completed_projects:
+        archived_projects = db.get_archived_projects(user_id=user_id)
+        if completed_projects or archived_projects:
             with st.expander("✅ 완료된 프로젝트"):
                 for project in completed_projects:
                     st.write(f"- {project['name']}")
+                for project in archived_projects:
+                    if st.button(f"🗄️ {project['name']}", key=f"archived_project_{project['id']}",
+                                 use_container_width=True):
+                        st.session_state.current_project_id = project['id']
+                        st.session_state.show_create_project = False
+                        st.session_state.show_my_retrospectives = False
+                        st.rerun()
+
+
+def _render_deadlines(user_id, days=7, limit=10):
+    """전체 프로젝트의 지난/오늘/다가오는 마감 위젯"""
+
+    deadlines = db.get_upcoming_deadlines(user_id, days)
+    overdue, today, upcoming = deadlines['overdue'], deadlines['today'], deadlines['upcoming']
+
+    if not (overdue or today or upcoming):
+        return
+
+    label = f"⏰ 내 마감일 (🔴 {len(overdue)} · 🔥 {len(today)} · 🟡 {len(upcoming)})"
+    with st.expander(label, expanded=bool(overdue or today)):
+        lines = []
+        for item in (overdue + today + upcoming)[:limit]:
+            icon = "📅" if item['kind'] == 'milestone' else "📝"
+            badge = utils.get_due_date_badge(item['due_date'])
+            lines.append(f"- {icon} **{item['title']}** · {item['project_name']} · {badge}")
+
+        remaining = len(overdue) + len(today) + len(upcoming) - limit
+        if remaining > 0:
+            lines.append(f"- … 외 {remaining}개")
+
+        st.markdown("\n".join(lines))
@@ -6,6 +6,10 @@ Streamlit secrets에서 데이터베이스 설정 읽기
 import streamlit as st
 
 
+# 데이터베이스 연결 제한 시간 (초) - secrets.toml의 connection_timeout으로 변경 가능
+DB_CONNECT_TIMEOUT = 5
+
+
 def get_db_config():
     """
     Streamlit secrets에서 MySQL 연결 정보 가져오기
@@ -17,7 +21,8 @@ def get_db_config():
             'port': int,
             'user': str,
             'password': str,
-            'database': str
+            'database': str,
+            'connection_timeout': int
         }
     """
     try:
@@ -26,7 +31,8 @@ def get_db_config():
             'port': st.secrets["mysql"]["port"],
             'user': st.secrets["mysql"]["user"],
             'password': st.secrets["mysql"]["password"],
-            'database': st.secrets["mysql"]["database"]
+            'database': st.secrets["mysql"]["database"],
+            'connection_timeout': st.secrets["mysql"].get("connection_timeout", DB_CONNECT_TIMEOUT)
         }
         return db_config
     except Exception as e:
@@ -35,6 +41,91 @@ def get_db_config():
         return None
 
 
+def get_replica_configs():
+    """
+    Streamlit secrets에서 읽기 전용 레플리카 연결 정보 가져오기 (선택 사항)
+
+    [[mysql.replicas]] 항목마다 host/port를 적고, 적지 않은 값(user, password,
+    database 등)은 [mysql] 기본(primary) 설정을 그대로 사용한다.
+
+    Returns:
+        list: 레플리카별 MySQL 연결 설정 (get_db_config()와 같은 형태, 없으면 빈 리스트)
+    """
+    primary = get_db_config()
+    if not primary:
+        return []
+
+    try:
+        replicas = st.secrets["mysql"].get("replicas", [])
+    except Exception:
+        return []
+
+    replica_configs = []
+    for replica in replicas:
+        db_config = dict(primary)
+        db_config.update({key: replica[key] for key in primary if key in replica})
+        replica_configs.append(db_config)
+
+    return replica_configs
+
+
+def get_metrics_config():
+    """
+    Streamlit secrets에서 메트릭 서버 설정 가져오기 ([metrics] 섹션, 선택 사항)
+
+    Returns:
+        dict: {'host': str, 'port': int} 또는 None (섹션이 없거나 enabled = false)
+    """
+    try:
+        metrics_config = st.secrets.get("metrics")
+    except Exception:
+        # secrets.toml 자체가 없으면 메트릭 비활성화
+        return None
+
+    if not metrics_config or not metrics_config.get("enabled", True):
+        return None
+
+    return {
+        'host': metrics_config.get("host", "127.0.0.1"),
+        'port': int(metrics_config.get("port", 9108))
+    }
+
+
+def get_cache_config():
+    """
+    Streamlit secrets에서 공유 캐시 설정 가져오기 ([cache] 섹션, 선택 사항)
+
+    backend = "sqlite"면 path의 SQLite 파일(같은 서버/공유 볼륨의 프로세스끼리 공유),
+    backend = "redis"면 host/port의 Redis(또는 Redis 프로토콜 호환 서버)를 사용한다.
+
+    Returns:
+        dict: {'backend', 'ttl', 'path' | 'host', 'port', 'db', 'password'} 또는 None (섹션이 없거나 enabled = false)
+    """
+    try:
+        cache_config = st.secrets.get("cache")
+    except Exception:
+        # secrets.toml 자체가 없으면 공유 캐시 비활성화
+        return None
+
+    if not cache_config or not cache_config.get("enabled", True):
+        return None
+
+    backend = cache_config.get("backend", "sqlite")
+    result = {'backend': backend, 'ttl': int(cache_config.get("ttl", SHARED_CACHE_TTL_SECONDS))}
+
+    if backend == "redis":
+        result.update({
+            'host': cache_config.get("host", "127.0.0.1"),
+            'port': int(cache_config.get("port", 6379)),
+            'db': int(cache_config.get("db", 0)),
+            'password': cache_config.get("password")
+        })
+    else:
+        result['path'] = cache_config.get("path", SHARED_CACHE_SQLITE_PATH)
+
+    return result
+
+
 # 앱 설정
 APP_TITLE = "📋 Project Tracker"
 APP_ICON = "📋"
@@ -45,6 +136,74 @@ PAGE_CONFIG = {
     "initial_sidebar_state": "expanded"
 }
 
+# 자동 새로고침 간격 (초) - 공유 보드의 변경 여부 확인 주기
+LIVE_REFRESH_SECONDS = 5
+
+# 대시보드 차트 캐시 크기 (차트 종류별 최대 보관 개수)
+CHART_CACHE_SIZE = 64
+
+# 세션이 함께 쓰는 Kanban 보드 보관 개수 (최근 연 프로젝트 수)
+KANBAN_BOARD_CACHE_SIZE = 64
+
+# 공용 Kanban 보드를 이 시간(초) 넘게 갱신하지 않았으면 변경 피드 대신 전체를 다시 읽음
+# (정리된 삭제 기록을 놓치지 않도록 maintenance.py prune-tombstones 기간보다 짧게)
+KANBAN_BOARD_MAX_IDLE_SECONDS = 24 * 3600
+
+# 보관(아카이브) 기준 - 완료 후 이 일수가 지나면 보관 테이블로 이동
+ARCHIVE_PROJECT_AFTER_DAYS = 180
+ARCHIVE_TASK_AFTER_DAYS = 90
+
+# 보관 작업의 배치 크기 (한 트랜잭션에서 옮길 행 수)
+ARCHIVE_BATCH_SIZE = 100
+
+# 데이터베이스 서킷 브레이커 - 연속 연결 실패 횟수, 재시도 대기 시간 (초, 실패할 때마다 두 배)
+DB_CIRCUIT_FAILURE_THRESHOLD = 3
+DB_CIRCUIT_BASE_DELAY = 2
+DB_CIRCUIT_MAX_DELAY = 60
+
+# 장애 시 대신 보여줄 최근 조회 결과 보관 개수, 결과당 최대 행 수, 전체 크기 상한 (바이트, 추정치)
+STALE_READ_CACHE_SIZE = 512
+STALE_READ_MAX_ROWS = 200
+STALE_READ_MAX_BYTES = 8 * 1024 * 1024
+
+# 레플리카 읽기 - 쓰기 후 이 시간(초) 동안은 해당 세션의 읽기를 primary로 보냄 (내 변경 바로 보기)
+READ_YOUR_WRITES_SECONDS = 10
+
+# 레플리카 복제 지연 허용치 (초) - 넘으면 primary에서 읽음
+MAX_REPLICA_LAG_SECONDS = 5
+
+# 레플리카 복제 지연 확인 주기 (초)
+REPLICA_LAG_CHECK_SECONDS = 10
+
+# 연결 풀 크기 (엔드포인트별) - 모두 사용 중이면 풀 밖에서 새로 연결
+DB_POOL_SIZE = 5
+
+# 대시보드 사이클 타임/리드 타임 주간 추이 기간 (주)
+FLOW_TREND_WEEKS = 12
+
+# 마지막 스냅샷 이후 이벤트가 이 개수 이상 쌓인 프로젝트의 보드 스냅샷 저장 (maintenance.py snapshot-boards)
+BOARD_SNAPSHOT_EVENTS = 500
+
+# 이 시간(초)보다 오래된 이벤트만 스냅샷/지난 보드 캐시에 반영 (늦게 커밋된 트랜잭션의 이벤트 누락 방지)
+BOARD_EVENT_SETTLE_SECONDS = 10
+
+# 완료 예측 (몬테카를로) - 시뮬레이션 횟수, 처리량 표본 기간 (일), 최대 예측 기간 (일)
+FORECAST_TRIALS = 5000
+FORECAST_HISTORY_DAYS = 42
+FORECAST_MAX_DAYS = 365
+
+# 공유 캐시 ([cache] 설정 시) - 항목 보관 시간 (초), SQLite 기본 파일 경로
+SHARED_CACHE_TTL_SECONDS = 3600
+SHARED_CACHE_SQLITE_PATH = ".cache/project_tracker_cache.sqlite3"
+
+# 공유 캐시 서킷 브레이커 - 연속 실패 횟수, 재시도 대기 시간 (초)
+SHARED_CACHE_FAILURE_THRESHOLD = 3
+SHARED_CACHE_BASE_DELAY = 5
+SHARED_CACHE_MAX_DELAY = 60
+
+# 앱 시작 시 포트폴리오를 미리 캐시할 최근 로그인 사용자 수 (0이면 사용 안 함)
+STARTUP_PRELOAD_USERS = 20
+
 # 태그 아이콘 매핑
 TAG_ICONS = {
     'Dev': '💻',
@@ -0,0 +1,67 @@
+-- ========================================
+-- Migration: Add Archive Tables
+-- ========================================
+-- 오래된 완료 프로젝트와 완료 태스크를 옮겨 둘 보관(archive) 테이블
+-- 보관 테이블은 외래 키/트리거 없이 원본과 같은 컬럼 + archived_at을 가짐
+-- (migration_add_task_change_feed.sql 이후에 실행)
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- 보관 테이블 생성
+-- ========================================
+CREATE TABLE IF NOT EXISTS projects_archive LIKE projects;
+ALTER TABLE projects_archive
+ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관일시';
+
+CREATE TABLE IF NOT EXISTS tasks_archive LIKE tasks;
+ALTER TABLE tasks_archive
+ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관일시';
+
+CREATE TABLE IF NOT EXISTS checklist_items_archive LIKE checklist_items;
+ALTER TABLE checklist_items_archive
+ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관일시';
+
+CREATE TABLE IF NOT EXISTS milestones_archive LIKE milestones;
+ALTER TABLE milestones_archive
+ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관일시';
+
+CREATE TABLE IF NOT EXISTS retrospectives_archive LIKE retrospectives;
+ALTER TABLE retrospectives_archive
+ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관일시';
+
+-- ========================================
+-- 태스크 삭제 트리거 재생성
+-- ========================================
+-- 보관 작업(@archiving = 1)으로 옮겨진 완료 태스크는 프로젝트 카운터에 계속 포함되도록
+-- 카운터를 줄이지 않고 데이터 버전만 올림
+-- ========================================
+DROP TRIGGER IF EXISTS trg_tasks_counters_delete;
+
+DELIMITER $$
+
+CREATE TRIGGER trg_tasks_counters_delete
+AFTER DELETE ON tasks
+FOR EACH ROW
+BEGIN
+    IF @archiving IS NULL THEN
+        UPDATE projects SET
+            task_total = task_total - 1,
+            task_todo = task_todo - (OLD.status = 'todo'),
+            task_in_progress = task_in_progress - (OLD.status = 'in_progress'),
+            task_done = task_done - (OLD.status = 'done'),
+            estimated_hours_total = estimated_hours_total - COALESCE(OLD.estimated_hours, 0),
+            data_version = data_version + 1
+        WHERE id = OLD.project_id;
+    ELSE
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id = OLD.project_id;
+    END IF;
+END$$
+
+DELIMITER ;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
@@ -0,0 +1,162 @@
+-- ========================================
+-- Migration: Add Project Data Version
+-- ========================================
+-- 프로젝트 및 하위 데이터(태스크, 체크리스트, 마일스톤)가 바뀔 때마다
+-- projects.data_version을 1씩 증가시켜 캐시 무효화 기준으로 사용
+-- (migration_add_task_counters.sql 이후에 실행)
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- projects 테이블에 data_version 추가
+-- ========================================
+ALTER TABLE projects
+ADD COLUMN data_version BIGINT NOT NULL DEFAULT 0 COMMENT '데이터 버전 (변경 시 증가)' AFTER estimated_hours_total;
+
+-- ========================================
+-- 트리거 재생성
+-- ========================================
+DROP TRIGGER IF EXISTS trg_projects_version_update;
+DROP TRIGGER IF EXISTS trg_tasks_counters_insert;
+DROP TRIGGER IF EXISTS trg_tasks_counters_update;
+DROP TRIGGER IF EXISTS trg_tasks_counters_delete;
+DROP TRIGGER IF EXISTS trg_checklist_version_insert;
+DROP TRIGGER IF EXISTS trg_checklist_version_update;
+DROP TRIGGER IF EXISTS trg_checklist_version_delete;
+DROP TRIGGER IF EXISTS trg_milestones_version_insert;
+DROP TRIGGER IF EXISTS trg_milestones_version_update;
+DROP TRIGGER IF EXISTS trg_milestones_version_delete;
+
+DELIMITER $$
+
+-- 프로젝트 자체 수정 (이름, 상태 등)
+CREATE TRIGGER trg_projects_version_update
+BEFORE UPDATE ON projects
+FOR EACH ROW
+BEGIN
+    IF NEW.data_version = OLD.data_version THEN
+        SET NEW.data_version = OLD.data_version + 1;
+    END IF;
+END$$
+
+-- 태스크 (카운터 + 버전)
+CREATE TRIGGER trg_tasks_counters_insert
+AFTER INSERT ON tasks
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET
+        task_total = task_total + 1,
+        task_todo = task_todo + (NEW.status = 'todo'),
+        task_in_progress = task_in_progress + (NEW.status = 'in_progress'),
+        task_done = task_done + (NEW.status = 'done'),
+        estimated_hours_total = estimated_hours_total + COALESCE(NEW.estimated_hours, 0),
+        data_version = data_version + 1
+    WHERE id = NEW.project_id;
+END$$
+
+CREATE TRIGGER trg_tasks_counters_update
+AFTER UPDATE ON tasks
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.project_id <=> NEW.project_id)
+       OR NOT (OLD.status <=> NEW.status)
+       OR NOT (OLD.estimated_hours <=> NEW.estimated_hours) THEN
+        UPDATE projects SET
+            task_total = task_total - 1,
+            task_todo = task_todo - (OLD.status = 'todo'),
+            task_in_progress = task_in_progress - (OLD.status = 'in_progress'),
+            task_done = task_done - (OLD.status = 'done'),
+            estimated_hours_total = estimated_hours_total - COALESCE(OLD.estimated_hours, 0),
+            data_version = data_version + 1
+        WHERE id = OLD.project_id;
+
+        UPDATE projects SET
+            task_total = task_total + 1,
+            task_todo = task_todo + (NEW.status = 'todo'),
+            task_in_progress = task_in_progress + (NEW.status = 'in_progress'),
+            task_done = task_done + (NEW.status = 'done'),
+            estimated_hours_total = estimated_hours_total + COALESCE(NEW.estimated_hours, 0),
+            data_version = data_version + 1
+        WHERE id = NEW.project_id;
+    ELSE
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id = NEW.project_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_tasks_counters_delete
+AFTER DELETE ON tasks
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET
+        task_total = task_total - 1,
+        task_todo = task_todo - (OLD.status = 'todo'),
+        task_in_progress = task_in_progress - (OLD.status = 'in_progress'),
+        task_done = task_done - (OLD.status = 'done'),
+        estimated_hours_total = estimated_hours_total - COALESCE(OLD.estimated_hours, 0),
+        data_version = data_version + 1
+    WHERE id = OLD.project_id;
+END$$
+
+-- 체크리스트 (태스크를 거쳐 프로젝트 버전 증가)
+CREATE TRIGGER trg_checklist_version_insert
+AFTER INSERT ON checklist_items
+FOR EACH ROW
+BEGIN
+    UPDATE projects p
+    JOIN tasks t ON t.project_id = p.id
+    SET p.data_version = p.data_version + 1
+    WHERE t.id = NEW.task_id;
+END$$
+
+CREATE TRIGGER trg_checklist_version_update
+AFTER UPDATE ON checklist_items
+FOR EACH ROW
+BEGIN
+    UPDATE projects p
+    JOIN tasks t ON t.project_id = p.id
+    SET p.data_version = p.data_version + 1
+    WHERE t.id = NEW.task_id;
+END$$
+
+CREATE TRIGGER trg_checklist_version_delete
+AFTER DELETE ON checklist_items
+FOR EACH ROW
+BEGIN
+    UPDATE projects p
+    JOIN tasks t ON t.project_id = p.id
+    SET p.data_version = p.data_version + 1
+    WHERE t.id = OLD.task_id;
+END$$
+
+-- 마일스톤
+CREATE TRIGGER trg_milestones_version_insert
+AFTER INSERT ON milestones
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET data_version = data_version + 1
+    WHERE id = NEW.project_id;
+END$$
+
+CREATE TRIGGER trg_milestones_version_update
+AFTER UPDATE ON milestones
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET data_version = data_version + 1
+    WHERE id = NEW.project_id;
+END$$
+
+CREATE TRIGGER trg_milestones_version_delete
+AFTER DELETE ON milestones
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET data_version = data_version + 1
+    WHERE id = OLD.project_id;
+END$$
+
+DELIMITER ;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
@@ -0,0 +1,15 @@
+-- ========================================
+-- Migration: Add Deadline Indexes
+-- ========================================
+-- 사용자의 전체 프로젝트에서 다가오는/지난 마감일을 한 번에 조회하기 위한 인덱스
+-- (프로젝트별로 마감일 범위만 읽도록 project_id + 날짜 복합 인덱스)
+-- ========================================
+
+USE project_tracker;
+
+CREATE INDEX idx_project_due_date ON tasks (project_id, due_date);
+CREATE INDEX idx_project_target_date ON milestones (project_id, target_date);
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
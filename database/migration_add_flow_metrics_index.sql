@@ -0,0 +1,16 @@
+-- ========================================
+-- Migration: Add Flow Metrics Index
+-- ========================================
+-- 대시보드의 사이클 타임/리드 타임 집계용 인덱스
+-- (프로젝트의 완료 태스크만 완료일 순으로 읽도록 project_id + status + completed_at 복합 인덱스,
+--  보관 테이블도 함께 집계하므로 같은 인덱스 추가)
+-- ========================================
+
+USE project_tracker;
+
+CREATE INDEX idx_project_status_completed ON tasks (project_id, status, completed_at);
+CREATE INDEX idx_project_status_completed ON tasks_archive (project_id, status, completed_at);
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
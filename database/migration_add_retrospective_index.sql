@@ -0,0 +1,13 @@
+-- ========================================
+-- Migration: Add Retrospective Listing Index
+-- ========================================
+-- 사용자별 회고 목록을 작성일 역순으로 페이지 단위 조회하기 위한 인덱스
+-- ========================================
+
+USE project_tracker;
+
+CREATE INDEX idx_project_created ON retrospectives (project_id, created_at);
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
@@ -0,0 +1,47 @@
+-- ========================================
+-- Migration: Add Task Change Feed
+-- ========================================
+-- tasks.updated_at(모든 수정 시 자동 갱신)과 삭제 기록(task_tombstones)을 추가하여
+-- "특정 시점 이후 변경된 태스크"만 조회할 수 있도록 함
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- tasks 테이블에 updated_at 추가
+-- ========================================
+ALTER TABLE tasks
+ADD COLUMN updated_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+    ON UPDATE CURRENT_TIMESTAMP(6) COMMENT '수정일시' AFTER created_at,
+ADD INDEX idx_project_updated (project_id, updated_at);
+
+-- ========================================
+-- task_tombstones (삭제된 태스크 기록)
+-- ========================================
+CREATE TABLE IF NOT EXISTS task_tombstones (
+    task_id INT PRIMARY KEY COMMENT '삭제된 태스크 ID',
+    project_id INT NOT NULL COMMENT '프로젝트 ID (FK)',
+    deleted_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) COMMENT '삭제일시',
+
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+    INDEX idx_project_deleted (project_id, deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='삭제된 태스크 기록';
+
+DROP TRIGGER IF EXISTS trg_tasks_tombstone_delete;
+
+DELIMITER $$
+
+CREATE TRIGGER trg_tasks_tombstone_delete
+AFTER DELETE ON tasks
+FOR EACH ROW
+BEGIN
+    INSERT INTO task_tombstones (task_id, project_id)
+    VALUES (OLD.id, OLD.project_id)
+    ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP(6);
+END$$
+
+DELIMITER ;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
@@ -0,0 +1,74 @@
+-- ========================================
+-- Migration: Add Task Change Version
+-- ========================================
+-- 변경 피드의 기준을 시각(updated_at, deleted_at) 대신 커밋 순서의 번호로 바꿈
+-- 태스크를 추가/수정/삭제할 때 트리거가 projects 행을 잠근 상태에서
+-- change_version = data_version + 1을 기록한다. 잠금은 커밋까지 유지되므로
+-- 같은 프로젝트의 change_version은 커밋 순서대로 커지고, data_version V를 읽은 뒤에는
+-- change_version <= V인 변경이 모두 보인다 (오래 걸린 트랜잭션도 빠지지 않음)
+-- (migration_add_task_events.sql 이후에 실행)
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- change_version 컬럼 추가
+-- ========================================
+ALTER TABLE tasks
+ADD COLUMN change_version BIGINT NOT NULL DEFAULT 0 COMMENT '마지막 변경 시 프로젝트 데이터 버전' AFTER updated_at,
+ADD INDEX idx_project_change_version (project_id, change_version);
+
+ALTER TABLE task_tombstones
+ADD COLUMN change_version BIGINT NOT NULL DEFAULT 0 COMMENT '삭제 시 프로젝트 데이터 버전' AFTER deleted_at,
+ADD INDEX idx_project_change_version (project_id, change_version);
+
+-- ========================================
+-- 트리거 생성/재생성
+-- ========================================
+-- BEFORE 트리거에서 projects 행을 잠그고 번호를 정한 뒤,
+-- 기존 AFTER 트리거(카운터)가 data_version을 1 이상 올려 커밋 시 data_version >= change_version
+-- ========================================
+DROP TRIGGER IF EXISTS trg_tasks_change_version_insert;
+DROP TRIGGER IF EXISTS trg_tasks_change_version_update;
+DROP TRIGGER IF EXISTS trg_tasks_tombstone_delete;
+
+DELIMITER $$
+
+CREATE TRIGGER trg_tasks_change_version_insert
+BEFORE INSERT ON tasks
+FOR EACH ROW
+BEGIN
+    SET NEW.change_version = (
+        SELECT data_version + 1 FROM projects WHERE id = NEW.project_id FOR UPDATE
+    );
+END$$
+
+CREATE TRIGGER trg_tasks_change_version_update
+BEFORE UPDATE ON tasks
+FOR EACH ROW
+BEGIN
+    SET NEW.change_version = (
+        SELECT data_version + 1 FROM projects WHERE id = NEW.project_id FOR UPDATE
+    );
+END$$
+
+-- 삭제 기록도 카운터 트리거보다 먼저(BEFORE) 같은 방식으로 번호를 정함
+CREATE TRIGGER trg_tasks_tombstone_delete
+BEFORE DELETE ON tasks
+FOR EACH ROW
+BEGIN
+    DECLARE next_version BIGINT;
+
+    SELECT data_version + 1 INTO next_version
+    FROM projects WHERE id = OLD.project_id FOR UPDATE;
+
+    INSERT INTO task_tombstones (task_id, project_id, change_version)
+    VALUES (OLD.id, OLD.project_id, next_version)
+    ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP(6), change_version = next_version;
+END$$
+
+DELIMITER ;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
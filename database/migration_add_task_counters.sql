@@ -0,0 +1,109 @@
+-- ========================================
+-- Migration: Add Task Counters to Projects
+-- ========================================
+-- 프로젝트별 태스크 개수를 projects 테이블에 비정규화하여 저장
+-- (진행률 조회 시 tasks 테이블을 집계하지 않도록)
+-- tasks 테이블의 트리거로 INSERT/UPDATE/DELETE마다 갱신됨
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- projects 테이블에 카운터 컬럼 추가
+-- ========================================
+ALTER TABLE projects
+ADD COLUMN task_total INT NOT NULL DEFAULT 0 COMMENT '전체 태스크 수' AFTER status,
+ADD COLUMN task_todo INT NOT NULL DEFAULT 0 COMMENT 'To Do 태스크 수' AFTER task_total,
+ADD COLUMN task_in_progress INT NOT NULL DEFAULT 0 COMMENT 'In Progress 태스크 수' AFTER task_todo,
+ADD COLUMN task_done INT NOT NULL DEFAULT 0 COMMENT 'Done 태스크 수' AFTER task_in_progress,
+ADD COLUMN estimated_hours_total DECIMAL(9,2) NOT NULL DEFAULT 0 COMMENT '예상 소요 시간 합계' AFTER task_done;
+
+-- ========================================
+-- 카운터 유지 트리거
+-- ========================================
+-- 프로젝트 삭제 시의 CASCADE 삭제는 트리거를 실행하지 않지만
+-- 카운터가 저장된 프로젝트 행도 함께 삭제되므로 문제없음
+-- ========================================
+DROP TRIGGER IF EXISTS trg_tasks_counters_insert;
+DROP TRIGGER IF EXISTS trg_tasks_counters_update;
+DROP TRIGGER IF EXISTS trg_tasks_counters_delete;
+
+DELIMITER $$
+
+CREATE TRIGGER trg_tasks_counters_insert
+AFTER INSERT ON tasks
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET
+        task_total = task_total + 1,
+        task_todo = task_todo + (NEW.status = 'todo'),
+        task_in_progress = task_in_progress + (NEW.status = 'in_progress'),
+        task_done = task_done + (NEW.status = 'done'),
+        estimated_hours_total = estimated_hours_total + COALESCE(NEW.estimated_hours, 0)
+    WHERE id = NEW.project_id;
+END$$
+
+CREATE TRIGGER trg_tasks_counters_update
+AFTER UPDATE ON tasks
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.project_id <=> NEW.project_id)
+       OR NOT (OLD.status <=> NEW.status)
+       OR NOT (OLD.estimated_hours <=> NEW.estimated_hours) THEN
+        UPDATE projects SET
+            task_total = task_total - 1,
+            task_todo = task_todo - (OLD.status = 'todo'),
+            task_in_progress = task_in_progress - (OLD.status = 'in_progress'),
+            task_done = task_done - (OLD.status = 'done'),
+            estimated_hours_total = estimated_hours_total - COALESCE(OLD.estimated_hours, 0)
+        WHERE id = OLD.project_id;
+
+        UPDATE projects SET
+            task_total = task_total + 1,
+            task_todo = task_todo + (NEW.status = 'todo'),
+            task_in_progress = task_in_progress + (NEW.status = 'in_progress'),
+            task_done = task_done + (NEW.status = 'done'),
+            estimated_hours_total = estimated_hours_total + COALESCE(NEW.estimated_hours, 0)
+        WHERE id = NEW.project_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_tasks_counters_delete
+AFTER DELETE ON tasks
+FOR EACH ROW
+BEGIN
+    UPDATE projects SET
+        task_total = task_total - 1,
+        task_todo = task_todo - (OLD.status = 'todo'),
+        task_in_progress = task_in_progress - (OLD.status = 'in_progress'),
+        task_done = task_done - (OLD.status = 'done'),
+        estimated_hours_total = estimated_hours_total - COALESCE(OLD.estimated_hours, 0)
+    WHERE id = OLD.project_id;
+END$$
+
+DELIMITER ;
+
+-- ========================================
+-- 기존 데이터로 카운터 초기화
+-- ========================================
+UPDATE projects p
+LEFT JOIN (
+    SELECT project_id,
+           COUNT(*) AS total,
+           SUM(status = 'todo') AS todo,
+           SUM(status = 'in_progress') AS in_progress,
+           SUM(status = 'done') AS done,
+           SUM(COALESCE(estimated_hours, 0)) AS hours
+    FROM tasks
+    GROUP BY project_id
+) c ON c.project_id = p.id
+SET p.task_total = COALESCE(c.total, 0),
+    p.task_todo = COALESCE(c.todo, 0),
+    p.task_in_progress = COALESCE(c.in_progress, 0),
+    p.task_done = COALESCE(c.done, 0),
+    p.estimated_hours_total = COALESCE(c.hours, 0),
+    p.updated_at = p.updated_at;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
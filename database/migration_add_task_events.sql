@@ -0,0 +1,81 @@
+-- ========================================
+-- Migration: Add Task Event Log
+-- ========================================
+-- 태스크 생성/상태 변경/삭제를 덧붙이기만 하는 이벤트 로그(task_events)로 기록하고,
+-- 과거 시점의 보드를 빠르게 재구성하기 위한 보드 스냅샷(board_snapshots)을 추가
+-- 프로젝트를 보관(projects → projects_archive)해도 이력이 남도록 projects FK를 두지 않고,
+-- 프로젝트를 직접 삭제할 때만 delete_project()가 같은 트랜잭션에서 함께 삭제
+-- (migration_add_archive_tables.sql 이후에 실행)
+-- ========================================
+
+USE project_tracker;
+
+-- ========================================
+-- task_events (태스크 이벤트 로그, 수정/삭제하지 않음)
+-- ========================================
+CREATE TABLE IF NOT EXISTS task_events (
+    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+    project_id INT NOT NULL COMMENT '프로젝트 ID (보관된 프로젝트의 이력도 유지하므로 FK 없음)',
+    task_id INT NOT NULL COMMENT '태스크 ID (삭제된 태스크도 유지하므로 FK 없음)',
+    event_type ENUM('created', 'status_changed', 'deleted') NOT NULL COMMENT '이벤트 종류',
+    from_status ENUM('todo', 'in_progress', 'done') NULL COMMENT '이전 상태',
+    to_status ENUM('todo', 'in_progress', 'done') NULL COMMENT '새 상태 (삭제 시 NULL)',
+    title VARCHAR(200) NOT NULL COMMENT '이벤트 시점의 태스크 제목',
+    occurred_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) COMMENT '발생일시',
+
+    INDEX idx_project_occurred (project_id, occurred_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='태스크 이벤트 로그';
+
+-- ========================================
+-- board_snapshots (특정 이벤트까지 반영한 보드 상태)
+-- ========================================
+CREATE TABLE IF NOT EXISTS board_snapshots (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    project_id INT NOT NULL COMMENT '프로젝트 ID (task_events와 같이 FK 없음)',
+    last_event_id BIGINT NOT NULL COMMENT '스냅샷에 반영된 마지막 이벤트 ID',
+    last_occurred_at TIMESTAMP(6) NOT NULL COMMENT '마지막 이벤트 발생일시',
+    state JSON NOT NULL COMMENT '{태스크 ID: [상태, 제목]}',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
+
+    INDEX idx_project_occurred (project_id, last_occurred_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='보드 스냅샷';
+
+-- ========================================
+-- 기존 태스크의 이력 채우기
+-- ========================================
+-- 생성 → (started_at) 진행중 → (completed_at) 완료 순서로 추정해 기록 (보관된 프로젝트/태스크 포함)
+-- 재구성은 발생 순서와 ID 순서가 같다고 가정하므로 발생일시 순으로 삽입
+INSERT INTO task_events (project_id, task_id, event_type, from_status, to_status, title, occurred_at)
+SELECT project_id, task_id, event_type, from_status, to_status, title, occurred_at
+FROM (
+    SELECT project_id, id AS task_id, 'created' AS event_type, NULL AS from_status,
+           'todo' AS to_status, title, created_at AS occurred_at, 0 AS step
+    FROM tasks
+    UNION ALL
+    SELECT project_id, id, 'status_changed', 'todo', 'in_progress', title,
+           GREATEST(COALESCE(started_at, updated_at), created_at), 1
+    FROM tasks
+    WHERE status = 'in_progress' OR (status = 'done' AND started_at IS NOT NULL)
+    UNION ALL
+    SELECT project_id, id, 'status_changed', IF(started_at IS NULL, 'todo', 'in_progress'), 'done', title,
+           GREATEST(COALESCE(completed_at, updated_at), COALESCE(started_at, created_at), created_at), 2
+    FROM tasks
+    WHERE status = 'done'
+    UNION ALL
+    SELECT project_id, id, 'created', NULL, 'todo', title, created_at, 0
+    FROM tasks_archive
+    UNION ALL
+    SELECT project_id, id, 'status_changed', 'todo', 'in_progress', title,
+           GREATEST(started_at, created_at), 1
+    FROM tasks_archive
+    WHERE started_at IS NOT NULL
+    UNION ALL
+    SELECT project_id, id, 'status_changed', IF(started_at IS NULL, 'todo', 'in_progress'), 'done', title,
+           GREATEST(COALESCE(completed_at, updated_at), COALESCE(started_at, created_at), created_at), 2
+    FROM tasks_archive
+) history
+ORDER BY occurred_at, step, task_id;
+
+-- ========================================
+-- 마이그레이션 완료
+-- ========================================
@@ -3,72 +3,622 @@ Project Tracker - Database Manager
 MySQL 데이터베이스 CRUD 작업 관리
 """
 
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 import mysql.connector
-from mysql.connector import Error
-from datetime import datetime, date
-from typing import List, Dict, Optional, Any
+from mysql.connector import Error, pooling
+from mysql.connector.errors import PoolError
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Optional, Any, Tuple
 import streamlit as st
-from config import get_db_config
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from config import (
+    get_db_config, get_replica_configs, DB_CIRCUIT_FAILURE_THRESHOLD, DB_CIRCUIT_BASE_DELAY,
+    DB_CIRCUIT_MAX_DELAY, STALE_READ_CACHE_SIZE, STALE_READ_MAX_ROWS, STALE_READ_MAX_BYTES,
+    READ_YOUR_WRITES_SECONDS,
+    MAX_REPLICA_LAG_SECONDS, REPLICA_LAG_CHECK_SECONDS, DB_POOL_SIZE, FLOW_TREND_WEEKS,
+    BOARD_SNAPSHOT_EVENTS, BOARD_EVENT_SETTLE_SECONDS, KANBAN_BOARD_CACHE_SIZE,
+    KANBAN_BOARD_MAX_IDLE_SECONDS
+)
+from circuit_breaker import CircuitBreaker, OPEN
+import metrics
+import cache_backend
+import utils
+from models import Project, Task, Milestone, ChecklistItem
 
 
 # ========================================
 # 데이터베이스 연결
 # ========================================
 
+# 연결 실패가 이어지면 잠시 연결 시도를 멈추는 프로세스 공용 서킷 브레이커
+_breaker = CircuitBreaker(DB_CIRCUIT_FAILURE_THRESHOLD, DB_CIRCUIT_BASE_DELAY, DB_CIRCUIT_MAX_DELAY)
+metrics.DB_CIRCUIT_OPEN.add_callback(lambda: {(): int(_breaker.state == OPEN)})
+
+# 장애 중 대신 반환할 최근 조회 결과 {(query, params, row_type): (result, 추정 바이트)}
+_stale_reads: OrderedDict = OrderedDict()
+_stale_bytes = 0
+# 장애 대비로 보관하지 않는 테이블 (비밀번호 해시 등 민감한 행)
+_STALE_EXCLUDED_TABLES = re.compile(r"\busers\b", re.IGNORECASE)
+_stale_lock = threading.Lock()
+
+# 현재 스크립트 실행(스레드)에서 최근 결과로 대신 응답했는지 여부
+_request = threading.local()
+
+
+# 레플리카별 서킷 브레이커와 복제 지연 확인 결과 {"host:port": ...}
+_replica_breakers: Dict[str, CircuitBreaker] = {}
+_replica_lag: Dict[str, tuple] = {}
+_replica_lock = threading.Lock()
+_replica_turn = 0
+metrics.DB_REPLICA_LAG.add_callback(
+    lambda: {(endpoint,): lag for endpoint, (_, lag) in list(_replica_lag.items()) if lag is not None}
+)
+
+
+# 엔드포인트별 연결 풀 {"host:port": MySQLConnectionPool}
+_pools: Dict[str, pooling.MySQLConnectionPool] = {}
+_pool_lock = threading.Lock()
+
+
+def _get_pool(db_config: Dict) -> pooling.MySQLConnectionPool:
+    """엔드포인트의 연결 풀 (처음 호출할 때 DB_POOL_SIZE개 연결을 열어 생성)"""
+    endpoint = f"{db_config['host']}:{db_config['port']}"
+
+    with _pool_lock:
+        pool = _pools.get(endpoint)
+        if pool is None:
+            pool = pooling.MySQLConnectionPool(
+                pool_name=f"project_tracker_{len(_pools)}",
+                pool_size=DB_POOL_SIZE,
+                **db_config
+            )
+            _pools[endpoint] = pool
+        return pool
+
+
+def _checkout(db_config: Dict):
+    """풀에서 연결 꺼내기 (풀의 연결이 모두 사용 중이면 풀 밖에서 새로 연결)"""
+    try:
+        return _get_pool(db_config).get_connection()
+    except PoolError:
+        metrics.CONNECTIONS.inc(result="pool_exhausted")
+        return mysql.connector.connect(**db_config)
+
+
+def _release(connection) -> None:
+    """
+    연결 반납 (풀 연결은 풀로 돌아감)
+
+    끊긴 풀 연결도 close()해야 풀 자리가 돌아오고, 다음에 꺼낼 때 다시 연결된다.
+    """
+    try:
+        connection.close()
+    except Error:
+        pass
+
+
+def _connect(db_config: Dict, breaker: CircuitBreaker, quiet: bool = False):
+    """서킷 브레이커를 거쳐 연결 풀에서 연결 가져오기 (quiet=True면 실패해도 오류 메시지 없음)"""
+    if not breaker.allow_request():
+        return None
+
+    try:
+        with metrics.CONNECT_DURATION.time():
+            connection = _checkout(db_config)
+        metrics.CONNECTIONS.inc(result="success")
+        breaker.record_success()
+        return connection
+    except Error as e:
+        metrics.CONNECTIONS.inc(result="error")
+        breaker.record_failure()
+        if not quiet:
+            st.error(f"❌ 데이터베이스 연결 실패: {e}")
+        return None
+
+
 def get_connection():
     """
-    MySQL 데이터베이스 연결 생성
+    MySQL 데이터베이스(primary) 연결 생성
+
+    연결 실패가 이어지면 서킷 브레이커가 열려 대기 시간 동안은 연결을
+    시도하지 않고 바로 None을 반환한다 (연결 제한 시간만큼 멈추지 않음).
+
+    Returns:
+        connection: MySQL 연결 객체 또는 None
+    """
+    db_config = get_db_config()
+    if not db_config:
+        return None
+
+    return _connect(db_config, _breaker)
+
+
+def get_read_connection():
+    """
+    읽기용 연결 생성 (레플리카가 설정되어 있으면 레플리카, 아니면 primary)
+
+    레플리카를 돌아가며 사용하고, 연결할 수 없거나 복제 지연이
+    MAX_REPLICA_LAG_SECONDS를 넘는 레플리카는 건너뛴다. 최근에 쓰기를 한
+    세션은 READ_YOUR_WRITES_SECONDS 동안 primary에서 읽는다.
 
     Returns:
         connection: MySQL 연결 객체 또는 None
     """
+    global _replica_turn
+
+    replicas = get_replica_configs()
+
+    if replicas and not _is_pinned_to_primary():
+        with _replica_lock:
+            start = _replica_turn
+            _replica_turn = (_replica_turn + 1) % len(replicas)
+
+        for offset in range(len(replicas)):
+            db_config = replicas[(start + offset) % len(replicas)]
+            endpoint = f"{db_config['host']}:{db_config['port']}"
+
+            connection = _connect(db_config, _get_replica_breaker(endpoint), quiet=True)
+            if connection is None:
+                continue
+            if _is_replica_fresh(endpoint, connection):
+                metrics.DB_READS.inc(target="replica")
+                return connection
+            _release(connection)
+
+    metrics.DB_READS.inc(target="primary")
+    return get_connection()
+
+
+def _get_replica_breaker(endpoint: str) -> CircuitBreaker:
+    with _replica_lock:
+        breaker = _replica_breakers.get(endpoint)
+        if breaker is None:
+            breaker = _replica_breakers[endpoint] = CircuitBreaker(
+                DB_CIRCUIT_FAILURE_THRESHOLD, DB_CIRCUIT_BASE_DELAY, DB_CIRCUIT_MAX_DELAY
+            )
+        return breaker
+
+
+def _is_replica_fresh(endpoint: str, connection) -> bool:
+    """
+    레플리카 복제 지연 확인 (REPLICA_LAG_CHECK_SECONDS 동안은 이전 결과 사용)
+
+    SHOW REPLICA STATUS의 Seconds_Behind_Source가 NULL(복제 중단)이거나
+    허용치를 넘으면 False. 복제가 설정되지 않은 서버(결과 없음)나
+    권한이 없어 확인할 수 없는 경우는 지연 없음으로 본다.
+    """
+    now = time.monotonic()
+    with _replica_lock:
+        checked = _replica_lag.get(endpoint)
+    if checked and now - checked[0] < REPLICA_LAG_CHECK_SECONDS:
+        lag = checked[1]
+    else:
+        lag = _check_replica_lag(connection)
+        with _replica_lock:
+            _replica_lag[endpoint] = (now, lag)
+
+    return lag is not None and lag <= MAX_REPLICA_LAG_SECONDS
+
+
+def _check_replica_lag(connection) -> Optional[float]:
+    """레플리카 복제 지연(초) 조회 (복제 중단 시 None)"""
+    for query, column in (("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+                          ("SHOW SLAVE STATUS", "Seconds_Behind_Master")):
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute(query)
+            row = cursor.fetchone()
+            return 0 if row is None else row.get(column)
+        except Error:
+            # MySQL 8.0.22 이전은 SHOW SLAVE STATUS만 지원, 권한이 없으면 둘 다 실패
+            continue
+        finally:
+            cursor.close()
+    return 0
+
+
+def _is_pinned_to_primary() -> bool:
+    """현재 세션이 최근에 쓰기를 해서 primary에서 읽어야 하는지"""
+    if get_script_run_ctx() is None:
+        return False
+    return st.session_state.get('_primary_pinned_until', 0) > time.monotonic()
+
+
+def _pin_to_primary() -> None:
+    """쓰기 후 READ_YOUR_WRITES_SECONDS 동안 현재 세션의 읽기를 primary로 고정"""
+    if get_script_run_ctx() is None:
+        return
+    st.session_state['_primary_pinned_until'] = time.monotonic() + READ_YOUR_WRITES_SECONDS
+
+
+def get_connection_status() -> Dict[str, Any]:
+    """
+    데이터베이스 연결 상태 조회 (장애 배너 표시용)
+
+    Returns:
+        dict: {'state': 서킷 상태(closed/open/half_open),
+               'retry_in': 다음 재시도까지 남은 초,
+               'stale': 이번 실행에서 최근 결과로 대신 응답했는지}
+    """
+    return {
+        'state': _breaker.state,
+        'retry_in': _breaker.retry_in(),
+        'stale': getattr(_request, 'stale', False),
+    }
+
+
+def reset_request_state() -> None:
+    """스크립트 실행 시작 시 호출 (최근 결과 사용 표시 초기화)"""
+    _request.stale = False
+
+
+def prime_connection_pools() -> int:
+    """
+    primary와 레플리카의 연결 풀을 미리 만들어 연결을 채워 둠 (앱 시작 시 1회)
+
+    Returns:
+        int: 준비된 풀 개수 (연결할 수 없는 엔드포인트는 제외)
+    """
+    targets = []
+    db_config = get_db_config()
+    if db_config:
+        targets.append((db_config, _breaker))
+    for replica_config in get_replica_configs():
+        endpoint = f"{replica_config['host']}:{replica_config['port']}"
+        targets.append((replica_config, _get_replica_breaker(endpoint)))
+
+    primed = 0
+    for target_config, breaker in targets:
+        connection = _connect(target_config, breaker, quiet=True)
+        if connection is not None:
+            _release(connection)
+            primed += 1
+
+    return primed
+
+
+def get_schema_objects() -> Optional[Dict[str, set]]:
+    """
+    현재 데이터베이스의 테이블/컬럼/인덱스 목록 조회 (information_schema)
+
+    Returns:
+        dict: {'tables': {테이블}, 'columns': {(테이블, 컬럼)}, 'indexes': {(테이블, 인덱스)}}
+              또는 None (조회 실패)
+    """
+    columns = execute_query("""
+        SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+    """, fetch=True)
+    if columns is None:
+        return None
+
+    indexes = execute_query("""
+        SELECT DISTINCT TABLE_NAME AS table_name, INDEX_NAME AS index_name
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+    """, fetch=True)
+    if indexes is None:
+        return None
+
+    return {
+        'tables': {row['table_name'] for row in columns},
+        'columns': {(row['table_name'], row['column_name']) for row in columns},
+        'indexes': {(row['table_name'], row['index_name']) for row in indexes},
+    }
+
+
+def _stale_key(query: str, params, row_type) -> Optional[tuple]:
+    if _STALE_EXCLUDED_TABLES.search(query):
+        return None
     try:
-        db_config = get_db_config()
-        if not db_config:
-            return None
+        key = (query, tuple(params) if params else (), row_type)
+        hash(key)
+        return key
+    except TypeError:
+        return None
 
-        connection = mysql.connector.connect(**db_config)
-        return connection
-    except Error as e:
-        st.error(f"❌ 데이터베이스 연결 실패: {e}")
+
+def _result_size(result: list) -> int:
+    """조회 결과의 대략적인 메모리 크기 (리스트, 행, 컬럼 값)"""
+    size = sys.getsizeof(result)
+    for row in result:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+    return size
+
+
+def _remember_read(key: Optional[tuple], result: list) -> None:
+    """
+    성공한 조회 결과를 장애 대비용으로 보관 (LRU)
+
+    STALE_READ_MAX_ROWS보다 큰 결과는 보관하지 않고(이전 결과도 버림),
+    항목 수와 추정 크기가 상한을 넘으면 오래된 것부터 버린다.
+    """
+    global _stale_bytes
+    if key is None:
+        return
+    size = _result_size(result) if len(result) <= STALE_READ_MAX_ROWS else None
+    with _stale_lock:
+        previous = _stale_reads.pop(key, None)
+        if previous is not None:
+            _stale_bytes -= previous[1]
+        if size is None or size > STALE_READ_MAX_BYTES:
+            return
+        _stale_reads[key] = (result, size)
+        _stale_bytes += size
+        while len(_stale_reads) > STALE_READ_CACHE_SIZE or _stale_bytes > STALE_READ_MAX_BYTES:
+            _, (_, evicted) = _stale_reads.popitem(last=False)
+            _stale_bytes -= evicted
+
+
+def _recall_read(key: Optional[tuple]) -> Optional[list]:
+    """장애 중 같은 쿼리의 최근 결과 반환 (없으면 None)"""
+    if key is None:
+        return None
+    with _stale_lock:
+        entry = _stale_reads.get(key)
+    if entry is None:
         return None
+    result = entry[0]
+    _request.stale = True
+    metrics.STALE_READS.inc()
+    return list(result)
 
 
-def execute_query(query: str, params: tuple = None, fetch: bool = False) -> Optional[Any]:
+def execute_query(query: str, params: tuple = None, fetch: bool = False,
+                  stream: bool = False, batch_size: int = 500,
+                  row_type: type = None, primary: bool = False) -> Optional[Any]:
     """
     SQL 쿼리 실행 (INSERT, UPDATE, DELETE)
 
     Args:
         query: SQL 쿼리
         params: 쿼리 파라미터
-        fetch: True면 결과 반환, False면 lastrowid 반환
+        fetch: True면 결과 반환 (레플리카가 있으면 레플리카에서 읽음),
+               False면 primary에서 실행하고 lastrowid 반환
+        row_type: fetch=True일 때 결과 행 타입 (models.Row 하위 클래스)
+                  지정하면 튜플 커서로 조회하여 딕셔너리 대신 행 객체로 반환
+        stream: True면 결과를 batch_size 단위로 읽는 이터레이터 반환
+                (대용량 조회용, 전체 결과를 메모리에 올리지 않음)
+        batch_size: stream=True일 때 한 번에 가져올 행 수
+        primary: fetch=True여도 primary에서 읽음 (복제 지연이 있으면 안 되는 조회)
 
     Returns:
         fetch=True: 쿼리 결과 리스트
         fetch=False: lastrowid (INSERT) 또는 rowcount
+        stream=True: 결과 행 이터레이터
     """
-    connection = get_connection()
+    if stream:
+        return _stream_query(query, params, batch_size)
+
+    # transaction() 블록 안이면 그 연결에서 실행하고 커밋은 블록 끝에서 한 번만
+    tx = getattr(_request, 'transaction', None)
+    if tx is not None:
+        return _execute_in_transaction(tx, query, params, fetch, row_type)
+
+    kind = "read" if fetch else "write"
+    start = time.perf_counter()
+    stale_key = _stale_key(query, params, row_type) if fetch else None
+
+    if fetch and not primary:
+        connection = get_read_connection()
+    else:
+        if fetch:
+            metrics.DB_READS.inc(target="primary")
+        connection = get_connection()
     if not connection:
-        return None
+        metrics.QUERY_ERRORS.inc(kind=kind)
+        # 데이터베이스 장애 중에는 같은 조회의 최근 결과로 대신 응답 (읽기 전용)
+        return _recall_read(stale_key) if fetch else None
 
     try:
-        cursor = connection.cursor(dictionary=True)
+        cursor = connection.cursor(dictionary=row_type is None)
         cursor.execute(query, params or ())
 
         if fetch:
-            result = cursor.fetchall()
-            return result
+            if row_type is not None:
+                result = row_type.from_rows(cursor.column_names, cursor.fetchall())
+            else:
+                result = cursor.fetchall()
+            _remember_read(stale_key, result)
+            return list(result)
         else:
             connection.commit()
+            _pin_to_primary()
             return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
 
     except Error as e:
+        metrics.QUERY_ERRORS.inc(kind=kind)
         st.error(f"❌ 쿼리 실행 오류: {e}")
         return None
     finally:
         if connection.is_connected():
             cursor.close()
-            connection.close()
+        _release(connection)
+        metrics.QUERY_DURATION.observe(time.perf_counter() - start, kind=kind)
+
+
+class Transaction:
+    """transaction() 블록의 상태 (블록이 끝난 뒤 committed로 성공 여부 확인)"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.failed = connection is None
+        self.committed = False
+
+
+@contextmanager
+def transaction():
+    """
+    여러 db_manager 함수를 한 연결, 한 커밋으로 묶는 트랜잭션
+
+    블록 안의 execute_query 호출(insert_task, update_task 등 기존 함수 포함)은
+    같은 primary 연결을 사용하고 커밋하지 않는다. 블록이 끝나면 한 번에 커밋하고,
+    쿼리가 하나라도 실패했거나 예외가 발생하면 전체를 롤백한다.
+    실패한 뒤의 쿼리는 실행하지 않고 None을 반환한다.
+    중첩해서 사용하면 바깥 트랜잭션을 그대로 이어서 사용한다.
+
+        with db.transaction() as tx:
+            db.update_task(task_id, title=title)
+            for content in items:
+                db.insert_checklist_item(task_id, content)
+
+        if tx.committed:
+            ...
+
+    Returns:
+        Transaction: 트랜잭션 상태 (committed, failed)
+    """
+    current = getattr(_request, 'transaction', None)
+    if current is not None:
+        yield current
+        return
+
+    tx = Transaction(get_connection())
+    _request.transaction = tx
+
+    try:
+        yield tx
+
+        if not tx.failed:
+            try:
+                tx.connection.commit()
+                tx.committed = True
+                _pin_to_primary()
+            except Error as e:
+                tx.failed = True
+                st.error(f"❌ 쿼리 실행 오류: {e}")
+    finally:
+        _request.transaction = None
+        connection = tx.connection
+        if connection is not None:
+            if not tx.committed and connection.is_connected():
+                connection.rollback()
+            _release(connection)
+
+
+def _execute_in_transaction(tx: Transaction, query: str, params: tuple, fetch: bool,
+                            row_type: type) -> Optional[Any]:
+    """transaction() 블록 안에서 쿼리 실행 (커밋하지 않음)"""
+    if tx.failed:
+        return None
+
+    kind = "read" if fetch else "write"
+    start = time.perf_counter()
+    cursor = None
+
+    try:
+        cursor = tx.connection.cursor(dictionary=row_type is None)
+        cursor.execute(query, params or ())
+
+        if fetch:
+            if row_type is not None:
+                return row_type.from_rows(cursor.column_names, cursor.fetchall())
+            return cursor.fetchall()
+        return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
+
+    except Error as e:
+        tx.failed = True
+        metrics.QUERY_ERRORS.inc(kind=kind)
+        st.error(f"❌ 쿼리 실행 오류: {e}")
+        return None
+    finally:
+        if cursor is not None:
+            cursor.close()
+        metrics.QUERY_DURATION.observe(time.perf_counter() - start, kind=kind)
+
+
+def _cancel_query(connection) -> bool:
+    """
+    연결에서 실행 중인 쿼리를 서버에서 중단 (같은 서버에 다른 연결로 KILL QUERY)
+
+    중단된 쿼리는 남은 행 대신 오류 패킷만 보내므로, 이미 전송된 행만 버리면
+    연결을 닫지 않고 풀로 돌려줄 수 있다.
+
+    Returns:
+        bool: 중단 요청 성공 여부
+    """
+    try:
+        endpoint = f"{connection.server_host}:{connection.server_port}"
+        thread_id = connection.connection_id
+    except Error:
+        return False
+
+    configs = [get_db_config()] + get_replica_configs()
+    db_config = next((c for c in configs if c and f"{c['host']}:{c['port']}" == endpoint), None)
+    if db_config is None or thread_id is None:
+        return False
+
+    killer = None
+    try:
+        killer = _checkout(db_config)
+        cursor = killer.cursor()
+        cursor.execute("KILL QUERY %s", (thread_id,))
+        cursor.close()
+        return True
+    except Error:
+        return False
+    finally:
+        if killer is not None:
+            _release(killer)
+
+
+def _stream_query(query: str, params: tuple, batch_size: int):
+    """
+    조회 결과를 배치 단위로 읽어 한 행씩 반환하는 제너레이터
+
+    서버 측 커서(unbuffered)로 fetchmany만 사용하므로 메모리 사용량은
+    batch_size에 비례한다. 제너레이터가 끝나거나 close()될 때까지
+    연결을 유지하므로, 중간에 멈출 수 있다면 contextlib.closing으로 감싸서 사용한다.
+    중간에 닫으면 남은 결과를 받지 않도록 서버에서 쿼리를 중단한다.
+
+        with closing(execute_query(query, stream=True)) as rows:
+            for row in rows:
+                ...
+    """
+    connection = get_read_connection()
+    if not connection:
+        return
+
+    cursor = None
+    exhausted = False
+
+    try:
+        cursor = connection.cursor(dictionary=True, buffered=False)
+        cursor.execute(query, params or ())
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                exhausted = True
+                break
+            yield from rows
+
+    except Error as e:
+        st.error(f"❌ 쿼리 실행 오류: {e}")
+    finally:
+        try:
+            if cursor is not None and not exhausted:
+                # 읽지 않은 결과가 남은 연결은 풀로 돌려줄 수 없으므로, 서버에서 쿼리를 중단해
+                # 이미 전송된 행만 버린다 (중단하지 못했을 때만 남은 결과를 끝까지 읽음)
+                _cancel_query(connection)
+                while cursor.fetchmany(batch_size):
+                    pass
+        except Error:
+            pass
+        finally:
+            try:
+                if cursor is not None:
+                    cursor.close()
+            except Error:
+                pass
+            _release(connection)
 
 
 # ========================================
@@ -104,7 +654,7 @@ def insert_project(name: str, description: str = None, github_url: str = None,
     return execute_query(query, params)
 
 
-def get_project(project_id: int) -> Optional[Dict]:
+def get_project(project_id: int) -> Optional[Project]:
     """
     프로젝트 조회
 
@@ -112,14 +662,21 @@ def get_project(project_id: int) -> Optional[Dict]:
         project_id: 프로젝트 ID
 
     Returns:
-        dict: 프로젝트 정보 또는 None
+        Project: 프로젝트 정보 또는 None (딕셔너리처럼 접근 가능)
+                 보관된 프로젝트는 archived_at 값이 들어 있음
     """
     query = "SELECT * FROM projects WHERE id = %s"
-    result = execute_query(query, (project_id,), fetch=True)
+    result = execute_query(query, (project_id,), fetch=True, row_type=Project)
+    if result:
+        return result[0]
+
+    # 보관된 프로젝트 (읽기 전용, archived_at 포함)
+    query = "SELECT * FROM projects_archive WHERE id = %s"
+    result = execute_query(query, (project_id,), fetch=True, row_type=Project)
     return result[0] if result else None
 
 
-def get_projects(status: str = None, user_id: int = None) -> List[Dict]:
+def get_projects(status: str = None, user_id: int = None) -> List[Project]:
     """
     프로젝트 목록 조회
 
@@ -128,7 +685,7 @@ def get_projects(status: str = None, user_id: int = None) -> List[Dict]:
         user_id: 사용자 ID (None이면 전체, 지정하면 해당 사용자의 프로젝트만)
 
     Returns:
-        list: 프로젝트 리스트
+        list: Project 리스트
     """
     conditions = []
     params = []
@@ -146,10 +703,50 @@ def get_projects(status: str = None, user_id: int = None) -> List[Dict]:
     else:
         query = "SELECT * FROM projects ORDER BY created_at DESC"
 
-    result = execute_query(query, tuple(params) if params else None, fetch=True)
+    result = execute_query(query, tuple(params) if params else None, fetch=True, row_type=Project)
     return result or []
 
 
+def get_archived_projects(user_id: int = None) -> List[Project]:
+    """
+    보관된 프로젝트 목록 조회 (읽기 전용)
+
+    Args:
+        user_id: 사용자 ID (None이면 전체)
+
+    Returns:
+        list: Project 리스트 (archived_at 포함)
+    """
+    if user_id is not None:
+        query = "SELECT * FROM projects_archive WHERE user_id = %s ORDER BY archived_at DESC"
+        params = (user_id,)
+    else:
+        query = "SELECT * FROM projects_archive ORDER BY archived_at DESC"
+        params = None
+
+    result = execute_query(query, params, fetch=True, row_type=Project)
+    return result or []
+
+
+def get_project_version(project_id: int) -> Optional[int]:
+    """
+    프로젝트 데이터 버전 조회 (변경 감지용)
+
+    projects.data_version은 프로젝트와 하위 데이터가 바뀔 때마다
+    트리거로 증가한다. 기본 키 조회 한 번이므로 주기적으로 호출해도 가볍다.
+    레플리카는 지연될 수 있으므로 변경 감지가 늦지 않도록 primary에서 읽는다.
+
+    Args:
+        project_id: 프로젝트 ID
+
+    Returns:
+        int: 데이터 버전 또는 None
+    """
+    query = "SELECT data_version FROM projects WHERE id = %s"
+    result = execute_query(query, (project_id,), fetch=True, primary=True)
+    return result[0]['data_version'] if result else None
+
+
 def update_project(project_id: int, **kwargs) -> bool:
     """
     프로젝트 수정
@@ -183,15 +780,81 @@ def delete_project(project_id: int) -> bool:
     """
     프로젝트 삭제 (CASCADE로 연관 데이터도 삭제됨)
 
+    FK가 없는 태스크 이벤트 로그, 보드 스냅샷, 보관된 태스크와 체크리스트는
+    같은 트랜잭션에서 직접 삭제한다.
+
     Args:
         project_id: 프로젝트 ID
 
     Returns:
         bool: 성공 여부
     """
-    query = "DELETE FROM projects WHERE id = %s"
-    result = execute_query(query, (project_id,))
-    return result is not None and result > 0
+    with transaction() as tx:
+        execute_query("DELETE FROM task_events WHERE project_id = %s", (project_id,))
+        execute_query("DELETE FROM board_snapshots WHERE project_id = %s", (project_id,))
+        execute_query("""
+            DELETE FROM checklist_items_archive
+            WHERE task_id IN (SELECT id FROM tasks_archive WHERE project_id = %s)
+        """, (project_id,))
+        execute_query("DELETE FROM tasks_archive WHERE project_id = %s", (project_id,))
+        result = execute_query("DELETE FROM projects WHERE id = %s", (project_id,))
+
+    return not tx.failed and result is not None and result > 0
+
+
+def reconcile_project_counters(project_id: int = None) -> int:
+    """
+    프로젝트 태스크 카운터 재계산 (트리거 누락 등으로 어긋난 값 복구)
+
+    projects의 task_total/task_todo/task_in_progress/task_done/
+    estimated_hours_total은 tasks 테이블의 트리거로 유지된다.
+    보관된 완료 태스크(tasks_archive)도 카운터에 포함되므로 두 테이블을 함께 센다.
+    실제 값과 다른 프로젝트만 갱신한다.
+
+    Args:
+        project_id: 프로젝트 ID (None이면 전체)
+
+    Returns:
+        int: 복구된 프로젝트 개수
+    """
+    task_filter = "WHERE project_id = %s" if project_id is not None else ""
+
+    query = f"""
+        UPDATE projects p
+        LEFT JOIN (
+            SELECT project_id,
+                   COUNT(*) AS total,
+                   SUM(status = 'todo') AS todo,
+                   SUM(status = 'in_progress') AS in_progress,
+                   SUM(status = 'done') AS done,
+                   SUM(COALESCE(estimated_hours, 0)) AS hours
+            FROM (
+                SELECT project_id, status, estimated_hours FROM tasks {task_filter}
+                UNION ALL
+                SELECT project_id, status, estimated_hours FROM tasks_archive {task_filter}
+            ) t
+            GROUP BY project_id
+        ) c ON c.project_id = p.id
+        SET p.task_total = COALESCE(c.total, 0),
+            p.task_todo = COALESCE(c.todo, 0),
+            p.task_in_progress = COALESCE(c.in_progress, 0),
+            p.task_done = COALESCE(c.done, 0),
+            p.estimated_hours_total = COALESCE(c.hours, 0),
+            p.updated_at = p.updated_at
+        WHERE (p.task_total <> COALESCE(c.total, 0)
+               OR p.task_todo <> COALESCE(c.todo, 0)
+               OR p.task_in_progress <> COALESCE(c.in_progress, 0)
+               OR p.task_done <> COALESCE(c.done, 0)
+               OR p.estimated_hours_total <> COALESCE(c.hours, 0))
+    """
+    params = None
+
+    if project_id is not None:
+        query += " AND p.id = %s"
+        params = (project_id, project_id, project_id)
+
+    result = execute_query(query, params)
+    return result or 0
 
 
 # ========================================
@@ -225,10 +888,16 @@ def insert_task(project_id: int, title: str, description: str = None,
     """
     params = (project_id, title, description, status, priority,
               tags, estimated_hours, due_date)
-    return execute_query(query, params)
+
+    with transaction() as tx:
+        task_id = execute_query(query, params)
+        if task_id:
+            _log_task_events('created', [task_id])
+
+    return None if tx.failed else task_id
 
 
-def get_task(task_id: int) -> Optional[Dict]:
+def get_task(task_id: int) -> Optional[Task]:
     """
     태스크 조회
 
@@ -236,40 +905,46 @@ def get_task(task_id: int) -> Optional[Dict]:
         task_id: 태스크 ID
 
     Returns:
-        dict: 태스크 정보 또는 None
+        Task: 태스크 정보 또는 None (딕셔너리처럼 접근 가능)
     """
     query = "SELECT * FROM tasks WHERE id = %s"
-    result = execute_query(query, (task_id,), fetch=True)
+    result = execute_query(query, (task_id,), fetch=True, row_type=Task)
     return result[0] if result else None
 
 
-def get_tasks(project_id: int, status: str = None) -> List[Dict]:
+def get_tasks(project_id: int, status: str = None, include_archived: bool = False) -> List[Task]:
     """
     프로젝트의 태스크 목록 조회
 
     Args:
         project_id: 프로젝트 ID
         status: 필터링할 상태 (None이면 전체)
+        include_archived: True면 보관된 태스크(tasks_archive)도 함께 조회
+                          (통계/보관 프로젝트용, Kanban 보드는 현재 태스크만 사용)
 
     Returns:
-        list: 태스크 리스트
+        list: Task 리스트
     """
-    if status:
-        query = """
-            SELECT * FROM tasks
-            WHERE project_id = %s AND status = %s
+    condition = "project_id = %s AND status = %s" if status else "project_id = %s"
+    params = (project_id, status) if status else (project_id,)
+
+    if include_archived:
+        columns = ', '.join(Task.FIELDS)
+        query = f"""
+            SELECT {columns} FROM tasks WHERE {condition}
+            UNION ALL
+            SELECT {columns} FROM tasks_archive WHERE {condition}
             ORDER BY created_at DESC
         """
-        params = (project_id, status)
+        params = params * 2
     else:
-        query = """
+        query = f"""
             SELECT * FROM tasks
-            WHERE project_id = %s
+            WHERE {condition}
             ORDER BY created_at DESC
         """
-        params = (project_id,)
 
-    result = execute_query(query, params, fetch=True)
+    result = execute_query(query, params, fetch=True, row_type=Task)
     return result or []
 
 
@@ -298,69 +973,536 @@ def update_task(task_id: int, **kwargs) -> bool:
     if not fields:
         return False
 
-    query = f"UPDATE tasks SET {', '.join(fields)} WHERE id = %s"
-    values.append(task_id)
+    query = f"UPDATE tasks SET {', '.join(fields)} WHERE id = %s"
+    values.append(task_id)
+
+    if 'status' in kwargs:
+        # 상태 변경은 이벤트 로그와 한 트랜잭션으로 기록
+        with transaction() as tx:
+            _log_task_events('status_changed', [task_id], kwargs['status'])
+            result = execute_query(query, tuple(values))
+        if tx.failed:
+            return False
+    else:
+        result = execute_query(query, tuple(values))
+
+    return result is not None and result > 0
+
+
+def update_task_status(task_id: int, new_status: str) -> bool:
+    """
+    태스크 상태 변경 (시간 자동 기록)
+
+    Args:
+        task_id: 태스크 ID
+        new_status: 새 상태 (todo/in_progress/done)
+
+    Returns:
+        bool: 성공 여부
+    """
+    updates = {'status': new_status}
+
+    if new_status == 'in_progress':
+        updates['started_at'] = datetime.now()
+    elif new_status == 'done':
+        updates['completed_at'] = datetime.now()
+
+    return update_task(task_id, **updates)
+
+
+def delete_task(task_id: int) -> bool:
+    """
+    태스크 삭제
+
+    Args:
+        task_id: 태스크 ID
+
+    Returns:
+        bool: 성공 여부
+    """
+    query = "DELETE FROM tasks WHERE id = %s"
+
+    with transaction() as tx:
+        _log_task_events('deleted', [task_id])
+        result = execute_query(query, (task_id,))
+
+    return not tx.failed and result is not None and result > 0
+
+
+def _in_placeholders(values: List) -> str:
+    """IN (...) 절에 사용할 플레이스홀더 문자열 생성"""
+    return ', '.join(['%s'] * len(values))
+
+
+def bulk_update_task_status(task_ids: List[int], new_status: str) -> int:
+    """
+    여러 태스크의 상태를 한 번에 변경 (시간 자동 기록)
+
+    이미 같은 상태인 태스크는 건너뛰어 started_at/completed_at이
+    덮어써지지 않도록 한다.
+
+    Args:
+        task_ids: 태스크 ID 리스트
+        new_status: 새 상태 (todo/in_progress/done)
+
+    Returns:
+        int: 변경된 태스크 개수
+    """
+    if not task_ids:
+        return 0
+
+    fields = ["status = %s"]
+    values = [new_status]
+
+    if new_status == 'in_progress':
+        fields.append("started_at = %s")
+        values.append(datetime.now())
+    elif new_status == 'done':
+        fields.append("completed_at = %s")
+        values.append(datetime.now())
+
+    query = f"""
+        UPDATE tasks SET {', '.join(fields)}
+        WHERE id IN ({_in_placeholders(task_ids)}) AND status <> %s
+    """
+    values.extend(task_ids)
+    values.append(new_status)
+
+    with transaction() as tx:
+        _log_task_events('status_changed', task_ids, new_status)
+        result = execute_query(query, tuple(values))
+
+    return 0 if tx.failed else result or 0
+
+
+def bulk_update_tasks(task_ids: List[int], **kwargs) -> int:
+    """
+    여러 태스크의 우선순위/태그를 한 번에 수정
+
+    Args:
+        task_ids: 태스크 ID 리스트
+        **kwargs: 수정할 필드들 (priority, tags)
+
+    Returns:
+        int: 변경된 태스크 개수
+    """
+    if not task_ids:
+        return 0
+
+    fields = []
+    values = []
+
+    for key, value in kwargs.items():
+        if key in ['priority', 'tags']:
+            fields.append(f"{key} = %s")
+            values.append(value)
+
+    if not fields:
+        return 0
+
+    query = f"UPDATE tasks SET {', '.join(fields)} WHERE id IN ({_in_placeholders(task_ids)})"
+    values.extend(task_ids)
+
+    result = execute_query(query, tuple(values))
+    return result or 0
+
+
+def bulk_delete_tasks(task_ids: List[int]) -> int:
+    """
+    여러 태스크를 한 번에 삭제
+
+    Args:
+        task_ids: 태스크 ID 리스트
+
+    Returns:
+        int: 삭제된 태스크 개수
+    """
+    if not task_ids:
+        return 0
+
+    query = f"DELETE FROM tasks WHERE id IN ({_in_placeholders(task_ids)})"
+
+    with transaction() as tx:
+        _log_task_events('deleted', task_ids)
+        result = execute_query(query, tuple(task_ids))
+
+    return 0 if tx.failed else result or 0
+
+
+def get_tasks_changed_since(project_id: int, since_version: int = None) -> Optional[Dict]:
+    """
+    특정 데이터 버전 이후 변경/삭제된 태스크만 조회 (변경 피드)
+
+    반환된 version을 다음 호출의 since_version으로 넘기면 그 사이의 변경분만 받는다.
+    태스크와 삭제 기록의 change_version은 프로젝트 행 잠금 아래에서 정해지므로 커밋 순서대로
+    커지고 (migration_add_task_change_version.sql), 먼저 읽은 data_version 이하의 변경은
+    모두 커밋되어 보인다. 오래 걸린 트랜잭션의 변경도 빠지지 않는다.
+    버전 이후에 커밋된 변경이 함께 올 수 있어 다음 호출에서 중복될 수 있다 (적용은 멱등적으로).
+    버전과 데이터가 같은 서버에서 나와야 하므로 항상 primary에서 읽는다.
+
+    Args:
+        project_id: 프로젝트 ID
+        since_version: 기준 데이터 버전 (None이면 전체 태스크)
+
+    Returns:
+        dict: {'changed': 변경된 Task 리스트,
+               'deleted': 삭제된 태스크 ID 리스트,
+               'version': 다음 호출에 넘길 데이터 버전}
+        또는 None (조회 실패, 프로젝트 없음)
+    """
+    # 버전을 먼저 읽어야 그 이하의 변경이 뒤의 조회에 모두 포함됨
+    if since_version is None:
+        meta = execute_query("""
+            SELECT data_version, NULL AS deleted_ids
+            FROM projects
+            WHERE id = %s
+        """, (project_id,), fetch=True, primary=True)
+        changed = execute_query("""
+            SELECT * FROM tasks
+            WHERE project_id = %s
+            ORDER BY created_at DESC
+        """, (project_id,), fetch=True, row_type=Task, primary=True)
+    else:
+        meta = execute_query("""
+            SELECT data_version,
+                   (SELECT JSON_ARRAYAGG(task_id)
+                    FROM task_tombstones
+                    WHERE project_id = %s AND change_version > %s) AS deleted_ids
+            FROM projects
+            WHERE id = %s
+        """, (project_id, since_version, project_id), fetch=True, primary=True)
+        changed = execute_query("""
+            SELECT * FROM tasks
+            WHERE project_id = %s AND change_version > %s
+        """, (project_id, since_version), fetch=True, row_type=Task, primary=True)
+
+    if not meta or changed is None:
+        return None
+
+    return {
+        'changed': changed,
+        'deleted': json.loads(meta[0]['deleted_ids'] or '[]'),
+        'version': meta[0]['data_version']
+    }
+
+
+# 세션이 함께 쓰는 Kanban 보드 {project_id: {'data_version', 'synced_at', 'tasks': {id: Task}, 'sorted': [Task]}}
+_boards: OrderedDict = OrderedDict()
+_boards_lock = threading.Lock()
+
+
+def get_board_tasks(project_id: int) -> Optional[List[Task]]:
+    """
+    Kanban 보드 태스크 조회 (프로세스 안의 모든 세션이 프로젝트별 보드 하나를 공유)
+
+    프로젝트 데이터 버전이 같으면 보관한 보드를 그대로 반환하고, 바뀌었으면
+    보드의 버전 이후 변경 피드(get_tasks_changed_since)만 적용한 새 보드로 교체한다.
+    최근 KANBAN_BOARD_CACHE_SIZE개 프로젝트만 보관하며 세션에는 보드를 저장하지 않는다.
+    반환된 리스트와 태스크는 다른 세션과 공유하므로 수정하면 안 된다.
+
+    Args:
+        project_id: 프로젝트 ID
+
+    Returns:
+        list: 생성일 역순 Task 리스트 또는 None (조회 실패)
+    """
+    data_version = get_project_version(project_id)
+    if data_version is None:
+        return None
+
+    with _boards_lock:
+        board = _boards.get(project_id)
+        if board is not None:
+            _boards.move_to_end(project_id)
+
+    # 오래 갱신하지 않은 보드는 그 사이 삭제 기록이 정리되었을 수 있으므로 전체를 다시 읽음
+    if board is not None and time.time() - board['synced_at'] > KANBAN_BOARD_MAX_IDLE_SECONDS:
+        board = None
+
+    with metrics.track_cache("kanban_board"):
+        if board is not None and board['data_version'] >= data_version:
+            return board['sorted']
+        metrics.mark_cache_miss()
+        changes = get_tasks_changed_since(project_id, board['data_version'] if board else None)
+
+    if changes is None:
+        return None
+
+    # 다른 세션이 읽는 중일 수 있으므로 기존 보드는 고치지 않고 새로 만들어 교체
+    tasks = utils.apply_task_changes(dict(board['tasks']) if board else {}, changes)
+    updated = {
+        'data_version': changes['version'],
+        'synced_at': time.time(),
+        'tasks': tasks,
+        'sorted': utils.sort_tasks_by_created(list(tasks.values())),
+    }
+
+    with _boards_lock:
+        current = _boards.get(project_id)
+        if current is None or current['data_version'] <= updated['data_version']:
+            _boards[project_id] = updated
+            _boards.move_to_end(project_id)
+            while len(_boards) > KANBAN_BOARD_CACHE_SIZE:
+                _boards.popitem(last=False)
+
+    return updated['sorted']
+
+
+def prune_task_tombstones(older_than_days: int = 7) -> int:
+    """
+    오래된 태스크 삭제 기록 정리
+
+    Args:
+        older_than_days: 이 일수보다 오래된 기록 삭제
+
+    Returns:
+        int: 삭제된 기록 개수
+    """
+    query = "DELETE FROM task_tombstones WHERE deleted_at < NOW(6) - INTERVAL %s DAY"
+    result = execute_query(query, (older_than_days,))
+    return result or 0
+
+
+def count_tasks(project_id: int, status: str = None) -> int:
+    """
+    태스크 개수 세기
+
+    Args:
+        project_id: 프로젝트 ID
+        status: 필터링할 상태 (None이면 전체)
+
+    Returns:
+        int: 태스크 개수
+    """
+    if status:
+        query = "SELECT COUNT(*) as count FROM tasks WHERE project_id = %s AND status = %s"
+        params = (project_id, status)
+    else:
+        query = "SELECT COUNT(*) as count FROM tasks WHERE project_id = %s"
+        params = (project_id,)
+
+    result = execute_query(query, params, fetch=True)
+    return result[0]['count'] if result else 0
+
+
+# ========================================
+# 태스크 이벤트 로그 / 보드 기록
+# ========================================
+
+def _log_task_events(event_type: str, task_ids: List[int], new_status: str = None) -> Optional[int]:
+    """
+    태스크 이벤트를 task_events에 기록 (한 번의 INSERT ... SELECT로 여러 태스크를 배치 기록)
+
+    tasks 행에서 프로젝트/제목/이전 상태를 읽으므로 상태 변경·삭제 쿼리보다 먼저,
+    같은 transaction() 안에서 호출한다. 상태 변경은 이미 같은 상태인 태스크를 건너뛴다.
+
+    Args:
+        event_type: 'created', 'status_changed', 'deleted'
+        task_ids: 태스크 ID 리스트
+        new_status: 새 상태 (status_changed일 때)
+
+    Returns:
+        int: 쿼리 결과 또는 None (실패 시, 트랜잭션 전체 롤백)
+    """
+    if event_type == 'created':
+        statuses, condition = "NULL, status", ""
+        params = (event_type, *task_ids)
+    elif event_type == 'status_changed':
+        statuses, condition = "status, %s", " AND status <> %s"
+        params = (event_type, new_status, *task_ids, new_status)
+    else:
+        statuses, condition = "status, NULL", ""
+        params = (event_type, *task_ids)
+
+    query = f"""
+        INSERT INTO task_events (project_id, task_id, event_type, from_status, to_status, title)
+        SELECT project_id, id, %s, {statuses}, title
+        FROM tasks
+        WHERE id IN ({_in_placeholders(task_ids)}){condition}
+        ORDER BY id
+    """
+    return execute_query(query, params)
+
+
+def _replay_board(project_id: int, as_of: datetime,
+                  settled_only: bool = False) -> Tuple[Dict[int, list], Optional[Dict], int]:
+    """
+    가장 가까운 이전 스냅샷에서 시작해 as_of까지의 이벤트를 재생 (primary에서 읽기만 함)
+
+    settled_only=True면 BOARD_EVENT_SETTLE_SECONDS 안의 최근 이벤트가 나오는 곳에서 멈춘다.
+    이벤트 ID는 커밋 순서가 아니라 INSERT 순서이므로, 스냅샷은 이렇게 정착된 구간까지만
+    저장해야 작은 ID의 이벤트가 늦게 커밋되어도 다음 재생에서 빠지지 않는다.
+
+    Returns:
+        tuple: (보드 상태 {태스크 ID: [상태, 제목]}, 마지막으로 재생한 이벤트 또는 None, 재생한 이벤트 수)
+
+    Raises:
+        _QueryFailed: 조회 실패
+    """
+    snapshot = _require(execute_query("""
+        SELECT last_event_id, last_occurred_at, state
+        FROM board_snapshots
+        WHERE project_id = %s AND last_occurred_at <= %s
+        ORDER BY last_occurred_at DESC, last_event_id DESC
+        LIMIT 1
+    """, (project_id, as_of), fetch=True, primary=True))
+
+    if snapshot:
+        state = {int(task_id): value for task_id, value in json.loads(snapshot[0]['state']).items()}
+        after_id, after_time = snapshot[0]['last_event_id'], snapshot[0]['last_occurred_at']
+    else:
+        state, after_id, after_time = {}, 0, datetime(1970, 1, 2)
+
+    # 이벤트 ID 순서가 발생 순서와 같으므로 스냅샷 이후 구간만 인덱스로 읽음
+    # settled: BOARD_EVENT_SETTLE_SECONDS보다 오래된 이벤트 (더 작은 ID가 늦게 커밋될 수 없는 구간)
+    events = _require(execute_query("""
+        SELECT id, task_id, event_type, to_status, title, occurred_at,
+               occurred_at < NOW(6) - INTERVAL %s SECOND AS settled
+        FROM task_events
+        WHERE project_id = %s AND occurred_at >= %s AND occurred_at <= %s AND id > %s
+        ORDER BY id
+    """, (BOARD_EVENT_SETTLE_SECONDS, project_id, after_time, as_of, after_id), fetch=True, primary=True))
+
+    last_event = None
+    replayed = 0
+    for event in events:
+        if settled_only and not event['settled']:
+            break
+        if event['event_type'] == 'deleted':
+            state.pop(event['task_id'], None)
+        else:
+            state[event['task_id']] = [event['to_status'], event['title']]
+        last_event = event
+        replayed += 1
+
+    return state, last_event, replayed
+
+
+def _reconstruct_board(project_id: int, as_of: datetime) -> Dict[int, list]:
+    """
+    as_of 시점의 보드 상태 재구성 (읽기 전용, 스냅샷은 take_board_snapshots()만 저장)
+
+    Returns:
+        dict: {태스크 ID: [상태, 제목]}
+
+    Raises:
+        _QueryFailed: 조회 실패
+    """
+    state, _, _ = _replay_board(project_id, as_of)
+    return state
 
-    result = execute_query(query, tuple(values))
-    return result is not None and result > 0
 
+@st.cache_data(show_spinner=False, max_entries=64)
+@cache_backend.shared("board_history")
+def _load_board_as_of(project_id: int, as_of: datetime, cache_generation: int) -> Dict[int, list]:
+    """지난 시점의 보드 (이벤트는 덧붙이기만 하므로 지난 시점의 결과는 바뀌지 않아 캐시)"""
+    metrics.mark_cache_miss()
+    return _reconstruct_board(project_id, as_of)
 
-def update_task_status(task_id: int, new_status: str) -> bool:
+
+def get_board_as_of(project_id: int, as_of: datetime) -> Optional[Dict[str, List[Dict]]]:
     """
-    태스크 상태 변경 (시간 자동 기록)
+    특정 시점의 Kanban 보드 조회 (task_events 재생)
+
+    가장 가까운 이전 보드 스냅샷에서 시작해 그 뒤의 이벤트만 재생하므로
+    스냅샷을 주기적으로 저장하면 (maintenance.py snapshot-boards) 이력이 길어도
+    재생량은 BOARD_SNAPSHOT_EVENTS개 안팎이다. 조회만 하고 스냅샷은 저장하지 않는다.
+    BOARD_EVENT_SETTLE_SECONDS보다 지난 시점의 결과는 캐시한다.
 
     Args:
-        task_id: 태스크 ID
-        new_status: 새 상태 (todo/in_progress/done)
+        project_id: 프로젝트 ID
+        as_of: 기준 시각
 
     Returns:
-        bool: 성공 여부
+        dict: {'todo': [...], 'in_progress': [...], 'done': [...]}
+              각 항목은 {'id', 'title'} (ID 순), 조회 실패 시 None
     """
-    updates = {'status': new_status}
+    try:
+        if as_of < datetime.now() - timedelta(seconds=BOARD_EVENT_SETTLE_SECONDS):
+            with metrics.track_cache("board_history"):
+                state = _load_board_as_of(project_id, as_of, cache_backend.generation("board_history"))
+        else:
+            state = _reconstruct_board(project_id, as_of)
+    except _QueryFailed:
+        return None
 
-    if new_status == 'in_progress':
-        updates['started_at'] = datetime.now()
-    elif new_status == 'done':
-        updates['completed_at'] = datetime.now()
+    board = {'todo': [], 'in_progress': [], 'done': []}
+    for task_id in sorted(state):
+        status, title = state[task_id]
+        board[status].append({'id': task_id, 'title': title})
 
-    return update_task(task_id, **updates)
+    return board
 
 
-def delete_task(task_id: int) -> bool:
+def get_task_events(project_id: int, since: datetime, until: datetime,
+                    limit: int = 200) -> List[Dict]:
     """
-    태스크 삭제
+    기간 내 태스크 이벤트 조회 (오래된 순)
 
     Args:
-        task_id: 태스크 ID
+        project_id: 프로젝트 ID
+        since: 시작 시각 (포함)
+        until: 끝 시각 (포함)
+        limit: 최대 개수
 
     Returns:
-        bool: 성공 여부
+        list: 이벤트 리스트 (event_type, task_id, title, from_status, to_status, occurred_at)
     """
-    query = "DELETE FROM tasks WHERE id = %s"
-    result = execute_query(query, (task_id,))
-    return result is not None and result > 0
+    query = """
+        SELECT id, task_id, event_type, from_status, to_status, title, occurred_at
+        FROM task_events
+        WHERE project_id = %s AND occurred_at >= %s AND occurred_at <= %s
+        ORDER BY id
+        LIMIT %s
+    """
+    result = execute_query(query, (project_id, since, until, limit), fetch=True)
+    return result or []
 
 
-def count_tasks(project_id: int, status: str = None) -> int:
+def take_board_snapshots(min_events: int = BOARD_SNAPSHOT_EVENTS) -> int:
     """
-    태스크 개수 세기
+    마지막 스냅샷 이후 이벤트가 min_events개 이상 쌓인 프로젝트의 보드를 스냅샷으로 저장
+
+    primary에서 읽은 이벤트를 정착된 구간(BOARD_EVENT_SETTLE_SECONDS보다 오래된 이벤트)까지만
+    재생해 저장한다. 보드 스냅샷을 쓰는 곳은 이 함수뿐이다 (maintenance.py snapshot-boards).
 
     Args:
-        project_id: 프로젝트 ID
-        status: 필터링할 상태 (None이면 전체)
+        min_events: 스냅샷을 만들 최소 이벤트 수
 
     Returns:
-        int: 태스크 개수
-    """
-    if status:
-        query = "SELECT COUNT(*) as count FROM tasks WHERE project_id = %s AND status = %s"
-        params = (project_id, status)
-    else:
-        query = "SELECT COUNT(*) as count FROM tasks WHERE project_id = %s"
-        params = (project_id,)
-
-    result = execute_query(query, params, fetch=True)
-    return result[0]['count'] if result else 0
+        int: 스냅샷을 저장한 프로젝트 수
+    """
+    pending = execute_query("""
+        SELECT e.project_id
+        FROM task_events e
+        LEFT JOIN (
+            SELECT project_id, MAX(last_event_id) AS last_event_id
+            FROM board_snapshots
+            GROUP BY project_id
+        ) s ON s.project_id = e.project_id
+        WHERE e.id > COALESCE(s.last_event_id, 0)
+        GROUP BY e.project_id
+        HAVING COUNT(*) >= %s
+    """, (min_events,), fetch=True, primary=True)
+
+    taken = 0
+    for row in pending or []:
+        try:
+            state, last_event, replayed = _replay_board(row['project_id'], datetime.now(), settled_only=True)
+        except _QueryFailed:
+            continue
+        if replayed < min_events:
+            continue
+
+        result = execute_query("""
+            INSERT INTO board_snapshots (project_id, last_event_id, last_occurred_at, state)
+            VALUES (%s, %s, %s, %s)
+        """, (row['project_id'], last_event['id'], last_event['occurred_at'],
+              json.dumps(state, ensure_ascii=False)))
+        if result is not None:
+            taken += 1
+
+    return taken
 
 
 # ========================================
@@ -387,7 +1529,7 @@ def insert_checklist_item(task_id: int, content: str, is_checked: bool = False)
     return execute_query(query, params)
 
 
-def get_checklist_items(task_id: int) -> List[Dict]:
+def get_checklist_items(task_id: int) -> List[ChecklistItem]:
     """
     태스크의 체크리스트 항목 조회
 
@@ -395,13 +1537,43 @@ def get_checklist_items(task_id: int) -> List[Dict]:
         task_id: 태스크 ID
 
     Returns:
-        list: 체크리스트 항목 리스트
+        list: ChecklistItem 리스트
     """
     query = "SELECT * FROM checklist_items WHERE task_id = %s ORDER BY created_at"
-    result = execute_query(query, (task_id,), fetch=True)
+    result = execute_query(query, (task_id,), fetch=True, row_type=ChecklistItem)
     return result or []
 
 
+def get_checklist_counts(task_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """
+    여러 태스크의 체크리스트 진행 현황을 한 번에 조회
+
+    Args:
+        task_ids: 태스크 ID 리스트
+
+    Returns:
+        dict: 태스크 ID별 {'checked': int, 'total': int}
+              (체크리스트가 없는 태스크는 포함되지 않음)
+    """
+    if not task_ids:
+        return {}
+
+    query = f"""
+        SELECT task_id,
+               SUM(is_checked) AS checked,
+               COUNT(*) AS total
+        FROM checklist_items
+        WHERE task_id IN ({_in_placeholders(task_ids)})
+        GROUP BY task_id
+    """
+    result = execute_query(query, tuple(task_ids), fetch=True)
+
+    return {
+        row['task_id']: {'checked': int(row['checked'] or 0), 'total': int(row['total'])}
+        for row in result or []
+    }
+
+
 def update_checklist_item(item_id: int, is_checked: bool) -> bool:
     """
     체크리스트 항목 체크 상태 변경
@@ -459,22 +1631,32 @@ def insert_milestone(project_id: int, title: str, description: str = None,
     return execute_query(query, params)
 
 
-def get_milestones(project_id: int) -> List[Dict]:
+def get_milestones(project_id: int, include_archived: bool = False) -> List[Milestone]:
     """
     프로젝트의 마일스톤 목록 조회
 
     Args:
         project_id: 프로젝트 ID
+        include_archived: True면 현재 테이블에 없을 때 보관 테이블에서 조회
 
     Returns:
-        list: 마일스톤 리스트
+        list: Milestone 리스트
     """
     query = """
         SELECT * FROM milestones
         WHERE project_id = %s
         ORDER BY target_date
     """
-    result = execute_query(query, (project_id,), fetch=True)
+    result = execute_query(query, (project_id,), fetch=True, row_type=Milestone)
+    if result or not include_archived:
+        return result or []
+
+    query = f"""
+        SELECT {', '.join(Milestone.FIELDS)} FROM milestones_archive
+        WHERE project_id = %s
+        ORDER BY target_date
+    """
+    result = execute_query(query, (project_id,), fetch=True, row_type=Milestone)
     return result or []
 
 
@@ -557,6 +1739,12 @@ def get_retrospective(project_id: int) -> Optional[Dict]:
     """
     query = "SELECT * FROM retrospectives WHERE project_id = %s"
     result = execute_query(query, (project_id,), fetch=True)
+    if result:
+        return result[0]
+
+    # 보관된 프로젝트의 회고 (읽기 전용)
+    query = "SELECT * FROM retrospectives_archive WHERE project_id = %s"
+    result = execute_query(query, (project_id,), fetch=True)
     return result[0] if result else None
 
 
@@ -587,6 +1775,25 @@ def update_retrospective(project_id: int, keep_content: str = None,
     return result is not None and result > 0
 
 
+def iter_all_retrospectives(batch_size: int = 500):
+    """
+    모든 회고를 스트리밍으로 조회 (내보내기 등 대용량 처리용)
+
+    Args:
+        batch_size: 한 번에 가져올 행 수
+
+    Returns:
+        iterator: 회고 행 이터레이터 (프로젝트명 포함)
+    """
+    query = """
+        SELECT r.*, p.name as project_name
+        FROM retrospectives r
+        JOIN projects p ON r.project_id = p.id
+        ORDER BY r.created_at DESC
+    """
+    return execute_query(query, stream=True, batch_size=batch_size)
+
+
 def get_all_retrospectives() -> List[Dict]:
     """
     모든 회고 조회 (프로젝트 정보 포함)
@@ -604,6 +1811,660 @@ def get_all_retrospectives() -> List[Dict]:
     return result or []
 
 
+def get_user_retrospectives(user_id: int, limit: int = 10, before: tuple = None,
+                            preview_length: int = 80) -> tuple:
+    """
+    사용자의 회고 목록 조회 (미리보기만, 키셋 페이지네이션)
+
+    KPT 본문 전체 대신 앞부분 미리보기만 가져온다.
+    전체 내용은 get_retrospective()로 펼친 항목만 조회한다.
+    보관된 프로젝트의 회고도 함께 조회한다.
+
+    Args:
+        user_id: 사용자 ID
+        limit: 페이지 크기
+        before: 이전 페이지의 마지막 (created_at, id) - None이면 첫 페이지
+        preview_length: 미리보기 글자 수
+
+    Returns:
+        tuple: (회고 미리보기 리스트, 다음 페이지 커서 또는 None)
+    """
+    conditions = ["p.user_id = %s"]
+    branch_params = [preview_length] * 4 + [user_id]
+
+    if before:
+        conditions.append("(r.created_at < %s OR (r.created_at = %s AND r.id < %s))")
+        branch_params.extend([before[0], before[0], before[1]])
+
+    # 현재 테이블과 보관 테이블에 같은 조건을 걸어 각각 인덱스를 타게 함
+    branch = """
+        SELECT r.id, r.project_id, p.name AS project_name,
+               r.created_at, r.updated_at,
+               LEFT(r.keep_content, %s) AS keep_preview,
+               LEFT(r.problem_content, %s) AS problem_preview,
+               LEFT(r.try_content, %s) AS try_preview,
+               LEFT(r.learning_content, %s) AS learning_preview
+        FROM {projects} p
+        JOIN {retrospectives} r ON r.project_id = p.id
+        WHERE {conditions}
+    """
+    where = ' AND '.join(conditions)
+    query = f"""
+        {branch.format(projects='projects', retrospectives='retrospectives', conditions=where)}
+        UNION ALL
+        {branch.format(projects='projects_archive', retrospectives='retrospectives_archive', conditions=where)}
+        ORDER BY created_at DESC, id DESC
+        LIMIT %s
+    """
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    params = branch_params * 2 + [limit + 1]
+
+    result = execute_query(query, tuple(params), fetch=True) or []
+
+    if len(result) > limit:
+        result = result[:limit]
+        last = result[-1]
+        return result, (last['created_at'], last['id'])
+
+    return result, None
+
+
+# ========================================
+# 보관 (아카이브)
+# ========================================
+
+# 보관 테이블로 옮길 회고 컬럼 (회고는 행 모델 없이 딕셔너리로 조회)
+_RETROSPECTIVE_FIELDS = ('id', 'project_id', 'keep_content', 'problem_content',
+                         'try_content', 'learning_content', 'created_at', 'updated_at')
+
+
+def _run_in_transaction(statements: List[tuple]) -> Optional[int]:
+    """
+    여러 쿼리를 한 트랜잭션으로 실행 (하나라도 실패하면 전체 롤백)
+
+    Args:
+        statements: (쿼리, 파라미터) 튜플 리스트
+
+    Returns:
+        int: 마지막 쿼리의 결과 (lastrowid 또는 rowcount) 또는 None (실패 시)
+    """
+    result = None
+    with transaction() as tx:
+        for query, params in statements:
+            result = execute_query(query, params)
+
+    return None if tx.failed else result
+
+
+def _copy_statement(table: str, columns: tuple, where: str, source_alias: str = None) -> str:
+    """원본 테이블의 행을 보관 테이블로 복사하는 INSERT ... SELECT 쿼리 생성"""
+    prefix = f"{source_alias}." if source_alias else ""
+    select_columns = ', '.join(f"{prefix}{column}" for column in columns)
+    return f"""
+        INSERT INTO {table}_archive ({', '.join(columns)})
+        SELECT {select_columns} FROM {table} {source_alias or ''}
+        {where}
+    """
+
+
+def archive_done_tasks(older_than_days: int = 90, batch_size: int = 100) -> int:
+    """
+    오래된 완료 태스크를 보관 테이블로 이동 (배치 단위, 중단 후 재실행 가능)
+
+    완료된 지 older_than_days일이 지난 태스크와 체크리스트를 tasks_archive,
+    checklist_items_archive로 옮기고 원본에서 삭제한다. 배치마다 별도
+    트랜잭션이므로 중간에 멈춰도 다시 실행하면 남은 태스크부터 이어서 처리한다.
+    보관된 태스크는 프로젝트 카운터(task_done 등)에 계속 포함된다.
+
+    Args:
+        older_than_days: 완료 후 경과 일수 기준
+        batch_size: 한 트랜잭션에서 옮길 태스크 수
+
+    Returns:
+        int: 보관된 태스크 개수
+    """
+    archived = 0
+
+    while True:
+        query = """
+            SELECT id FROM tasks
+            WHERE status = 'done' AND completed_at < NOW() - INTERVAL %s DAY
+            ORDER BY id
+            LIMIT %s
+        """
+        rows = execute_query(query, (older_than_days, batch_size), fetch=True)
+        if not rows:
+            break
+
+        task_ids = tuple(row['id'] for row in rows)
+        placeholders = _in_placeholders(task_ids)
+
+        result = _run_in_transaction([
+            # 삭제 트리거가 카운터를 줄이지 않도록 표시 (migration_add_archive_tables.sql)
+            ("SET @archiving = 1", None),
+            (_copy_statement('tasks', Task.FIELDS, f"WHERE id IN ({placeholders})"), task_ids),
+            (_copy_statement('checklist_items', ChecklistItem.FIELDS,
+                             f"WHERE task_id IN ({placeholders})"), task_ids),
+            (f"DELETE FROM tasks WHERE id IN ({placeholders})", task_ids),
+            ("SET @archiving = NULL", None),
+        ])
+        if result is None:
+            break
+
+        archived += len(task_ids)
+        if len(task_ids) < batch_size:
+            break
+
+    return archived
+
+
+def archive_completed_projects(older_than_days: int = 180, batch_size: int = 100) -> int:
+    """
+    오래된 완료 프로젝트를 보관 테이블로 이동 (배치 단위, 중단 후 재실행 가능)
+
+    상태가 completed이고 마지막 변경 후 older_than_days일이 지난 프로젝트와
+    태스크, 체크리스트, 마일스톤, 회고를 각 보관 테이블로 옮긴 뒤 원본 프로젝트를
+    삭제한다 (하위 데이터는 CASCADE로 삭제). 보관된 프로젝트는 get_project() 등으로
+    읽기 전용 조회할 수 있다.
+
+    Args:
+        older_than_days: 마지막 변경 후 경과 일수 기준
+        batch_size: 한 트랜잭션에서 옮길 프로젝트 수
+
+    Returns:
+        int: 보관된 프로젝트 개수
+    """
+    archived = 0
+
+    while True:
+        query = """
+            SELECT id FROM projects
+            WHERE status = 'completed' AND updated_at < NOW() - INTERVAL %s DAY
+            ORDER BY id
+            LIMIT %s
+        """
+        rows = execute_query(query, (older_than_days, batch_size), fetch=True)
+        if not rows:
+            break
+
+        project_ids = tuple(row['id'] for row in rows)
+        placeholders = _in_placeholders(project_ids)
+
+        result = _run_in_transaction([
+            (_copy_statement('projects', Project.FIELDS, f"WHERE id IN ({placeholders})"), project_ids),
+            (_copy_statement('tasks', Task.FIELDS, f"WHERE project_id IN ({placeholders})"), project_ids),
+            (_copy_statement('checklist_items', ChecklistItem.FIELDS,
+                             f"JOIN tasks t ON t.id = c.task_id WHERE t.project_id IN ({placeholders})",
+                             source_alias='c'), project_ids),
+            (_copy_statement('milestones', Milestone.FIELDS, f"WHERE project_id IN ({placeholders})"), project_ids),
+            (_copy_statement('retrospectives', _RETROSPECTIVE_FIELDS,
+                             f"WHERE project_id IN ({placeholders})"), project_ids),
+            (f"DELETE FROM projects WHERE id IN ({placeholders})", project_ids),
+        ])
+        if result is None:
+            break
+
+        archived += len(project_ids)
+        if len(project_ids) < batch_size:
+            break
+
+    return archived
+
+
+# ========================================
+# 포트폴리오 (전체 프로젝트 요약)
+# ========================================
+
+# data_version으로 캐시하는 조회 함수(_load_*)는 데이터를 primary에서 읽는다.
+# 지연된 레플리카의 결과가 새 버전으로 캐시되면 다음 쓰기까지 오래된 값이 남기 때문.
+
+class _QueryFailed(Exception):
+    """캐시되는 조회 함수에서 쿼리가 실패했음을 알리는 예외 (실패 결과는 캐시하지 않음)"""
+
+
+def _require(result):
+    """쿼리 결과가 None(실패)이면 _QueryFailed 발생"""
+    if result is None:
+        raise _QueryFailed()
+    return result
+
+
+def get_user_data_version(user_id: int) -> Optional[str]:
+    """
+    사용자의 전체 프로젝트 데이터 버전 조회
+
+    projects.data_version은 프로젝트와 하위 데이터가 바뀔 때마다
+    트리거로 증가하므로, 합계가 같으면 캐시된 결과를 그대로 쓸 수 있다.
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        str: 버전 문자열 또는 None (조회 실패)
+    """
+    query = """
+        SELECT COUNT(*) AS project_count,
+               COALESCE(SUM(data_version), 0) AS version_sum,
+               MAX(updated_at) AS last_updated
+        FROM projects
+        WHERE user_id = %s
+    """
+    result = execute_query(query, (user_id,), fetch=True)
+    if not result:
+        return None
+
+    row = result[0]
+    return f"{row['project_count']}:{row['version_sum']}:{row['last_updated']}"
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("portfolio")
+def _load_portfolio(user_id: int, today: date, data_version: str, cache_generation: int) -> List[Dict]:
+    """포트폴리오 집계 (data_version과 날짜가 같으면 캐시 사용)"""
+    metrics.mark_cache_miss()
+
+    projects = _require(execute_query("""
+        SELECT id, name, status, start_date, target_end_date,
+               task_total, task_todo, task_in_progress, task_done,
+               updated_at
+        FROM projects
+        WHERE user_id = %s
+        ORDER BY updated_at DESC
+    """, (user_id,), fetch=True, primary=True))
+
+    overdue_rows = _require(execute_query("""
+        SELECT t.project_id, COUNT(*) AS overdue_count
+        FROM tasks t
+        JOIN projects p ON p.id = t.project_id
+        WHERE p.user_id = %s AND t.status <> 'done' AND t.due_date < %s
+        GROUP BY t.project_id
+    """, (user_id, today), fetch=True, primary=True))
+
+    milestone_rows = _require(execute_query("""
+        SELECT project_id, title, target_date
+        FROM (
+            SELECT m.project_id, m.title, m.target_date,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY m.project_id ORDER BY m.target_date, m.id
+                   ) AS rn
+            FROM milestones m
+            JOIN projects p ON p.id = m.project_id
+            WHERE p.user_id = %s AND m.is_completed = FALSE
+        ) ranked
+        WHERE rn = 1
+    """, (user_id,), fetch=True, primary=True))
+
+    overdue_by_project = {row['project_id']: row['overdue_count'] for row in overdue_rows}
+    milestone_by_project = {row['project_id']: row for row in milestone_rows}
+
+    portfolio = []
+    for project in projects:
+        milestone = milestone_by_project.get(project['id'])
+        portfolio.append({
+            **project,
+            'overdue_count': overdue_by_project.get(project['id'], 0),
+            'next_milestone': {
+                'title': milestone['title'],
+                'target_date': milestone['target_date']
+            } if milestone else None,
+            'last_activity': project['updated_at']
+        })
+
+    return portfolio
+
+
+def get_portfolio(user_id: int) -> List[Dict]:
+    """
+    사용자의 전체 프로젝트 요약 조회 (진행률, 지연 태스크, 다음 마일스톤, 최근 활동)
+
+    프로젝트 수와 관계없이 버전 확인 1회 + 집계 쿼리 3회로 계산하며,
+    데이터 버전과 날짜가 바뀌지 않았으면 캐시된 결과를 반환한다
+    (지연 태스크 수는 날짜가 바뀌면 달라지므로 날짜도 캐시 키에 포함).
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        list: 프로젝트별 요약 리스트 (최근 활동 순)
+    """
+    data_version = get_user_data_version(user_id)
+    if data_version is None:
+        return []
+
+    try:
+        with metrics.track_cache("portfolio"):
+            return _load_portfolio(user_id, date.today(), data_version,
+                                   cache_backend.generation("portfolio"))
+    except _QueryFailed:
+        return []
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("deadlines")
+def _load_upcoming_deadlines(user_id: int, days: int, today: date, data_version: str,
+                             cache_generation: int) -> List[Dict]:
+    """마감일 조회 (data_version과 날짜가 같으면 캐시 사용)"""
+    metrics.mark_cache_miss()
+
+    return _require(execute_query("""
+        SELECT 'task' AS kind, t.id, t.project_id, p.name AS project_name,
+               t.title, t.due_date AS due_date
+        FROM projects p
+        JOIN tasks t ON t.project_id = p.id
+        WHERE p.user_id = %s AND p.status <> 'completed'
+          AND t.status <> 'done'
+          AND t.due_date <= %s + INTERVAL %s DAY
+        UNION ALL
+        SELECT 'milestone' AS kind, m.id, m.project_id, p.name AS project_name,
+               m.title, m.target_date AS due_date
+        FROM projects p
+        JOIN milestones m ON m.project_id = p.id
+        WHERE p.user_id = %s AND p.status <> 'completed'
+          AND m.is_completed = FALSE
+          AND m.target_date <= %s + INTERVAL %s DAY
+        ORDER BY due_date, kind, id
+    """, (user_id, today, days, user_id, today, days), fetch=True, primary=True))
+
+
+def get_upcoming_deadlines(user_id: int, days: int = 7) -> Dict[str, List[Dict]]:
+    """
+    사용자의 전체 프로젝트에서 지난/오늘/다가오는 마감 조회 (태스크 + 마일스톤)
+
+    완료되지 않은 태스크와 마일스톤을 한 번의 쿼리로 조회한다.
+    완료된 프로젝트는 제외한다.
+
+    Args:
+        user_id: 사용자 ID
+        days: 오늘부터 며칠 뒤까지 포함할지
+
+    Returns:
+        dict: {'overdue': list, 'today': list, 'upcoming': list}
+              각 항목은 kind('task'/'milestone'), id, project_id, project_name,
+              title, due_date를 가짐
+    """
+    deadlines = {'overdue': [], 'today': [], 'upcoming': []}
+
+    data_version = get_user_data_version(user_id)
+    if data_version is None:
+        return deadlines
+
+    today = date.today()
+
+    try:
+        with metrics.track_cache("deadlines"):
+            rows = _load_upcoming_deadlines(user_id, days, today, data_version,
+                                            cache_backend.generation("deadlines"))
+    except _QueryFailed:
+        return deadlines
+
+    for row in rows:
+        if row['due_date'] < today:
+            deadlines['overdue'].append(row)
+        elif row['due_date'] == today:
+            deadlines['today'].append(row)
+        else:
+            deadlines['upcoming'].append(row)
+
+    return deadlines
+
+
+# ========================================
+# 흐름 지표 (사이클 타임 / 리드 타임)
+# ========================================
+
+# 완료 태스크별 사이클 타임(시작 → 완료)과 리드 타임(생성 → 완료), 시간 단위 (보관된 태스크 포함)
+# 시작 기록이 없거나 완료보다 늦으면 사이클 타임은 NULL
+_FLOW_DURATIONS = """
+    SELECT priority, tags, completed_at,
+           CASE WHEN started_at <= completed_at
+                THEN TIMESTAMPDIFF(SECOND, started_at, completed_at) / 3600 END AS cycle_hours,
+           CASE WHEN created_at <= completed_at
+                THEN TIMESTAMPDIFF(SECOND, created_at, completed_at) / 3600 END AS lead_hours
+    FROM tasks
+    WHERE project_id = %s AND status = 'done' AND completed_at IS NOT NULL
+    UNION ALL
+    SELECT priority, tags, completed_at,
+           CASE WHEN started_at <= completed_at
+                THEN TIMESTAMPDIFF(SECOND, started_at, completed_at) / 3600 END,
+           CASE WHEN created_at <= completed_at
+                THEN TIMESTAMPDIFF(SECOND, created_at, completed_at) / 3600 END
+    FROM tasks_archive
+    WHERE project_id = %s AND status = 'done' AND completed_at IS NOT NULL
+"""
+
+
+def _hours(value) -> Optional[float]:
+    """집계 결과(Decimal/None)를 소수 첫째 자리 시간으로 변환"""
+    return None if value is None else round(float(value), 1)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("flow_metrics")
+def _load_flow_metrics(project_id: int, since: date, data_version: int, cache_generation: int) -> Dict:
+    """흐름 지표 집계 (data_version과 추이 시작일이 같으면 캐시 사용)"""
+    metrics.mark_cache_miss()
+
+    # 백분위수는 CUME_DIST()로 nearest-rank 방식 계산 (누적 비율이 처음으로 p 이상이 되는 값)
+    # 태그는 쉼표 구분 문자열이므로 JSON 배열로 바꿔 JSON_TABLE로 펼침
+    stat_rows = _require(execute_query(f"""
+        WITH durations AS ({_FLOW_DURATIONS}),
+        grouped AS (
+            SELECT 'project' AS dimension, '' AS grp, cycle_hours, lead_hours
+            FROM durations
+            UNION ALL
+            SELECT 'priority', priority, cycle_hours, lead_hours
+            FROM durations
+            UNION ALL
+            SELECT 'tag', TRIM(jt.tag) COLLATE utf8mb4_unicode_ci, d.cycle_hours, d.lead_hours
+            FROM durations d,
+                 JSON_TABLE(CONCAT('[', REPLACE(JSON_QUOTE(d.tags), ',', '","'), ']'),
+                            '$[*]' COLUMNS (tag VARCHAR(100) PATH '$')) jt
+            WHERE d.tags IS NOT NULL AND TRIM(jt.tag) <> ''
+        ),
+        samples AS (
+            SELECT dimension, grp, 'cycle' AS metric, cycle_hours AS hours
+            FROM grouped WHERE cycle_hours IS NOT NULL
+            UNION ALL
+            SELECT dimension, grp, 'lead', lead_hours
+            FROM grouped WHERE lead_hours IS NOT NULL
+        ),
+        ranked AS (
+            SELECT dimension, grp, metric, hours,
+                   CUME_DIST() OVER (PARTITION BY dimension, grp, metric ORDER BY hours) AS cd
+            FROM samples
+        )
+        SELECT dimension, grp, metric,
+               COUNT(*) AS sample_count,
+               AVG(hours) AS avg_hours,
+               MIN(CASE WHEN cd >= 0.5 THEN hours END) AS p50_hours,
+               MIN(CASE WHEN cd >= 0.85 THEN hours END) AS p85_hours,
+               MAX(hours) AS max_hours
+        FROM ranked
+        GROUP BY dimension, grp, metric
+    """, (project_id, project_id), fetch=True, primary=True))
+
+    week_rows = _require(execute_query(f"""
+        WITH durations AS ({_FLOW_DURATIONS}),
+        ranked AS (
+            SELECT YEARWEEK(completed_at, 3) AS year_week,
+                   DATE(completed_at) - INTERVAL WEEKDAY(completed_at) DAY AS week_start,
+                   cycle_hours, lead_hours,
+                   CUME_DIST() OVER (
+                       PARTITION BY YEARWEEK(completed_at, 3), cycle_hours IS NULL ORDER BY cycle_hours
+                   ) AS cycle_cd,
+                   CUME_DIST() OVER (
+                       PARTITION BY YEARWEEK(completed_at, 3), lead_hours IS NULL ORDER BY lead_hours
+                   ) AS lead_cd
+            FROM durations
+            WHERE completed_at >= %s
+        )
+        SELECT year_week, MIN(week_start) AS week_start,
+               COUNT(*) AS completed,
+               MIN(CASE WHEN cycle_cd >= 0.5 THEN cycle_hours END) AS cycle_p50_hours,
+               MIN(CASE WHEN lead_cd >= 0.5 THEN lead_hours END) AS lead_p50_hours
+        FROM ranked
+        GROUP BY year_week
+        ORDER BY year_week
+    """, (project_id, project_id, since), fetch=True, primary=True))
+
+    flow = {'cycle': None, 'lead': None, 'by_priority': {}, 'by_tag': {}, 'weekly': []}
+
+    for row in stat_rows:
+        stats = {
+            'count': row['sample_count'],
+            'avg': _hours(row['avg_hours']),
+            'p50': _hours(row['p50_hours']),
+            'p85': _hours(row['p85_hours']),
+            'max': _hours(row['max_hours']),
+        }
+        if row['dimension'] == 'project':
+            flow[row['metric']] = stats
+        else:
+            groups = flow['by_priority'] if row['dimension'] == 'priority' else flow['by_tag']
+            groups.setdefault(row['grp'], {'cycle': None, 'lead': None})[row['metric']] = stats
+
+    for row in week_rows:
+        flow['weekly'].append({
+            'week_start': row['week_start'],
+            'completed': row['completed'],
+            'cycle_p50': _hours(row['cycle_p50_hours']),
+            'lead_p50': _hours(row['lead_p50_hours']),
+        })
+
+    return flow
+
+
+def get_flow_metrics(project_id: int, weeks: int = FLOW_TREND_WEEKS) -> Optional[Dict]:
+    """
+    프로젝트의 사이클 타임(시작 → 완료)과 리드 타임(생성 → 완료) 통계 조회
+
+    완료된 태스크(보관된 태스크 포함)를 대상으로 MySQL 윈도 함수로 집계하며,
+    프로젝트 데이터 버전이 바뀌지 않았으면 캐시된 결과를 반환한다.
+
+    Args:
+        project_id: 프로젝트 ID
+        weeks: 주간 추이에 포함할 최근 주 수 (이번 주 포함)
+
+    Returns:
+        dict: {'cycle': 통계, 'lead': 통계,
+               'by_priority': {우선순위: {'cycle': 통계, 'lead': 통계}},
+               'by_tag': {태그: {'cycle': 통계, 'lead': 통계}},
+               'weekly': [{'week_start', 'completed', 'cycle_p50', 'lead_p50'}, ...]}
+              통계는 {'count', 'avg', 'p50', 'p85', 'max'} (시간 단위, 표본이 없으면 None)
+              조회 실패 시 None
+    """
+    data_version = get_project_version(project_id)
+    if data_version is None:
+        return None
+
+    # 이번 주 월요일 기준으로 weeks주 전부터 (같은 주 안에서는 캐시 키가 같음)
+    today = date.today()
+    since = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+
+    try:
+        with metrics.track_cache("flow_metrics"):
+            return _load_flow_metrics(project_id, since, data_version,
+                                      cache_backend.generation("flow_metrics"))
+    except _QueryFailed:
+        return None
+
+
+def get_daily_throughput(project_id: int, since: date) -> Optional[Dict[date, int]]:
+    """
+    날짜별 완료 태스크 수 조회 (완료 예측의 처리량 표본, 보관된 태스크 포함)
+
+    완료 예측은 프로젝트 데이터 버전으로 캐시되므로 레플리카 대신 primary에서 읽는다.
+
+    Args:
+        project_id: 프로젝트 ID
+        since: 이 날짜부터 (완료한 태스크가 없는 날은 결과에 없음)
+
+    Returns:
+        dict: {날짜: 완료 개수} 또는 None (조회 실패)
+    """
+    query = """
+        SELECT DATE(completed_at) AS day, COUNT(*) AS completed
+        FROM (
+            SELECT completed_at FROM tasks
+            WHERE project_id = %s AND status = 'done' AND completed_at >= %s
+            UNION ALL
+            SELECT completed_at FROM tasks_archive
+            WHERE project_id = %s AND status = 'done' AND completed_at >= %s
+        ) done
+        GROUP BY DATE(completed_at)
+    """
+    result = execute_query(query, (project_id, since, project_id, since), fetch=True, primary=True)
+    if result is None:
+        return None
+    return {row['day']: row['completed'] for row in result}
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("archived_task_stats")
+def _load_archived_task_stats(project_id: int, data_version: int, cache_generation: int) -> Dict:
+    """보관된 태스크 집계 (data_version이 같으면 캐시 사용, 보관 작업도 버전을 올림)"""
+    metrics.mark_cache_miss()
+
+    priority_rows = _require(execute_query("""
+        SELECT priority, COUNT(*) AS count
+        FROM tasks_archive
+        WHERE project_id = %s
+        GROUP BY priority
+    """, (project_id,), fetch=True, primary=True))
+
+    tag_rows = _require(execute_query("""
+        SELECT tags, COUNT(*) AS count
+        FROM tasks_archive
+        WHERE project_id = %s AND tags IS NOT NULL AND tags <> ''
+        GROUP BY tags
+    """, (project_id,), fetch=True, primary=True))
+
+    day_rows = _require(execute_query("""
+        SELECT DATE(completed_at) AS day, COUNT(*) AS count
+        FROM tasks_archive
+        WHERE project_id = %s AND status = 'done' AND completed_at IS NOT NULL
+        GROUP BY DATE(completed_at)
+    """, (project_id,), fetch=True, primary=True))
+
+    # 태그는 쉼표 구분 문자열이므로 같은 문자열끼리 센 뒤 나눠서 더함 (utils.get_tag_distribution과 같은 규칙)
+    tags = {}
+    for row in tag_rows:
+        for tag in (tag.strip() for tag in row['tags'].split(',')):
+            tags[tag] = tags.get(tag, 0) + row['count']
+
+    return {
+        'priority': {row['priority']: row['count'] for row in priority_rows},
+        'tags': tags,
+        'completed': {row['day']: row['count'] for row in day_rows},
+    }
+
+
+def get_archived_task_stats(project_id: int) -> Optional[Dict]:
+    """
+    보관된 태스크(tasks_archive)의 우선순위/태그/완료일 집계 (대시보드 차트용)
+
+    대시보드는 현재 태스크만 읽고 보관된 태스크는 이 집계만 더하므로,
+    보관된 태스크가 늘어도 매 실행마다 보관 테이블의 행을 읽지 않는다.
+
+    Args:
+        project_id: 프로젝트 ID
+
+    Returns:
+        dict: {'priority': {우선순위: 개수}, 'tags': {태그: 개수}, 'completed': {날짜: 완료 개수}}
+              또는 None (조회 실패)
+    """
+    data_version = get_project_version(project_id)
+    if data_version is None:
+        return None
+
+    try:
+        with metrics.track_cache("archived_task_stats"):
+            return _load_archived_task_stats(project_id, data_version,
+                                             cache_backend.generation("archived_task_stats"))
+    except _QueryFailed:
+        return None
+
+
 # ========================================
 # 사용자 인증 관련 함수
 # ========================================
@@ -672,21 +2533,39 @@ def verify_user(email: str, password: str) -> Optional[Dict]:
     Returns:
         dict: 인증 성공 시 사용자 정보, 실패 시 None
     """
+    start = time.perf_counter()
     user = get_user_by_email(email)
 
-    if not user:
-        return None
-
-    password_hash = hash_password(password)
-
-    if user['password_hash'] == password_hash:
+    if user and user['password_hash'] == hash_password(password):
         # 마지막 로그인 시간 업데이트
         update_last_login(user['id'])
+        metrics.LOGIN_DURATION.observe(time.perf_counter() - start, result="success")
         return user
 
+    metrics.LOGIN_DURATION.observe(time.perf_counter() - start, result="failure")
     return None
 
 
+def get_recent_user_ids(limit: int) -> List[int]:
+    """
+    최근에 로그인한 사용자 ID 조회 (앱 시작 시 캐시 미리 채우기용)
+
+    Args:
+        limit: 최대 개수
+
+    Returns:
+        list: 사용자 ID 리스트 (최근 로그인 순)
+    """
+    query = """
+        SELECT id FROM users
+        WHERE last_login IS NOT NULL
+        ORDER BY last_login DESC
+        LIMIT %s
+    """
+    result = execute_query(query, (limit,), fetch=True)
+    return [row['id'] for row in result] if result else []
+
+
 def update_last_login(user_id: int) -> bool:
     """
     마지막 로그인 시간 업데이트
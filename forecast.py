@@ -0,0 +1,165 @@
+"""
+Project Tracker - Completion Forecast
+최근 일별 처리량(완료 태스크 수)을 표본으로 남은 태스크의 완료일을 몬테카를로 시뮬레이션
+
+시뮬레이션마다 과거의 하루 처리량을 무작위로 뽑아 하루씩 더해 가며 남은 태스크를
+모두 끝내는 날을 구하고, 그 분포의 P50/P85를 완료 예상일로 사용한다.
+시뮬레이션 전체를 (시뮬레이션 수 × 일수) NumPy 배열로 계산하고, 끝나지 않은 시뮬레이션만
+구간을 늘려 FORECAST_MAX_DAYS까지 이어서 계산한다.
+
+numpy는 예측을 처음 계산할 때 함수 안에서 import한다 (앱 시작 시간 단축).
+"""
+
+import math
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+import streamlit as st
+import db_manager as db
+import metrics
+import cache_backend
+from config import FORECAST_TRIALS, FORECAST_HISTORY_DAYS, FORECAST_MAX_DAYS
+
+
+class _QueryFailed(Exception):
+    """처리량 조회 실패 (실패 결과는 캐시하지 않음)"""
+
+
+def simulate_completion_days(history: List[int], remaining: int, trials: int = FORECAST_TRIALS,
+                             max_days: int = FORECAST_MAX_DAYS, seed: int = None) -> List[float]:
+    """
+    남은 태스크를 모두 끝내는 데 걸리는 일수 시뮬레이션
+
+    Args:
+        history: 과거 일별 완료 개수 (완료가 없던 날은 0)
+        remaining: 남은 태스크 수
+        trials: 시뮬레이션 횟수
+        max_days: 최대 시뮬레이션 일수 (이 안에 끝나지 않으면 inf)
+        seed: 난수 시드 (같은 입력이면 같은 결과)
+
+    Returns:
+        list: 시뮬레이션별 소요 일수 (오름차순, 끝나지 않으면 inf)
+    """
+    import numpy as np
+
+    samples = np.asarray(history, dtype=np.int32)
+    mean = samples.mean() if samples.size else 0
+    if remaining <= 0 or mean <= 0:
+        return [math.inf] * trials if remaining > 0 else [0.0] * trials
+
+    # 평균 처리량으로 걸릴 일수의 3배부터 계산하고, 끝나지 않은 시뮬레이션만 구간을 두 배로 늘려
+    # max_days까지 이어서 계산 (처리량이 몰려 있어도 max_days 안에 끝나는 시뮬레이션은 inf가 되지 않음)
+    span = max(14, math.ceil(remaining / mean * 3))
+
+    rng = np.random.default_rng(seed)
+    days = np.full(trials, np.inf)
+    totals = np.zeros(trials, dtype=np.int64)
+    pending = np.arange(trials)
+    offset = 0
+
+    while pending.size and offset < max_days:
+        span = min(span, max_days - offset)
+        daily = samples[rng.integers(0, samples.size, size=(pending.size, span))]
+        cumulative = totals[pending, None] + np.cumsum(daily, axis=1, dtype=np.int64)
+        finished = cumulative >= remaining
+        done = finished[:, -1]
+
+        # 처음으로 남은 태스크 수에 도달한 날 (1일째부터)
+        days[pending[done]] = offset + finished[done].argmax(axis=1) + 1
+        totals[pending] = cumulative[:, -1]
+        pending = pending[~done]
+        offset += span
+        span *= 2
+
+    return np.sort(days).tolist()
+
+
+def _percentile(sorted_days: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    rank = max(0, math.ceil(pct / 100 * len(sorted_days)) - 1)
+    return sorted_days[rank]
+
+
+def build_forecast(history: List[int], remaining: int, today: date, target_date: date = None,
+                   seed: int = None) -> Optional[Dict]:
+    """
+    완료 예측 계산
+
+    Args:
+        history: 과거 일별 완료 개수
+        remaining: 남은 태스크 수
+        today: 기준일
+        target_date: 목표 종료일 (있으면 기한 내 완료 확률 계산)
+        seed: 난수 시드
+
+    Returns:
+        dict: {'p50_date', 'p85_date' (FORECAST_MAX_DAYS 안에 끝나지 않으면 None),
+               'on_time_probability' (목표일 없으면 None), 'history_days', 'trials'}
+              또는 None (처리량 표본이 없음)
+    """
+    if not history or not any(history):
+        return None
+
+    days = simulate_completion_days(history, remaining, seed=seed)
+
+    def to_date(value: float) -> Optional[date]:
+        return None if math.isinf(value) else today + timedelta(days=int(value))
+
+    on_time = None
+    if target_date is not None:
+        deadline = (target_date - today).days
+        on_time = sum(1 for value in days if value <= deadline) / len(days)
+
+    return {
+        'p50_date': to_date(_percentile(days, 50)),
+        'p85_date': to_date(_percentile(days, 85)),
+        'on_time_probability': on_time,
+        'history_days': len(history),
+        'trials': len(days),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+@cache_backend.shared("forecast")
+def _load_forecast(project_id: int, remaining: int, start_date: Optional[date],
+                   target_date: Optional[date], today: date, data_version: int,
+                   cache_generation: int) -> Optional[Dict]:
+    """완료 예측 (data_version과 날짜가 같으면 캐시 사용)"""
+    metrics.mark_cache_miss()
+
+    # 최근 FORECAST_HISTORY_DAYS일 (프로젝트 시작일 이후만, 완료가 없던 날은 0)
+    since = today - timedelta(days=FORECAST_HISTORY_DAYS - 1)
+    if start_date and start_date > since:
+        since = min(start_date, today)
+
+    throughput = db.get_daily_throughput(project_id, since)
+    if throughput is None:
+        raise _QueryFailed()
+
+    history = [throughput.get(since + timedelta(days=offset), 0)
+               for offset in range((today - since).days + 1)]
+
+    return build_forecast(history, remaining, today, target_date, seed=data_version)
+
+
+def get_completion_forecast(project: Dict, remaining: int) -> Optional[Dict]:
+    """
+    프로젝트 완료 예측 조회 (남은 태스크를 모두 끝내는 날의 P50/P85)
+
+    Args:
+        project: 프로젝트 (id, start_date, target_end_date)
+        remaining: 남은 태스크 수
+
+    Returns:
+        dict: build_forecast() 결과 또는 None (표본 없음, 조회 실패)
+    """
+    data_version = db.get_project_version(project['id'])
+    if data_version is None:
+        return None
+
+    try:
+        with metrics.track_cache("forecast"):
+            return _load_forecast(project['id'], remaining, project.get('start_date'),
+                                  project.get('target_end_date'), date.today(), data_version,
+                                  cache_backend.generation("forecast"))
+    except _QueryFailed:
+        return None
@@ -0,0 +1,173 @@
+"""
+Project Tracker - Maintenance Jobs
+주기적으로 실행하는 데이터베이스 관리 작업
+
+사용 예시:
+    python maintenance.py reconcile-counters
+    python maintenance.py reconcile-counters --project-id 3
+    python maintenance.py prune-tombstones --days 7
+    python maintenance.py export-retrospectives --output retrospectives.csv
+    python maintenance.py archive
+    python maintenance.py archive --project-days 365 --task-days 30
+    python maintenance.py check-schema
+    python maintenance.py snapshot-boards --min-events 200
+    python maintenance.py invalidate-cache
+    python maintenance.py invalidate-cache --namespace portfolio --namespace deadlines
+"""
+
+import argparse
+import csv
+import sys
+from contextlib import closing
+import db_manager as db
+import cache_backend
+import forecast  # noqa: F401 (공유 캐시 이름 등록)
+import startup
+from config import (
+    ARCHIVE_PROJECT_AFTER_DAYS, ARCHIVE_TASK_AFTER_DAYS, ARCHIVE_BATCH_SIZE, BOARD_SNAPSHOT_EVENTS
+)
+
+
+def run_reconcile_counters(args) -> None:
+    """프로젝트 태스크 카운터 재계산"""
+    fixed = db.reconcile_project_counters(args.project_id)
+    print(f"카운터 복구 완료: {fixed}개 프로젝트")
+
+
+def run_prune_tombstones(args) -> None:
+    """오래된 태스크 삭제 기록 정리"""
+    pruned = db.prune_task_tombstones(args.days)
+    print(f"삭제 기록 정리 완료: {pruned}개")
+
+
+def run_export_retrospectives(args) -> None:
+    """전체 회고를 CSV로 내보내기 (스트리밍, 메모리 사용량 일정)"""
+    fields = ['id', 'project_id', 'project_name', 'keep_content', 'problem_content',
+              'try_content', 'learning_content', 'created_at', 'updated_at']
+    count = 0
+
+    with open(args.output, 'w', newline='', encoding='utf-8') as f, \
+            closing(db.iter_all_retrospectives(args.batch_size)) as rows:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+
+    print(f"회고 내보내기 완료: {count}개 → {args.output}")
+
+
+def run_archive(args) -> None:
+    """오래된 완료 프로젝트/태스크를 보관 테이블로 이동"""
+    projects = db.archive_completed_projects(args.project_days, args.batch_size)
+    tasks = db.archive_done_tasks(args.task_days, args.batch_size)
+    print(f"보관 완료: 프로젝트 {projects}개, 태스크 {tasks}개")
+
+
+def run_snapshot_boards(args) -> None:
+    """이벤트가 많이 쌓인 프로젝트의 보드 스냅샷 저장 (지난 보드 재구성 속도 유지)"""
+    taken = db.take_board_snapshots(args.min_events)
+    print(f"보드 스냅샷 저장 완료: {taken}개 프로젝트")
+
+
+def run_invalidate_cache(args) -> None:
+    """공유 캐시 항목 무효화 (모든 레플리카에 바로 적용)"""
+    try:
+        generations = cache_backend.invalidate_all(args.namespace)
+    except cache_backend.CacheBackendError as e:
+        print(f"공유 캐시에 연결할 수 없습니다: {e}")
+        sys.exit(1)
+
+    if not generations:
+        print("공유 캐시가 설정되어 있지 않습니다 (secrets.toml의 [cache]).")
+        return
+    for namespace, generation in generations.items():
+        print(f"무효화: {namespace} (세대 {generation})")
+
+
+def run_check_schema(args) -> None:
+    """필요한 테이블/컬럼/인덱스 확인 (배포 전 점검용, 없으면 종료 코드 1)"""
+    missing = startup.check_schema()
+    if missing is None:
+        print("데이터베이스에 연결할 수 없습니다.")
+        sys.exit(1)
+
+    for migration, label in missing:
+        print(f"없음: {label} ({migration})")
+    if missing:
+        sys.exit(1)
+    print("스키마 확인 완료")
+
+
+def main():
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Project Tracker 관리 작업")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile_parser = subparsers.add_parser(
+        "reconcile-counters",
+        help="projects 테이블의 태스크 카운터를 실제 태스크 개수로 복구"
+    )
+    reconcile_parser.add_argument("--project-id", type=int, default=None,
+                                  help="특정 프로젝트만 복구 (생략 시 전체)")
+    reconcile_parser.set_defaults(func=run_reconcile_counters)
+
+    prune_parser = subparsers.add_parser(
+        "prune-tombstones",
+        help="오래된 태스크 삭제 기록(task_tombstones) 정리"
+    )
+    prune_parser.add_argument("--days", type=int, default=7,
+                              help="이 일수보다 오래된 기록 삭제 (기본: 7)")
+    prune_parser.set_defaults(func=run_prune_tombstones)
+
+    export_parser = subparsers.add_parser(
+        "export-retrospectives",
+        help="전체 회고를 CSV 파일로 내보내기"
+    )
+    export_parser.add_argument("--output", default="retrospectives.csv",
+                               help="출력 파일 경로 (기본: retrospectives.csv)")
+    export_parser.add_argument("--batch-size", type=int, default=500,
+                               help="한 번에 읽을 행 수 (기본: 500)")
+    export_parser.set_defaults(func=run_export_retrospectives)
+
+    archive_parser = subparsers.add_parser(
+        "archive",
+        help="오래된 완료 프로젝트와 완료 태스크를 보관 테이블로 이동"
+    )
+    archive_parser.add_argument("--project-days", type=int, default=ARCHIVE_PROJECT_AFTER_DAYS,
+                                help=f"완료 프로젝트 보관 기준 일수 (기본: {ARCHIVE_PROJECT_AFTER_DAYS})")
+    archive_parser.add_argument("--task-days", type=int, default=ARCHIVE_TASK_AFTER_DAYS,
+                                help=f"완료 태스크 보관 기준 일수 (기본: {ARCHIVE_TASK_AFTER_DAYS})")
+    archive_parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE,
+                                help=f"한 트랜잭션에서 옮길 행 수 (기본: {ARCHIVE_BATCH_SIZE})")
+    archive_parser.set_defaults(func=run_archive)
+
+    snapshot_parser = subparsers.add_parser(
+        "snapshot-boards",
+        help="마지막 스냅샷 이후 이벤트가 많이 쌓인 프로젝트의 보드 스냅샷 저장"
+    )
+    snapshot_parser.add_argument("--min-events", type=int, default=BOARD_SNAPSHOT_EVENTS,
+                                 help=f"스냅샷을 만들 최소 이벤트 수 (기본: {BOARD_SNAPSHOT_EVENTS})")
+    snapshot_parser.set_defaults(func=run_snapshot_boards)
+
+    invalidate_parser = subparsers.add_parser(
+        "invalidate-cache",
+        help="공유 캐시 항목을 모든 레플리카에서 무효화 (세대 증가)"
+    )
+    invalidate_parser.add_argument("--namespace", action="append", default=None,
+                                   choices=cache_backend.NAMESPACES,
+                                   help="무효화할 캐시 이름 (여러 번 지정 가능, 생략 시 전체)")
+    invalidate_parser.set_defaults(func=run_invalidate_cache)
+
+    check_parser = subparsers.add_parser(
+        "check-schema",
+        help="앱에 필요한 테이블/컬럼/인덱스가 모두 있는지 확인"
+    )
+    check_parser.set_defaults(func=run_check_schema)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+"""
+Project Tracker - Runtime Metrics
+Prometheus 텍스트 형식 메트릭 수집 및 노출 (표준 라이브러리만 사용)
+
+.streamlit/secrets.toml에 [metrics] 섹션이 있으면 app.py가 백그라운드 스레드로
+HTTP 서버를 띄운다. 확인은 curl 한 번이면 된다.
+
+    curl http://127.0.0.1:9108/metrics
+    curl http://127.0.0.1:9108/sessions    # 세션별 세션 상태 크기
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 이 시간(초) 안에 실행된 세션을 활성 세션으로 집계
+SESSION_ACTIVE_SECONDS = 300
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_registry: List['_Metric'] = []
+
+
+# ========================================
+# 메트릭 타입
+# ========================================
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    """{name="value",...} 형식의 레이블 문자열 생성"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """메트릭 공통 부모 (레지스트리 등록, 레이블 처리)"""
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._callbacks: List[Callable[[], Dict[tuple, float]]] = []
+        with _lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요 (받은 값: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def add_callback(self, callback: Callable[[], Dict[tuple, float]]) -> None:
+        """
+        수집 시점에 값을 계산하는 콜백 등록 (lru_cache 통계 등 외부 카운터용)
+
+        Args:
+            callback: {레이블 값 튜플: 값} 딕셔너리를 반환하는 함수
+        """
+        self._callbacks.append(callback)
+
+    def _callback_values(self) -> Dict[tuple, float]:
+        values = {}
+        for callback in self._callbacks:
+            for key, value in callback().items():
+                values[key] = values.get(key, 0) + value
+        return values
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """증가만 하는 카운터"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with _lock:
+            values = dict(self._values)
+        for key, value in self._callback_values().items():
+            values[key] = values.get(key, 0) + value
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+
+class Gauge(_Metric):
+    """올라가고 내려가는 값"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[tuple, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        with _lock:
+            values = dict(self._values)
+        values.update(self._callback_values())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """구간별 누적 개수, 합계, 개수를 기록하는 히스토그램"""
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            state = self._values.get(key)
+            if state is None:
+                # [구간별 개수..., 합계, 개수]
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간을 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0
+
+    def _samples(self) -> List[str]:
+        with _lock:
+            values = {key: list(state) for key, state in self._values.items()}
+
+        lines = []
+        for key, state in sorted(values.items()):
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += state[i]
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}")
+        return lines
+
+
+def render_metrics() -> str:
+    """
+    등록된 모든 메트릭을 Prometheus 텍스트 형식으로 변환
+
+    Returns:
+        str: /metrics 응답 본문
+    """
+    with _lock:
+        metrics = list(_registry)
+
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ========================================
+# 앱 메트릭 정의
+# ========================================
+
+QUERY_DURATION = Histogram(
+    "project_tracker_query_duration_seconds",
+    "execute_query 실행 시간 (연결 포함)",
+    ("kind",)
+)
+QUERY_ERRORS = Counter(
+    "project_tracker_query_errors_total",
+    "execute_query 오류 횟수",
+    ("kind",)
+)
+CONNECTIONS = Counter(
+    "project_tracker_db_connections_total",
+    "데이터베이스 연결 시도 횟수",
+    ("result",)
+)
+CONNECT_DURATION = Histogram(
+    "project_tracker_db_connect_duration_seconds",
+    "데이터베이스 연결 생성 시간"
+)
+CACHE_REQUESTS = Counter(
+    "project_tracker_cache_requests_total",
+    "캐시 조회 횟수 (result=hit/miss)",
+    ("cache", "result")
+)
+RERUN_DURATION = Histogram(
+    "project_tracker_rerun_duration_seconds",
+    "화면별 스크립트 실행 시간",
+    ("view",)
+)
+ACTIVE_SESSIONS = Gauge(
+    "project_tracker_active_sessions",
+    f"최근 {SESSION_ACTIVE_SECONDS}초 안에 실행된 브라우저 세션 수"
+)
+SESSION_STATE_BYTES = Gauge(
+    "project_tracker_session_state_bytes",
+    "연결 중인 세션의 세션 상태 크기 (stat=total/max, 오래 실행되지 않은 세션 포함)",
+    ("stat",)
+)
+DB_CIRCUIT_OPEN = Gauge(
+    "project_tracker_db_circuit_open",
+    "데이터베이스 서킷 브레이커가 열려 있으면 1"
+)
+DB_READS = Counter(
+    "project_tracker_db_reads_total",
+    "조회 쿼리 연결 대상 (target=primary/replica)",
+    ("target",)
+)
+DB_REPLICA_LAG = Gauge(
+    "project_tracker_db_replica_lag_seconds",
+    "마지막으로 확인한 레플리카 복제 지연 (초)",
+    ("replica",)
+)
+STALE_READS = Counter(
+    "project_tracker_stale_reads_total",
+    "데이터베이스 장애로 최근 조회 결과를 대신 반환한 횟수"
+)
+SHARED_CACHE_ERRORS = Counter(
+    "project_tracker_shared_cache_errors_total",
+    "공유 캐시 저장소 통신 실패 횟수",
+    ("backend",)
+)
+LOGIN_DURATION = Histogram(
+    "project_tracker_login_duration_seconds",
+    "로그인(사용자 인증) 처리 시간",
+    ("result",)
+)
+
+
+# ========================================
+# 캐시 적중 기록
+# ========================================
+
+_local = threading.local()
+
+
+@contextmanager
+def track_cache(cache: str):
+    """
+    st.cache_data 조회의 적중 여부 기록
+
+    캐시되는 함수 본문에서 mark_cache_miss()를 호출하면 miss, 아니면 hit으로 센다.
+
+        with metrics.track_cache('portfolio'):
+            result = _load_portfolio(user_id, data_version)
+    """
+    _local.cache_miss = False
+    try:
+        yield
+    finally:
+        result = "miss" if _local.cache_miss else "hit"
+        CACHE_REQUESTS.inc(cache=cache, result=result)
+
+
+def mark_cache_miss() -> None:
+    """캐시되는 함수 본문이 실제로 실행되었음을 표시"""
+    _local.cache_miss = True
+
+
+def register_lru_cache(cache: str, func) -> None:
+    """
+    functools.lru_cache 함수의 hit/miss 통계를 캐시 메트릭에 연결
+
+    Args:
+        cache: 메트릭 레이블에 쓸 캐시 이름
+        func: lru_cache로 감싼 함수
+    """
+    def collect():
+        info = func.cache_info()
+        return {(cache, "hit"): info.hits, (cache, "miss"): info.misses}
+
+    CACHE_REQUESTS.add_callback(collect)
+
+
+# ========================================
+# 활성 세션
+# ========================================
+
+_session_last_seen: Dict[str, float] = {}
+
+# 세션별 마지막 측정 (전체 바이트, [(키, 바이트), ...] 큰 순서 상위 SESSION_TOP_KEYS개, 측정 시각)
+_session_state_sizes: Dict[str, Tuple[int, List[Tuple[str, int]], float]] = {}
+
+# 세션이 아직 서버에 연결되어 있는지 확인하는 함수 (app.py에서 등록)
+# 등록되지 않았으면 세션 상태 크기도 활성 세션 기준으로만 보관
+_session_connected: Optional[Callable[[str], bool]] = None
+
+# /sessions에 세션별로 표시할 큰 키 개수
+SESSION_TOP_KEYS = 5
+
+
+def touch_session(session_id: str) -> None:
+    """세션의 마지막 실행 시각 기록"""
+    with _lock:
+        _session_last_seen[session_id] = time.time()
+
+
+def record_session_state(session_id: str, total_bytes: int, key_sizes: List[Tuple[str, int]]) -> None:
+    """
+    세션 상태 크기 기록 (매 실행 끝에 호출)
+
+    Args:
+        session_id: 세션 ID
+        total_bytes: 세션 상태 전체 크기
+        key_sizes: [(키, 바이트), ...] 큰 순서
+    """
+    with _lock:
+        _session_state_sizes[session_id] = (total_bytes, list(key_sizes[:SESSION_TOP_KEYS]), time.time())
+
+
+def set_session_check(is_connected: Callable[[str], bool]) -> None:
+    """
+    세션 상태 크기를 세션이 끝날 때까지 집계하도록 연결 확인 함수 등록
+
+    Args:
+        is_connected: 세션 ID를 받아 아직 연결 중이면 True를 돌려주는 함수
+                      (streamlit Runtime.is_active_session)
+    """
+    global _session_connected
+    _session_connected = is_connected
+
+
+def _prune_sessions() -> None:
+    """
+    끝난 세션 기록 삭제 (_lock 안에서 호출)
+
+    활성 세션 수는 SESSION_ACTIVE_SECONDS 동안 실행되지 않은 세션을 뺀다.
+    세션 상태는 실행이 없어도 메모리에 남으므로 크기 기록은 연결이 끊길 때까지 보관한다.
+    """
+    cutoff = time.time() - SESSION_ACTIVE_SECONDS
+    for session_id in [s for s, seen in _session_last_seen.items() if seen < cutoff]:
+        del _session_last_seen[session_id]
+
+    if _session_connected is None:
+        ended = [s for s in _session_state_sizes if s not in _session_last_seen]
+    else:
+        ended = [s for s in _session_state_sizes if not _session_connected(s)]
+    for session_id in ended:
+        del _session_state_sizes[session_id]
+
+
+def _count_active_sessions() -> Dict[tuple, float]:
+    with _lock:
+        _prune_sessions()
+        return {(): len(_session_last_seen)}
+
+
+def _session_state_stats() -> Dict[tuple, float]:
+    with _lock:
+        _prune_sessions()
+        sizes = [total for total, _, _ in _session_state_sizes.values()]
+    return {("total",): sum(sizes), ("max",): max(sizes, default=0)}
+
+
+def render_sessions() -> str:
+    """
+    연결 중인 세션별 상태 크기 보고서 (GET /sessions 응답)
+
+    최근 SESSION_ACTIVE_SECONDS 안에 실행되지 않은 세션도 연결이 끊기기 전까지 포함한다.
+
+    Returns:
+        str: 세션 수, 전체/평균 크기와 세션별 크기, 큰 키 목록 (큰 세션 순서)
+    """
+    now = time.time()
+    with _lock:
+        _prune_sessions()
+        active = len(_session_last_seen)
+        sessions = [(session_id, total, keys, now - recorded_at)
+                    for session_id, (total, keys, recorded_at) in _session_state_sizes.items()]
+    sessions.sort(key=lambda item: item[1], reverse=True)
+
+    total = sum(item[1] for item in sessions)
+    average = total / len(sessions) if sessions else 0
+    lines = [
+        f"sessions: {len(sessions)} (active in last {SESSION_ACTIVE_SECONDS}s: {active})",
+        f"session state total: {total / 1024:.1f} KiB, average: {average / 1024:.1f} KiB",
+        "",
+    ]
+    for session_id, size, keys, idle in sessions:
+        top = ", ".join(f"{key}={key_size / 1024:.1f}KiB" for key, key_size in keys)
+        lines.append(f"{session_id[:8]}  {size / 1024:>8.1f} KiB  idle {idle:>4.0f}s  {top}")
+    return "\n".join(lines) + "\n"
+
+
+ACTIVE_SESSIONS.add_callback(_count_active_sessions)
+SESSION_STATE_BYTES.add_callback(_session_state_stats)
+
+
+# ========================================
+# HTTP 서버
+# ========================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 요청에 메트릭, GET /sessions 요청에 세션 상태 크기 보고서 반환"""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body, content_type = render_metrics(), CONTENT_TYPE
+        elif path == "/sessions":
+            body, content_type = render_sessions(), "text/plain; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 수집기가 주기적으로 호출하므로 접근 로그는 남기지 않음
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+# 포트를 열 수 없어 메트릭 서버를 사용하지 않음 (이후 실행에서 다시 시도하지 않음)
+_server_disabled = False
+
+
+def start_metrics_server(port: int = 9108, host: str = "127.0.0.1") -> Optional[ThreadingHTTPServer]:
+    """
+    메트릭 HTTP 서버를 백그라운드 스레드로 시작 (프로세스당 한 번만 시작)
+
+    포트가 이미 사용 중이면(같은 서버의 다른 앱 프로세스 등) 경고를 한 번 남기고
+    메트릭 서버 없이 앱을 계속 실행한다.
+
+    Args:
+        port: 포트 (0이면 빈 포트 자동 선택)
+        host: 바인딩 주소 (기본은 로컬에서만 접근 가능)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server.server_address로 주소 확인)
+        또는 None (포트를 열 수 없음)
+    """
+    global _server, _server_disabled
+
+    with _lock:
+        if _server is None and not _server_disabled:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                _server_disabled = True
+                logger.warning("메트릭 서버를 시작할 수 없어 사용하지 않습니다 (%s:%s): %s", host, port, e)
+                return None
+            _server.daemon_threads = True
+            thread = threading.Thread(target=_server.serve_forever,
+                                      name="metrics-server", daemon=True)
+            thread.start()
+        return _server
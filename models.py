@@ -0,0 +1,150 @@
+"""
+Project Tracker - Row Models
+조회 결과를 담는 가벼운 행 객체 (__slots__ 기반)
+
+딕셔너리 커서 대신 튜플 커서 결과로 바로 생성하여 행마다 dict를 만들지 않는다.
+row['status'], row.get('tags'), dict(row)처럼 딕셔너리와 같은 방식으로도
+사용할 수 있어 views/와 utils.py는 그대로 동작한다.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence
+
+
+class Row:
+    """__slots__ 기반 행 객체의 공통 부모 (딕셔너리 호환 접근 제공)"""
+
+    FIELDS: tuple = ()
+    _FIELD_SET: frozenset = frozenset()
+
+    __slots__ = ('_extra',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_rows(cls, column_names: Sequence[str], rows: List[tuple]) -> List['Row']:
+        """
+        튜플 커서 결과로 행 객체 리스트 생성
+
+        Args:
+            column_names: 커서의 컬럼명 (cursor.column_names)
+            rows: 튜플 행 리스트
+
+        Returns:
+            list: 행 객체 리스트
+        """
+        known = [(name, i) for i, name in enumerate(column_names) if name in cls._FIELD_SET]
+        extra = [(name, i) for i, name in enumerate(column_names) if name not in cls._FIELD_SET]
+        new = object.__new__
+        result = []
+
+        for values in rows:
+            row = new(cls)
+            for name, i in known:
+                setattr(row, name, values[i])
+            row._extra = {name: values[i] for name, i in extra} if extra else None
+            result.append(row)
+
+        return result
+
+    # ---- 딕셔너리 호환 접근 ----
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        names = [name for name in self.FIELDS if hasattr(self, name)]
+        if self._extra:
+            names.extend(self._extra)
+        return names
+
+    def values(self) -> List[Any]:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> List[tuple]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Row):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Project(Row):
+    """projects 행"""
+
+    FIELDS = ('id', 'user_id', 'name', 'description', 'github_url',
+              'start_date', 'target_end_date', 'status',
+              'task_total', 'task_todo', 'task_in_progress', 'task_done',
+              'estimated_hours_total', 'data_version',
+              'created_at', 'updated_at')
+    __slots__ = FIELDS
+
+
+class Task(Row):
+    """tasks 행"""
+
+    FIELDS = ('id', 'project_id', 'title', 'description', 'status', 'priority',
+              'tags', 'estimated_hours', 'due_date', 'started_at', 'completed_at',
+              'created_at', 'updated_at')
+    __slots__ = FIELDS
+
+
+class Milestone(Row):
+    """milestones 행"""
+
+    FIELDS = ('id', 'project_id', 'title', 'description', 'target_date',
+              'is_completed', 'completed_at', 'created_at')
+    __slots__ = FIELDS
+
+
+class ChecklistItem(Row):
+    """checklist_items 행"""
+
+    FIELDS = ('id', 'task_id', 'content', 'is_checked', 'created_at')
+    __slots__ = FIELDS
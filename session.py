@@ -0,0 +1,156 @@
+"""
+Project Tracker - Session State
+브라우저 세션마다 보관하는 상태 정의와 정리
+
+세션에는 화면 이동에 필요한 식별자와 플래그만 저장하고, 프로젝트/태스크 같은
+데이터는 매 실행마다 캐시(st.cache_data)에서 다시 가져온다.
+
+- 로그인 사용자는 SESSION_USER_FIELDS(id, username, email)만 저장 (password_hash 제외)
+- 상세보기/수정/삭제 확인 같은 화면별 플래그는 다른 화면으로 이동하면 정리
+- 세션 상태 크기를 매 실행 측정해 메트릭 서버의 /sessions에서 확인
+"""
+
+import sys
+from typing import Any, Dict, List, Tuple
+import streamlit as st
+
+
+# 모든 세션이 갖는 키와 기본값
+SESSION_DEFAULTS = {
+    # 인증 관련
+    'authenticated': False,
+    'user': None,
+    # 화면 이동
+    'current_project_id': None,
+    'show_create_project': False,
+    'show_my_retrospectives': False,
+    # 화면별 플래그 (화면이 바뀌면 기본값으로 되돌림)
+    'show_create_task': False,
+    'view_task_id': None,
+    'edit_task_id': None,
+    'edit_project_id': None,
+}
+
+# 세션에 저장하는 사용자 필드
+SESSION_USER_FIELDS = ('id', 'username', 'email')
+
+# 화면이 바뀌면 기본값으로 되돌리는 키
+TRANSIENT_DEFAULTS = ('show_create_task', 'view_task_id', 'edit_task_id', 'edit_project_id')
+
+# 화면이 바뀌면 삭제하는 키 (각 화면이 없으면 다시 만든다)
+TRANSIENT_KEYS = (
+    'show_signup',
+    'confirm_delete_project',
+    'edit_retrospective',
+    'expanded_retrospective_id',
+    'my_retro_cursors',
+    'compact_board_nonce',
+)
+TRANSIENT_PREFIXES = ('live_refresh_version_',)
+
+# 마지막으로 그린 화면 (바뀌었는지 비교용)
+_VIEW_KEY = '_session_view'
+
+
+def init_session_state() -> None:
+    """없는 세션 키를 기본값으로 초기화 (app.py에서 매 실행 호출)"""
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+
+def login(user: Dict) -> None:
+    """
+    로그인 상태 저장 (사용자 행에서 SESSION_USER_FIELDS만 저장)
+
+    Args:
+        user: db.verify_user() 결과
+    """
+    st.session_state.user = {field: user[field] for field in SESSION_USER_FIELDS}
+    st.session_state.authenticated = True
+
+
+def logout() -> None:
+    """세션 상태를 모두 지우고 기본값으로 초기화"""
+    st.session_state.clear()
+    init_session_state()
+
+
+def current_view() -> Tuple[str, Any]:
+    """
+    현재 화면 (화면 이름, 프로젝트 ID)
+
+    Returns:
+        tuple: ('auth' | 'create_project' | 'my_retrospectives' | 'project' | 'portfolio', 프로젝트 ID 또는 None)
+    """
+    if not st.session_state.authenticated:
+        return ('auth', None)
+    if st.session_state.show_create_project:
+        return ('create_project', None)
+    if st.session_state.show_my_retrospectives:
+        return ('my_retrospectives', None)
+    if st.session_state.current_project_id:
+        return ('project', st.session_state.current_project_id)
+    return ('portfolio', None)
+
+
+def prune_transient_state() -> None:
+    """
+    화면이 바뀌었으면 이전 화면의 플래그와 화면별 데이터 정리
+
+    같은 화면에서 다시 실행되는 동안에는 아무것도 지우지 않는다.
+    """
+    view = current_view()
+    if st.session_state.get(_VIEW_KEY) == view:
+        return
+
+    for key in TRANSIENT_DEFAULTS:
+        st.session_state[key] = SESSION_DEFAULTS[key]
+    for key in list(st.session_state.keys()):
+        if key in TRANSIENT_KEYS or key.startswith(TRANSIENT_PREFIXES):
+            del st.session_state[key]
+
+    st.session_state[_VIEW_KEY] = view
+
+
+# ========================================
+# 세션 상태 크기
+# ========================================
+
+def _deep_sizeof(value: Any, seen: set) -> int:
+    """객체와 참조하는 컨테이너/슬롯 값의 메모리 크기 합계 (같은 객체는 한 번만)"""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value, 0)
+
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in value)
+    elif not isinstance(value, (str, bytes, int, float, bool)) and value is not None:
+        for cls in type(value).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(value, name):
+                    size += _deep_sizeof(getattr(value, name), seen)
+        if hasattr(value, '__dict__'):
+            size += _deep_sizeof(vars(value), seen)
+
+    return size
+
+
+def measure_state(state: Dict[str, Any]) -> Tuple[int, List[Tuple[str, int]]]:
+    """
+    세션 상태 크기 측정
+
+    Args:
+        state: 세션 상태 (st.session_state.to_dict())
+
+    Returns:
+        tuple: (전체 바이트, [(키, 바이트), ...] 큰 순서)
+    """
+    seen = set()
+    sizes = [(key, _deep_sizeof(key, seen) + _deep_sizeof(value, seen)) for key, value in state.items()]
+    sizes.sort(key=lambda item: item[1], reverse=True)
+    return sum(size for _, size in sizes), sizes
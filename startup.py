@@ -0,0 +1,189 @@
+"""
+Project Tracker - Startup Warm-up
+서버 프로세스가 시작된 뒤 첫 실행에서 한 번만 하는 준비 작업
+
+1. 스키마 확인 - 필요한 테이블/컬럼/인덱스가 없으면 빠진 마이그레이션을 알려주고 중단
+2. 연결 풀 채우기 - primary와 레플리카에 DB_POOL_SIZE개씩 미리 연결
+3. 캐시 미리 채우기 - 최근 로그인 사용자의 포트폴리오 요약 (백그라운드 스레드)
+
+데이터베이스에 연결할 수 없으면 결과를 캐시하지 않고 다음 실행에서 다시 시도한다.
+"""
+
+import threading
+from typing import Dict, List, Optional
+import streamlit as st
+import db_manager as db
+from config import STARTUP_PRELOAD_USERS
+
+
+# ========================================
+# 필요한 스키마
+# ========================================
+
+ARCHIVED_TABLES = ('projects', 'tasks', 'checklist_items', 'milestones', 'retrospectives')
+
+# 적용 순서대로 {마이그레이션 파일: [('table', 테이블) | ('column', 테이블, 컬럼) | ('index', 테이블, 인덱스)]}
+SCHEMA_REQUIREMENTS = {
+    'schema.sql': [
+        ('table', 'projects'),
+        ('table', 'tasks'),
+        ('table', 'checklist_items'),
+        ('table', 'milestones'),
+        ('table', 'retrospectives'),
+    ],
+    'migration_add_users.sql': [
+        ('table', 'users'),
+        ('column', 'projects', 'user_id'),
+        ('index', 'projects', 'idx_user'),
+    ],
+    'migration_add_task_counters.sql': [
+        ('column', 'projects', 'task_total'),
+        ('column', 'projects', 'estimated_hours_total'),
+    ],
+    'migration_add_data_version.sql': [
+        ('column', 'projects', 'data_version'),
+    ],
+    'migration_add_retrospective_index.sql': [
+        ('index', 'retrospectives', 'idx_project_created'),
+    ],
+    'migration_add_task_change_feed.sql': [
+        ('table', 'task_tombstones'),
+        ('column', 'tasks', 'updated_at'),
+        ('index', 'tasks', 'idx_project_updated'),
+    ],
+    'migration_add_deadline_indexes.sql': [
+        ('index', 'tasks', 'idx_project_due_date'),
+        ('index', 'milestones', 'idx_project_target_date'),
+    ],
+    'migration_add_archive_tables.sql': [
+        ('column', f"{table}_archive", 'archived_at') for table in ARCHIVED_TABLES
+    ],
+    'migration_add_flow_metrics_index.sql': [
+        ('index', 'tasks', 'idx_project_status_completed'),
+        ('index', 'tasks_archive', 'idx_project_status_completed'),
+    ],
+    'migration_add_task_events.sql': [
+        ('index', 'task_events', 'idx_project_occurred'),
+        ('index', 'board_snapshots', 'idx_project_occurred'),
+    ],
+    'migration_add_task_change_version.sql': [
+        ('column', 'tasks', 'change_version'),
+        ('column', 'task_tombstones', 'change_version'),
+    ],
+}
+
+
+class SchemaError(Exception):
+    """필요한 테이블/컬럼/인덱스가 없음 (missing: [(마이그레이션 파일, 설명), ...])"""
+
+    def __init__(self, missing: List[tuple]):
+        super().__init__(f"{len(missing)}개 스키마 객체가 없습니다")
+        self.missing = missing
+
+
+class _DatabaseUnavailable(Exception):
+    """시작 준비 중 데이터베이스에 연결할 수 없음 (결과를 캐시하지 않기 위한 예외)"""
+
+
+def find_missing_schema(objects: Dict[str, set]) -> List[tuple]:
+    """
+    필요한 스키마 중 없는 항목 찾기
+
+    Args:
+        objects: db.get_schema_objects() 결과
+
+    Returns:
+        list: [(마이그레이션 파일, 설명), ...] (모두 있으면 빈 리스트)
+    """
+    missing = []
+
+    for migration, requirements in SCHEMA_REQUIREMENTS.items():
+        for kind, table, *name in requirements:
+            if kind == 'table':
+                found = table in objects['tables']
+                label = f"테이블 {table}"
+            elif kind == 'column':
+                found = (table, name[0]) in objects['columns']
+                label = f"컬럼 {table}.{name[0]}"
+            else:
+                found = (table, name[0]) in objects['indexes']
+                label = f"인덱스 {table}.{name[0]}"
+
+            if not found:
+                missing.append((migration, label))
+
+    return missing
+
+
+def check_schema() -> Optional[List[tuple]]:
+    """
+    스키마 확인
+
+    Returns:
+        list: 없는 항목 [(마이그레이션 파일, 설명), ...] 또는 None (데이터베이스 연결 불가)
+    """
+    objects = db.get_schema_objects()
+    if objects is None:
+        return None
+    return find_missing_schema(objects)
+
+
+# ========================================
+# 시작 준비
+# ========================================
+
+def _preload_portfolios(user_ids: List[int]) -> None:
+    """최근 사용자의 포트폴리오 요약을 캐시에 미리 계산"""
+    for user_id in user_ids:
+        db.get_portfolio(user_id)
+
+
+@st.cache_resource(show_spinner="🚀 앱을 준비하는 중...")
+def warm_up() -> Dict:
+    """
+    프로세스당 한 번 실행하는 시작 준비 (st.cache_resource)
+
+    Returns:
+        dict: {'pools': 준비된 연결 풀 수, 'preload_users': 캐시를 채울 사용자 수}
+
+    Raises:
+        SchemaError: 필요한 스키마가 없음
+        _DatabaseUnavailable: 데이터베이스 연결 불가 (캐시하지 않고 다음 실행에서 재시도)
+    """
+    missing = check_schema()
+    if missing is None:
+        raise _DatabaseUnavailable()
+    if missing:
+        raise SchemaError(missing)
+
+    pools = db.prime_connection_pools()
+
+    user_ids = db.get_recent_user_ids(STARTUP_PRELOAD_USERS) if STARTUP_PRELOAD_USERS else []
+    if user_ids:
+        threading.Thread(target=_preload_portfolios, args=(user_ids,),
+                         name="portfolio-preload", daemon=True).start()
+
+    return {'pools': pools, 'preload_users': len(user_ids)}
+
+
+def ensure_ready() -> None:
+    """
+    앱 실행 전 시작 준비 확인 (app.py main()에서 매 실행 호출, 실제 작업은 프로세스당 1회)
+
+    스키마가 맞지 않으면 빠진 마이그레이션을 보여주고 실행을 중단한다.
+    데이터베이스에 연결할 수 없으면 그대로 진행한다 (장애 배너와 최근 데이터로 표시).
+    """
+    try:
+        warm_up()
+    except _DatabaseUnavailable:
+        return
+    except SchemaError as e:
+        st.error("❌ 데이터베이스 스키마가 최신이 아닙니다. 아래 마이그레이션을 실행한 뒤 새로고침하세요.")
+        migrations = dict.fromkeys(migration for migration, _ in e.missing)
+        st.code("\n".join(f"mysql -u root -p project_tracker < database/{migration}"
+                          for migration in migrations),
+                language="bash")
+        with st.expander("없는 항목"):
+            for migration, label in e.missing:
+                st.write(f"- {label} ({migration})")
+        st.stop()
@@ -4,10 +4,13 @@ Project Tracker - Utility Functions
 """
 
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Optional
 from config import TAG_ICONS, PRIORITY_COLORS, STATUS_ICONS
 
+if TYPE_CHECKING:
+    # pandas는 실제로 DataFrame을 만들 때 함수 안에서 import (앱 시작 시간 단축)
+    import pandas as pd
+
 
 # ========================================
 # 진행률 계산
@@ -243,7 +246,7 @@ def get_due_date_badge(due_date: date) -> str:
 # 데이터 변환
 # ========================================
 
-def tasks_to_dataframe(tasks: List[Dict]) -> pd.DataFrame:
+def tasks_to_dataframe(tasks: List[Dict]) -> 'pd.DataFrame':
     """
     태스크 리스트를 DataFrame으로 변환
 
@@ -253,10 +256,45 @@ def tasks_to_dataframe(tasks: List[Dict]) -> pd.DataFrame:
     Returns:
         DataFrame: 태스크 데이터프레임
     """
+    import pandas as pd
+
     if not tasks:
         return pd.DataFrame()
 
-    return pd.DataFrame(tasks)
+    return pd.DataFrame([dict(task) for task in tasks])
+
+
+def apply_task_changes(tasks_by_id: Dict[int, Dict], changes: Dict) -> Dict[int, Dict]:
+    """
+    변경 피드(get_tasks_changed_since 결과)를 태스크 딕셔너리에 적용
+
+    Args:
+        tasks_by_id: 태스크 ID별 태스크 (제자리에서 수정됨)
+        changes: {'changed': list, 'deleted': list}
+
+    Returns:
+        dict: 변경이 적용된 태스크 딕셔너리
+    """
+    for task in changes.get('changed', []):
+        tasks_by_id[task['id']] = task
+
+    for task_id in changes.get('deleted', []):
+        tasks_by_id.pop(task_id, None)
+
+    return tasks_by_id
+
+
+def sort_tasks_by_created(tasks: List[Dict]) -> List[Dict]:
+    """
+    태스크를 생성일 역순으로 정렬 (get_tasks와 같은 순서)
+
+    Args:
+        tasks: 태스크 리스트
+
+    Returns:
+        list: 정렬된 태스크 리스트
+    """
+    return sorted(tasks, key=lambda t: (t['created_at'], t['id']), reverse=True)
 
 
 def get_tag_distribution(tasks: List[Dict]) -> Dict[str, int]:
@@ -324,23 +362,28 @@ def get_status_distribution(tasks: List[Dict]) -> Dict[str, int]:
 # 차트 데이터 준비
 # ========================================
 
-def prepare_progress_history(tasks: List[Dict]) -> pd.DataFrame:
+def prepare_progress_history(tasks: List[Dict], extra_completed: Dict[date, int] = None,
+                             total: int = None) -> 'pd.DataFrame':
     """
     진행률 추이 데이터 준비 (날짜별 완료 개수)
 
     Args:
         tasks: 태스크 리스트
+        extra_completed: tasks에 없는 완료 태스크의 날짜별 개수 (보관된 태스크 집계)
+        total: 진행률 분모 (None이면 tasks 개수)
 
     Returns:
         DataFrame: 날짜별 진행률 데이터
     """
+    import pandas as pd
+
     completed_tasks = [t for t in tasks if t['status'] == 'done' and t.get('completed_at')]
 
-    if not completed_tasks:
+    if not completed_tasks and not extra_completed:
         return pd.DataFrame(columns=['date', 'count', 'cumulative', 'progress_rate'])
 
     # 완료 날짜별로 그룹화
-    completion_dates = {}
+    completion_dates = dict(extra_completed or {})
     for task in completed_tasks:
         completed_at = task['completed_at']
         if isinstance(completed_at, datetime):
@@ -354,7 +397,7 @@ def prepare_progress_history(tasks: List[Dict]) -> pd.DataFrame:
     sorted_dates = sorted(completion_dates.items())
 
     # 누적 합계 계산
-    total_tasks = len(tasks)
+    total_tasks = len(tasks) if total is None else total
     cumulative = 0
     data = []
 
@@ -446,6 +489,24 @@ def format_hours(hours: float) -> str:
         return f"{hours}시간"
 
 
+def format_duration(hours: Optional[float]) -> str:
+    """
+    소요 시간을 읽기 쉬운 형식으로 변환 (24시간 이상은 일 단위)
+
+    Args:
+        hours: 시간 (숫자, 없으면 None)
+
+    Returns:
+        str: 포맷된 소요 시간 (예: "5.5시간", "3.2일", 없으면 "-")
+    """
+    if hours is None:
+        return "-"
+
+    if hours < 24:
+        return f"{hours:.1f}시간"
+    return f"{hours / 24:.1f}일"
+
+
 def truncate_text(text: str, max_length: int = 50) -> str:
     """
     긴 텍스트를 자르고 ... 추가
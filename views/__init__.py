@@ -5,13 +5,20 @@ Project Tracker - Views
 
 from .dashboard import render_dashboard_tab
 from .kanban import render_kanban_tab
-from .retrospective import render_retrospective_tab
+from .board_history import render_board_history_tab
+from .retrospective import render_retrospective_tab, render_my_retrospectives_page
+from .portfolio import render_portfolio_page
+from .archived import render_archived_project
 from .auth import show_auth_page, logout
 
 __all__ = [
     'render_dashboard_tab',
     'render_kanban_tab',
+    'render_board_history_tab',
     'render_retrospective_tab',
+    'render_my_retrospectives_page',
+    'render_portfolio_page',
+    'render_archived_project',
     'show_auth_page',
     'logout',
 ]
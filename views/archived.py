@@ -0,0 +1,75 @@
+"""
+Project Tracker - Archived Project View
+보관된 프로젝트 읽기 전용 화면
+"""
+
+import streamlit as st
+import db_manager as db
+import utils
+from config import STATUS_NAMES
+from views.retrospective import render_retrospective_full
+
+
+def render_archived_project(project):
+    """보관된 프로젝트 렌더링 (수정 불가, 요약/태스크/마일스톤/회고 조회만)"""
+
+    project_id = project['id']
+
+    st.title(f"🗄️ {project['name']}")
+    st.info(
+        f"보관된 프로젝트입니다 (보관일: {utils.format_datetime(project['archived_at'])}). "
+        "읽기 전용으로 표시됩니다."
+    )
+
+    # 요약 메트릭 (보관 시점의 태스크 카운터)
+    progress_rate = utils.calculate_progress_rate(project['task_total'], project['task_done'])
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("📝 전체 태스크", project['task_total'])
+
+    with col2:
+        st.metric("✅ 완료", project['task_done'])
+
+    with col3:
+        st.metric("📊 진행률", f"{progress_rate:.0f}%")
+
+    with col4:
+        st.metric("⏱️ 예상 시간", utils.format_hours(project['estimated_hours_total']))
+
+    st.caption(f"📅 {utils.get_date_range_text(project['start_date'], project['target_end_date'])}")
+
+    if project.get('description'):
+        with st.expander("📝 프로젝트 설명"):
+            st.write(project['description'])
+
+    st.markdown("---")
+
+    tab1, tab2, tab3 = st.tabs(["📋 태스크", "📅 마일스톤", "📝 회고"])
+
+    with tab1:
+        tasks = db.get_tasks(project_id, include_archived=True)
+        if not tasks:
+            st.info("📋 태스크가 없습니다.")
+        for task in tasks:
+            st.write(
+                f"{utils.get_status_icon(task['status'])} **{task['title']}** "
+                f"· {STATUS_NAMES.get(task['status'], task['status'])} "
+                f"· {utils.get_priority_badge(task['priority'])}"
+            )
+
+    with tab2:
+        milestones = db.get_milestones(project_id, include_archived=True)
+        if not milestones:
+            st.info("📅 마일스톤이 없습니다.")
+        for milestone in milestones:
+            icon = "✅" if milestone['is_completed'] else "⬜"
+            st.write(f"{icon} **{milestone['title']}** · {utils.format_date(milestone['target_date'])}")
+
+    with tab3:
+        retrospective = db.get_retrospective(project_id)
+        if retrospective:
+            render_retrospective_full(retrospective)
+        else:
+            st.info("📝 작성된 회고가 없습니다.")
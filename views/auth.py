@@ -4,6 +4,7 @@ Project Tracker - Authentication Views
 """
 
 import streamlit as st
+import session
 from db_manager import create_user, verify_user, get_user_by_email
 import re
 
@@ -47,9 +48,8 @@ def show_login_page():
                 else:
                     user = verify_user(email, password)
                     if user:
-                        # 세션에 사용자 정보 저장
-                        st.session_state.user = user
-                        st.session_state.authenticated = True
+                        # 세션에는 id/이름/이메일만 저장 (비밀번호 해시 제외)
+                        session.login(user)
 
                         st.success(f"환영합니다, {user['username']}님!")
                         st.rerun()
@@ -127,7 +127,6 @@ def show_auth_page():
 
 def logout():
     """로그아웃"""
-    # 세션 상태 초기화
-    st.session_state.authenticated = False
-    st.session_state.user = None
+    # 세션 상태 전체 초기화 (화면별 플래그, 보드 데이터 포함)
+    session.logout()
     st.rerun()
@@ -0,0 +1,78 @@
+"""
+Project Tracker - Board History View
+지난 날짜의 Kanban 보드를 태스크 이벤트 로그로 재구성해 보여주는 탭
+"""
+
+from datetime import date, datetime, time, timedelta
+import streamlit as st
+import db_manager as db
+import utils
+from config import STATUS_NAMES
+
+
+EVENT_LABELS = {
+    'created': '생성',
+    'status_changed': '이동',
+    'deleted': '삭제',
+}
+
+
+def last_friday(today: date) -> date:
+    """오늘 이전의 가장 최근 금요일"""
+    return today - timedelta(days=(today.weekday() - 4) % 7 or 7)
+
+
+def render_board_history_tab(project):
+    """지난 보드 탭 렌더링 (읽기 전용)"""
+
+    project_id = project['id']
+    today = date.today()
+
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        selected = st.date_input(
+            "날짜",
+            value=last_friday(today),
+            max_value=today,
+            key=f"board_history_date_{project_id}"
+        )
+
+    # 선택한 날짜가 끝나는 시점의 보드 (오늘이면 현재)
+    as_of = datetime.now() if selected >= today else datetime.combine(selected, time.max)
+
+    with col2:
+        st.caption(
+            f"🕰️ {utils.format_date(selected)} 기준 보드입니다. "
+            "태스크 생성/이동/삭제 기록으로 재구성하며 수정할 수 없습니다."
+        )
+
+    board = db.get_board_as_of(project_id, as_of)
+    if board is None:
+        st.error("보드 기록을 불러오지 못했습니다.")
+        return
+
+    if not any(board.values()):
+        st.info("📭 이 날짜에는 보드에 태스크가 없었습니다.")
+    else:
+        columns = st.columns(3)
+        for column, (status, icon) in zip(columns, (('todo', '📝'), ('in_progress', '🔄'), ('done', '✅'))):
+            with column:
+                st.markdown(f"### {icon} {STATUS_NAMES[status]}")
+                st.caption(f"{len(board[status])}개")
+                st.markdown("---")
+                for task in board[status]:
+                    st.write(f"• {task['title']}")
+
+    # 그날의 변경 기록 (탭은 매 실행마다 렌더링되므로 켰을 때만 조회)
+    if st.toggle("📜 이날의 변경 기록 보기", key=f"board_history_events_{project_id}"):
+        day_start = datetime.combine(selected, time.min)
+        events = db.get_task_events(project_id, day_start, as_of)
+        if not events:
+            st.caption("이날은 변경 기록이 없습니다.")
+        for event in events:
+            change = EVENT_LABELS.get(event['event_type'], event['event_type'])
+            if event['event_type'] == 'status_changed':
+                change += (f" ({STATUS_NAMES.get(event['from_status'], '-')} → "
+                           f"{STATUS_NAMES.get(event['to_status'], '-')})")
+            st.write(f"`{event['occurred_at']:%H:%M}` **{event['title']}** · {change}")
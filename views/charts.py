@@ -0,0 +1,139 @@
+"""
+Project Tracker - Dashboard Charts
+대시보드 Plotly 차트 생성 (입력값 기준 LRU 캐시)
+
+차트 함수는 집계된 값(튜플 등 해시 가능한 값)만 인자로 받으므로
+같은 숫자로 다시 그릴 때는 plotly.express 생성을 건너뛰고 캐시된 Figure를 반환한다.
+반환된 Figure는 여러 세션이 공유하므로 수정하지 않는다.
+
+plotly.express는 pandas까지 함께 불러와 무거우므로 모듈 상단이 아니라
+각 차트 함수 안에서 import한다 (로그인 화면 등 차트가 없는 첫 화면의 시작 시간 단축).
+"""
+
+from functools import lru_cache
+from config import CHART_CACHE_SIZE
+import metrics
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def build_status_pie(todo: int, in_progress: int, done: int):
+    """상태별 분포 원형 차트"""
+    import plotly.express as px
+
+    fig = px.pie(
+        names=['📝 To Do', '🔄 In Progress', '✅ Done'],
+        values=[todo, in_progress, done],
+        color_discrete_sequence=['#FFA07A', '#87CEEB', '#90EE90']
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def build_priority_bar(low: int, medium: int, high: int):
+    """우선순위별 분포 막대 차트"""
+    import plotly.express as px
+
+    fig = px.bar(
+        x=['🟢 Low', '🟡 Medium', '🔴 High'],
+        y=[low, medium, high],
+        labels={'x': '우선순위', 'y': '개수'},
+        color=['🟢 Low', '🟡 Medium', '🔴 High'],
+        color_discrete_sequence=['#90EE90', '#FFD700', '#FF6B6B']
+    )
+    fig.update_layout(showlegend=False, xaxis_title="", yaxis_title="태스크 개수")
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def build_progress_line(points: tuple):
+    """
+    진행률 추이 선 차트
+
+    Args:
+        points: ((날짜, 완료율), ...) 튜플
+    """
+    import plotly.express as px
+
+    fig = px.line(
+        x=[point[0] for point in points],
+        y=[point[1] for point in points],
+        labels={'x': '날짜', 'y': '완료율 (%)'},
+        markers=True
+    )
+    fig.update_layout(
+        yaxis_range=[0, 100],
+        showlegend=False,
+        hovermode='x unified'
+    )
+
+    # 목표선 추가 (100%)
+    fig.add_hline(
+        y=100,
+        line_dash="dash",
+        line_color="green",
+        annotation_text="목표 (100%)"
+    )
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def build_tag_bar(tag_counts: tuple):
+    """
+    태그별 분포 막대 차트
+
+    Args:
+        tag_counts: ((태그, 개수), ...) 튜플
+    """
+    import plotly.express as px
+
+    tags = [tag for tag, _ in tag_counts]
+
+    fig = px.bar(
+        x=tags,
+        y=[count for _, count in tag_counts],
+        labels={'x': '태그', 'y': '개수'},
+        color=tags,
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig.update_layout(showlegend=False, xaxis_title="", yaxis_title="태스크 개수")
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def build_flow_trend(points: tuple):
+    """
+    주간 사이클 타임/리드 타임 중앙값 추이 선 차트
+
+    Args:
+        points: ((주 시작일, 사이클 타임 P50 시간, 리드 타임 P50 시간), ...) 튜플
+    """
+    import plotly.express as px
+
+    weeks, values, series = [], [], []
+    for week_start, cycle_p50, lead_p50 in points:
+        for name, hours in (('사이클 타임', cycle_p50), ('리드 타임', lead_p50)):
+            if hours is not None:
+                weeks.append(week_start)
+                values.append(round(hours / 24, 1))
+                series.append(name)
+
+    fig = px.line(
+        {'주': weeks, '일': values, '지표': series},
+        x='주', y='일', color='지표',
+        markers=True,
+        color_discrete_sequence=['#87CEEB', '#FFA07A']
+    )
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="중앙값 (일)",
+        legend_title_text="",
+        hovermode='x unified'
+    )
+    return fig
+
+
+# 차트 캐시 적중률을 메트릭으로 노출
+for _builder in (build_status_pie, build_priority_bar, build_progress_line, build_tag_bar,
+                 build_flow_trend):
+    metrics.register_lru_cache(f"chart_{_builder.__name__.removeprefix('build_')}", _builder)
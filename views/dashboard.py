@@ -4,9 +4,11 @@ Project Tracker - Dashboard View
 """
 
 import streamlit as st
-import plotly.express as px
 import db_manager as db
 import utils
+import forecast
+from views import charts
+from views.live_refresh import render_live_refresh_toggle
 
 
 def render_dashboard_tab(project):
@@ -14,9 +16,17 @@ def render_dashboard_tab(project):
 
     project_id = project['id']
 
-    # 태스크 데이터 가져오기
-    all_tasks = db.get_tasks(project_id)
-    metrics = utils.calculate_project_metrics(all_tasks)
+    # 자동 새로고침 (데이터를 불러오기 전에 기준 버전 기록)
+    render_live_refresh_toggle(project_id, "dashboard")
+
+    # 메트릭 카드와 상태별 분포는 프로젝트 카운터 컬럼(트리거로 유지, 보관된 완료 태스크 포함)에서 가져옴
+    metrics = {
+        'total': project['task_total'],
+        'todo': project['task_todo'],
+        'in_progress': project['task_in_progress'],
+        'done': project['task_done'],
+        'progress_rate': utils.calculate_progress_rate(project['task_total'], project['task_done']),
+    }
 
     # 메트릭 카드
     col1, col2, col3, col4 = st.columns(4)
@@ -40,89 +50,68 @@ def render_dashboard_tab(project):
         else:
             st.metric("⏰ 남은 기간", "미설정")
 
+    # 완료 예측 (남은 태스크가 있을 때만, 최근 완료 기록이 없으면 표시하지 않음)
+    remaining = metrics['total'] - metrics['done']
+    if remaining:
+        _render_completion_forecast(project, remaining)
+
     st.markdown("---")
 
     # 차트 영역
-    if not all_tasks:
+    if not metrics['total']:
         st.info("📊 태스크가 없어서 차트를 표시할 수 없습니다. Kanban 보드에서 태스크를 추가해보세요!")
         return
 
+    # 우선순위/태그/진행률 추이 차트는 현재 태스크에 보관된 태스크의 집계만 더함
+    # (보관된 태스크는 카운터와의 차이로 확인하고, 있을 때만 데이터 버전으로 캐시된 집계 조회)
+    all_tasks = db.get_tasks(project_id)
+    archived_done = metrics['done'] - sum(1 for t in all_tasks if t['status'] == 'done')
+    archived = db.get_archived_task_stats(project_id) if archived_done > 0 else None
+    archived = archived or {'priority': {}, 'tags': {}, 'completed': {}}
+
     # 2개 컬럼으로 차트 배치
     col1, col2 = st.columns(2)
 
     with col1:
         # 상태별 분포 (원형 차트)
         st.markdown("### 📊 상태별 태스크 분포")
-        status_dist = utils.get_status_distribution(all_tasks)
-
-        fig_pie = px.pie(
-            names=['📝 To Do', '🔄 In Progress', '✅ Done'],
-            values=[status_dist['todo'], status_dist['in_progress'], status_dist['done']],
-            color_discrete_sequence=['#FFA07A', '#87CEEB', '#90EE90']
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+        fig_pie = charts.build_status_pie(metrics['todo'], metrics['in_progress'], metrics['done'])
         st.plotly_chart(fig_pie, use_container_width=True)
 
     with col2:
         # 우선순위별 분포 (막대 차트)
         st.markdown("### 🎯 우선순위별 분포")
         priority_dist = utils.get_priority_distribution(all_tasks)
+        for priority, count in archived['priority'].items():
+            if priority in priority_dist:
+                priority_dist[priority] += count
 
-        fig_bar = px.bar(
-            x=['🟢 Low', '🟡 Medium', '🔴 High'],
-            y=[priority_dist['low'], priority_dist['medium'], priority_dist['high']],
-            labels={'x': '우선순위', 'y': '개수'},
-            color=['🟢 Low', '🟡 Medium', '🔴 High'],
-            color_discrete_sequence=['#90EE90', '#FFD700', '#FF6B6B']
+        fig_bar = charts.build_priority_bar(
+            priority_dist['low'], priority_dist['medium'], priority_dist['high']
         )
-        fig_bar.update_layout(showlegend=False, xaxis_title="", yaxis_title="태스크 개수")
         st.plotly_chart(fig_bar, use_container_width=True)
 
     # 진행률 추이 (완료된 태스크가 있을 때만)
     done_tasks = [t for t in all_tasks if t['status'] == 'done' and t.get('completed_at')]
-    if done_tasks:
+    if done_tasks or archived['completed']:
         st.markdown("### 📈 진행률 추이")
-        df_progress = utils.prepare_progress_history(all_tasks)
+        df_progress = utils.prepare_progress_history(all_tasks, archived['completed'], total=metrics['total'])
 
         if not df_progress.empty:
-            fig_line = px.line(
-                df_progress,
-                x='date',
-                y='progress_rate',
-                labels={'date': '날짜', 'progress_rate': '완료율 (%)'},
-                markers=True
-            )
-            fig_line.update_layout(
-                yaxis_range=[0, 100],
-                showlegend=False,
-                hovermode='x unified'
-            )
-
-            # 목표선 추가 (100%)
-            fig_line.add_hline(
-                y=100,
-                line_dash="dash",
-                line_color="green",
-                annotation_text="목표 (100%)"
-            )
-
+            points = tuple(zip(df_progress['date'], df_progress['progress_rate']))
+            fig_line = charts.build_progress_line(points)
             st.plotly_chart(fig_line, use_container_width=True)
 
     # 태그별 분포
     tag_dist = utils.get_tag_distribution(all_tasks)
+    for tag, count in archived['tags'].items():
+        tag_dist[tag] = tag_dist.get(tag, 0) + count
     if tag_dist:
         st.markdown("### 🏷️ 태그별 분포")
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            fig_tag = px.bar(
-                x=list(tag_dist.keys()),
-                y=list(tag_dist.values()),
-                labels={'x': '태그', 'y': '개수'},
-                color=list(tag_dist.keys()),
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            fig_tag.update_layout(showlegend=False, xaxis_title="", yaxis_title="태스크 개수")
+            fig_tag = charts.build_tag_bar(tuple(tag_dist.items()))
             st.plotly_chart(fig_tag, use_container_width=True)
 
         with col2:
@@ -131,6 +120,9 @@ def render_dashboard_tab(project):
                 icon = utils.get_tag_icon(tag)
                 st.write(f"{icon} **{tag}**: {count}개")
 
+    # 사이클 타임 / 리드 타임 (리드 타임 표본이 없으면 표시하지 않음)
+    _render_flow_metrics(project_id)
+
     st.markdown("---")
 
     # 마일스톤 섹션
@@ -235,3 +227,106 @@ def render_dashboard_tab(project):
                         if milestone_id:
                             st.success("✅ 마일스톤이 추가되었습니다!")
                             st.rerun()
+
+
+def _render_completion_forecast(project, remaining):
+    """최근 처리량 기반 완료 예상일 (몬테카를로 P50/P85)"""
+
+    prediction = forecast.get_completion_forecast(project, remaining)
+    if not prediction:
+        return
+
+    def format_forecast_date(value):
+        return utils.format_date(value) if value else "1년 이상"
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("🔮 완료 예상 (P50)", format_forecast_date(prediction['p50_date']))
+
+    with col2:
+        st.metric("🔮 완료 예상 (P85)", format_forecast_date(prediction['p85_date']))
+
+    with col3:
+        if prediction['on_time_probability'] is not None:
+            st.metric("🎯 목표일 내 완료 확률", f"{prediction['on_time_probability']:.0%}")
+        else:
+            st.metric("🎯 목표일 내 완료 확률", "목표일 미설정")
+
+    st.caption(
+        f"최근 {prediction['history_days']}일의 일별 완료 개수로 남은 태스크 {remaining}개를 "
+        f"{prediction['trials']:,}번 시뮬레이션한 결과입니다 (P85: 85% 확률로 이 날까지 완료)."
+    )
+
+
+def _render_flow_metrics(project_id):
+    """사이클 타임(시작 → 완료) / 리드 타임(생성 → 완료) 섹션"""
+
+    flow = db.get_flow_metrics(project_id)
+    if not flow or not flow['lead']:
+        return
+
+    st.markdown("### ⏱️ 사이클 타임 / 리드 타임")
+    st.caption("사이클 타임: 시작 → 완료, 리드 타임: 생성 → 완료 · "
+               "P50은 절반, P85는 85%의 태스크가 이 시간 안에 완료됨")
+
+    cycle = flow['cycle'] or {}
+    lead = flow['lead']
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("🔄 사이클 타임 P50", utils.format_duration(cycle.get('p50')))
+
+    with col2:
+        st.metric("🔄 사이클 타임 P85", utils.format_duration(cycle.get('p85')))
+
+    with col3:
+        st.metric("📬 리드 타임 P50", utils.format_duration(lead['p50']))
+
+    with col4:
+        st.metric("📬 리드 타임 P85", utils.format_duration(lead['p85']))
+
+    # 주간 추이 (최근 몇 주의 중앙값)
+    points = tuple((week['week_start'], week['cycle_p50'], week['lead_p50']) for week in flow['weekly'])
+    if points:
+        st.plotly_chart(charts.build_flow_trend(points), use_container_width=True)
+
+    # 우선순위별 / 태그별
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 🎯 우선순위별")
+        rows = [
+            _flow_row(utils.get_priority_badge(priority), flow['by_priority'][priority])
+            for priority in ('high', 'medium', 'low') if priority in flow['by_priority']
+        ]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+    with col2:
+        st.markdown("#### 🏷️ 태그별")
+        if flow['by_tag']:
+            rows = [
+                _flow_row(f"{utils.get_tag_icon(tag)} {tag}", groups)
+                for tag, groups in sorted(flow['by_tag'].items(),
+                                          key=lambda item: -(item[1]['lead'] or {}).get('count', 0))
+            ]
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+        else:
+            st.caption("태그가 지정된 완료 태스크가 없습니다.")
+
+
+def _flow_row(label, groups):
+    """우선순위/태그별 표의 한 행"""
+
+    cycle = groups['cycle'] or {}
+    lead = groups['lead'] or {}
+
+    return {
+        '구분': label,
+        '완료': lead.get('count', 0),
+        '사이클 P50': utils.format_duration(cycle.get('p50')),
+        '사이클 P85': utils.format_duration(cycle.get('p85')),
+        '리드 P50': utils.format_duration(lead.get('p50')),
+        '리드 P85': utils.format_duration(lead.get('p85')),
+    }
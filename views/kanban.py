@@ -6,6 +6,7 @@ Kanban 보드 탭 렌더링
 import streamlit as st
 import db_manager as db
 import utils
+from views.live_refresh import render_live_refresh_toggle
 
 
 def render_kanban_tab(project):
@@ -13,6 +14,9 @@ def render_kanban_tab(project):
 
     project_id = project['id']
 
+    # 자동 새로고침 (데이터를 불러오기 전에 기준 버전 기록)
+    render_live_refresh_toggle(project_id, "kanban")
+
     # 빠른 태스크 추가
     with st.container():
         col1, col2 = st.columns([4, 1])
@@ -44,8 +48,37 @@ def render_kanban_tab(project):
 
     st.markdown("---")
 
-    # 태스크 불러오기
-    all_tasks = db.get_tasks(project_id)
+    # 태스크 불러오기 (세션 공용 보드, 프로젝트가 바뀌었을 때만 변경분 반영)
+    all_tasks = db.get_board_tasks(project_id) or []
+
+    # 보관된 완료 태스크 안내 (프로젝트 카운터에는 포함, 보드에는 표시하지 않음)
+    archived_done = project['task_done'] - sum(1 for t in all_tasks if t['status'] == 'done')
+    if archived_done > 0:
+        st.caption(f"🗄️ 오래된 완료 태스크 {archived_done}개는 보관되어 보드에 표시되지 않습니다. (대시보드 통계에는 포함)")
+
+    # 카드별 체크리스트 진행 현황 (한 번의 쿼리로 조회)
+    checklist_counts = db.get_checklist_counts([t['id'] for t in all_tasks])
+
+    # 보기 모드
+    mode_col1, mode_col2 = st.columns(2)
+    with mode_col1:
+        compact_mode = st.toggle(
+            "⚡ 간단히 보기",
+            key="kanban_compact_mode",
+            help="태스크가 많을 때 컬럼별 표 하나로 빠르게 표시합니다"
+        )
+
+    if compact_mode:
+        render_compact_board(all_tasks, checklist_counts)
+        if not all_tasks:
+            st.info("📝 태스크가 없습니다. 위에서 첫 태스크를 추가해보세요!")
+        return
+
+    # 다중 선택 모드
+    with mode_col2:
+        bulk_mode = st.toggle("☑️ 여러 개 선택", key="kanban_bulk_mode")
+    if bulk_mode:
+        render_bulk_action_bar(all_tasks)
 
     # 상태별로 분류
     todo_tasks = [t for t in all_tasks if t['status'] == 'todo']
@@ -60,33 +93,220 @@ def render_kanban_tab(project):
         st.caption(f"{len(todo_tasks)}개")
         st.markdown("---")
         for task in todo_tasks:
-            render_task_card(task, project_id)
+            render_task_card(task, project_id, checklist_counts.get(task['id']))
 
     with col2:
         st.markdown("### 🔄 In Progress")
         st.caption(f"{len(in_progress_tasks)}개")
         st.markdown("---")
         for task in in_progress_tasks:
-            render_task_card(task, project_id)
+            render_task_card(task, project_id, checklist_counts.get(task['id']))
 
     with col3:
         st.markdown("### ✅ Done")
         st.caption(f"{len(done_tasks)}개")
         st.markdown("---")
         for task in done_tasks:
-            render_task_card(task, project_id)
+            render_task_card(task, project_id, checklist_counts.get(task['id']))
 
     # 태스크가 없는 경우
     if not all_tasks:
         st.info("📝 태스크가 없습니다. 위에서 첫 태스크를 추가해보세요!")
 
 
-def render_task_card(task, project_id):
+def render_compact_board(all_tasks, checklist_counts):
+    """
+    간단히 보기 보드 렌더링
+
+    컬럼마다 선택 가능한 표 하나만 그리고, 동작은 하나의 액션 바에서 처리하여
+    태스크 수가 늘어도 위젯 수가 늘지 않도록 한다.
+    """
+
+    # 액션 후 선택을 초기화하기 위해 표 키에 붙이는 번호
+    nonce = st.session_state.get('compact_board_nonce', 0)
+
+    columns = [
+        ('todo', "### 📝 To Do"),
+        ('in_progress', "### 🔄 In Progress"),
+        ('done', "### ✅ Done"),
+    ]
+    selected_tasks = []
+
+    for col, (status, header) in zip(st.columns(3), columns):
+        tasks = [t for t in all_tasks if t['status'] == status]
+
+        with col:
+            st.markdown(header)
+            st.caption(f"{len(tasks)}개")
+
+            if tasks:
+                event = st.dataframe(
+                    [_compact_row(task, checklist_counts.get(task['id'])) for task in tasks],
+                    hide_index=True,
+                    use_container_width=True,
+                    on_select="rerun",
+                    selection_mode="multi-row",
+                    key=f"compact_{status}_{nonce}"
+                )
+                selected_tasks.extend(tasks[i] for i in event.selection.rows)
+
+    render_compact_action_bar(selected_tasks)
+
+    # 태스크 상세 보기 다이얼로그
+    for task in all_tasks:
+        if st.session_state.view_task_id == task['id']:
+            show_task_detail_dialog(task)
+            break
+
+
+def _compact_row(task, checklist_count):
+    """간단히 보기 표의 한 행"""
+
+    return {
+        '제목': task['title'],
+        '우선순위': utils.get_priority_badge(task['priority']),
+        '태그': utils.get_tag_icon(task['tags']) if task.get('tags') else "",
+        '마감': utils.get_due_date_badge(task['due_date']) if task.get('due_date') else "",
+        '체크': f"{checklist_count['checked']}/{checklist_count['total']}" if checklist_count else "",
+    }
+
+
+def render_compact_action_bar(selected_tasks):
+    """간단히 보기 액션 바 (선택한 태스크 이동/상세보기/삭제)"""
+
+    selected_ids = [task['id'] for task in selected_tasks]
+
+    with st.container(border=True):
+        st.caption(f"☑️ {len(selected_ids)}개 선택됨 (표에서 행을 선택하세요)")
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            to_todo = st.button("📝 To Do로", use_container_width=True, key="compact_todo_btn")
+        with col2:
+            to_in_progress = st.button("🔄 진행중으로", use_container_width=True, key="compact_progress_btn")
+        with col3:
+            to_done = st.button("✅ 완료로", use_container_width=True, key="compact_done_btn")
+        with col4:
+            view = st.button("👁️ 상세보기", use_container_width=True, key="compact_view_btn",
+                             disabled=len(selected_ids) != 1)
+        with col5:
+            delete = st.button("🗑️ 삭제", use_container_width=True, key="compact_delete_btn")
+
+    if not (to_todo or to_in_progress or to_done or view or delete):
+        return
+
+    if not selected_ids:
+        st.warning("먼저 태스크를 선택해주세요.")
+        return
+
+    if view:
+        st.session_state.view_task_id = selected_ids[0]
+        st.rerun()
+
+    if delete:
+        count = db.bulk_delete_tasks(selected_ids)
+        message = f"✅ {count}개 태스크를 삭제했습니다."
+    else:
+        new_status = 'todo' if to_todo else 'in_progress' if to_in_progress else 'done'
+        count = db.bulk_update_task_status(selected_ids, new_status)
+        message = f"✅ {count}개 태스크를 이동했습니다."
+
+    # 선택 초기화
+    st.session_state.compact_board_nonce = st.session_state.get('compact_board_nonce', 0) + 1
+
+    st.toast(message)
+    st.rerun()
+
+
+def _bulk_select_key(task_id):
+    """다중 선택 체크박스 키"""
+    return f"bulk_select_{task_id}"
+
+
+def render_bulk_action_bar(all_tasks):
+    """다중 선택 액션 바 (일괄 이동/수정/삭제)"""
+
+    selected_ids = [
+        t['id'] for t in all_tasks
+        if st.session_state.get(_bulk_select_key(t['id']))
+    ]
+
+    with st.container(border=True):
+        st.caption(f"☑️ {len(selected_ids)}개 선택됨")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            status_labels = {'todo': '📝 To Do', 'in_progress': '🔄 In Progress', 'done': '✅ Done'}
+            target_status = st.selectbox(
+                "상태 이동",
+                options=list(status_labels.keys()),
+                format_func=lambda x: status_labels[x],
+                key="bulk_target_status"
+            )
+            move_clicked = st.button("➡️ 이동", use_container_width=True, key="bulk_move_btn")
+
+        with col2:
+            priority_labels = {'low': '🟢 Low', 'medium': '🟡 Medium', 'high': '🔴 High'}
+            target_priority = st.selectbox(
+                "우선순위 변경",
+                options=list(priority_labels.keys()),
+                format_func=lambda x: priority_labels[x],
+                index=1,
+                key="bulk_target_priority"
+            )
+            priority_clicked = st.button("🎯 적용", use_container_width=True, key="bulk_priority_btn")
+
+        with col3:
+            target_tags = st.text_input("태그 변경", placeholder="Dev,Test", key="bulk_target_tags")
+            tags_clicked = st.button("🏷️ 적용", use_container_width=True, key="bulk_tags_btn")
+
+        with col4:
+            st.write("")
+            st.write("")
+            delete_clicked = st.button("🗑️ 선택 삭제", use_container_width=True, key="bulk_delete_btn")
+
+    if not (move_clicked or priority_clicked or tags_clicked or delete_clicked):
+        return
+
+    if not selected_ids:
+        st.warning("먼저 태스크를 선택해주세요.")
+        return
+
+    if move_clicked:
+        count = db.bulk_update_task_status(selected_ids, target_status)
+        message = f"✅ {count}개 태스크를 이동했습니다."
+    elif priority_clicked:
+        count = db.bulk_update_tasks(selected_ids, priority=target_priority)
+        message = f"✅ {count}개 태스크의 우선순위를 변경했습니다."
+    elif tags_clicked:
+        count = db.bulk_update_tasks(
+            selected_ids,
+            tags=target_tags.strip() if target_tags and target_tags.strip() else None
+        )
+        message = f"✅ {count}개 태스크의 태그를 변경했습니다."
+    else:
+        count = db.bulk_delete_tasks(selected_ids)
+        message = f"✅ {count}개 태스크를 삭제했습니다."
+
+    # 선택 초기화
+    for task_id in selected_ids:
+        st.session_state.pop(_bulk_select_key(task_id), None)
+
+    st.toast(message)
+    st.rerun()
+
+
+def render_task_card(task, project_id, checklist_count=None):
     """태스크 카드 렌더링"""
 
     with st.container():
-        # 제목
-        st.markdown(f"**{task['title']}**")
+        # 제목 (다중 선택 모드에서는 체크박스)
+        if st.session_state.get('kanban_bulk_mode'):
+            st.checkbox(f"**{task['title']}**", key=_bulk_select_key(task['id']))
+        else:
+            st.markdown(f"**{task['title']}**")
 
         # 메타 정보
         meta_info = []
@@ -100,6 +320,10 @@ def render_task_card(task, project_id):
         priority_badge = utils.get_priority_badge(task['priority'])
         meta_info.append(priority_badge)
 
+        # 체크리스트 진행 현황
+        if checklist_count:
+            meta_info.append(f"☑️ {checklist_count['checked']}/{checklist_count['total']} 체크")
+
         if meta_info:
             st.caption(" | ".join(meta_info))
 
@@ -349,27 +573,27 @@ def show_task_edit_form(task):
                 for error in errors:
                     st.error(error)
             else:
-                # 태스크 수정
-                success = db.update_task(
-                    task['id'],
-                    title=title.strip(),
-                    description=description.strip() if description else None,
-                    status=status,
-                    priority=priority,
-                    tags=tags_input.strip() if tags_input else None,
-                    estimated_hours=estimated_hours if estimated_hours > 0 else None,
-                    due_date=due_date
-                )
-
-                if success:
-                    # 새 체크리스트 항목 추가
-                    if new_checklist and new_checklist.strip():
+                # 태스크 수정 + 새 체크리스트 항목 추가 (한 트랜잭션, 커밋 한 번)
+                with db.transaction() as tx:
+                    success = db.update_task(
+                        task['id'],
+                        title=title.strip(),
+                        description=description.strip() if description else None,
+                        status=status,
+                        priority=priority,
+                        tags=tags_input.strip() if tags_input else None,
+                        estimated_hours=estimated_hours if estimated_hours > 0 else None,
+                        due_date=due_date
+                    )
+
+                    if success and new_checklist and new_checklist.strip():
                         items = new_checklist.strip().split('\n')
                         for item_content in items:
                             item_content = item_content.strip()
                             if item_content:  # 빈 줄 무시
                                 db.insert_checklist_item(task['id'], item_content)
 
+                if success and tx.committed:
                     st.success("✅ 태스크가 수정되었습니다!")
                     st.session_state.edit_task_id = None
                     st.rerun()
@@ -0,0 +1,46 @@
+"""
+Project Tracker - Live Refresh
+공유 보드 자동 새로고침 (데이터 버전 폴링)
+"""
+
+import streamlit as st
+import db_manager as db
+from config import LIVE_REFRESH_SECONDS
+
+
+def render_live_refresh_toggle(project_id, view_name):
+    """
+    자동 새로고침 토글 렌더링
+
+    켜져 있으면 주기적으로 프로젝트 데이터 버전만 확인하고,
+    다른 사용자의 변경으로 버전이 바뀐 경우에만 전체 화면을 다시 그린다.
+    화면 데이터를 불러오기 전에 호출해야 기준 버전이 정확하다.
+
+    Args:
+        project_id: 프로젝트 ID
+        view_name: 뷰 이름 (토글/상태 키 구분용)
+    """
+    enabled = st.toggle(
+        "🔄 자동 새로고침",
+        key=f"live_refresh_{view_name}",
+        help=f"{LIVE_REFRESH_SECONDS}초마다 다른 팀원의 변경 사항을 확인합니다"
+    )
+
+    if not enabled:
+        return
+
+    # 이번 전체 실행에서 그릴 데이터의 기준 버전
+    st.session_state[f"live_refresh_version_{view_name}"] = db.get_project_version(project_id)
+
+    _watch_project_version(project_id, view_name)
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def _watch_project_version(project_id, view_name):
+    """프로젝트 데이터 버전 확인 (버전이 바뀐 경우에만 전체 다시 실행)"""
+
+    version_key = f"live_refresh_version_{view_name}"
+    version = db.get_project_version(project_id)
+
+    if version is not None and version != st.session_state.get(version_key):
+        st.rerun()
@@ -0,0 +1,84 @@
+"""
+Project Tracker - Portfolio View
+전체 프로젝트 한눈에 보기 화면
+"""
+
+import streamlit as st
+import db_manager as db
+import utils
+from config import PROJECT_STATUS
+
+
+def render_portfolio_page():
+    """포트폴리오 페이지 렌더링 (사용자의 전체 프로젝트 요약)"""
+
+    st.title("🗂️ 전체 프로젝트")
+    st.caption("👈 왼쪽 사이드바 또는 아래 목록에서 프로젝트를 선택하거나 새로 만들어주세요.")
+
+    user_id = st.session_state.user['id'] if st.session_state.user else None
+    if user_id is None:
+        return
+
+    portfolio = db.get_portfolio(user_id)
+
+    if not portfolio:
+        st.info("📋 프로젝트가 없습니다. 사이드바에서 새 프로젝트를 만들어보세요!")
+        return
+
+    # 전체 요약 메트릭
+    total_tasks = sum(p['task_total'] for p in portfolio)
+    done_tasks = sum(p['task_done'] for p in portfolio)
+    overdue_tasks = sum(p['overdue_count'] for p in portfolio)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("📋 프로젝트", len(portfolio))
+
+    with col2:
+        st.metric("📝 전체 태스크", total_tasks)
+
+    with col3:
+        st.metric("📊 전체 진행률", f"{utils.calculate_progress_rate(total_tasks, done_tasks):.0f}%")
+
+    with col4:
+        st.metric("🔴 지연 태스크", overdue_tasks)
+
+    st.markdown("---")
+
+    # 프로젝트별 요약
+    for project in portfolio:
+        render_portfolio_row(project)
+
+
+def render_portfolio_row(project):
+    """포트폴리오의 프로젝트 한 줄 렌더링"""
+
+    progress_rate = utils.calculate_progress_rate(project['task_total'], project['task_done'])
+
+    with st.container(border=True):
+        col1, col2, col3 = st.columns([2, 2, 2])
+
+        with col1:
+            if st.button(f"📋 {project['name']}", key=f"portfolio_{project['id']}", use_container_width=True):
+                st.session_state.current_project_id = project['id']
+                st.rerun()
+            st.caption(PROJECT_STATUS.get(project['status'], project['status']))
+
+        with col2:
+            st.progress(progress_rate / 100, text=f"{progress_rate:.0f}% ({project['task_done']}/{project['task_total']})")
+            if project['overdue_count']:
+                st.caption(f"🔴 지연 태스크 {project['overdue_count']}개")
+
+        with col3:
+            milestone = project['next_milestone']
+            if milestone:
+                st.caption(
+                    f"📅 다음 마일스톤: **{milestone['title']}** "
+                    f"({utils.get_due_date_badge(milestone['target_date'])})"
+                )
+            else:
+                st.caption("📅 예정된 마일스톤 없음")
+
+            if project.get('last_activity'):
+                st.caption(f"🕐 최근 활동: {utils.get_relative_time(project['last_activity'])}")
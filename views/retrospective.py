@@ -202,3 +202,101 @@ def render_retrospective_tab(project):
                         st.rerun()
                     else:
                         st.error("회고 수정에 실패했습니다.")
+
+
+def render_my_retrospectives_page():
+    """내 회고 모아보기 페이지 렌더링 (모든 프로젝트의 회고)"""
+
+    st.title("📚 내 회고 모아보기")
+    st.caption("프로젝트별 KPT 회고를 최근 작성 순으로 모아봅니다.")
+
+    user_id = st.session_state.user['id'] if st.session_state.user else None
+    if user_id is None:
+        return
+
+    # 페이지 커서 스택 (각 페이지의 시작 커서)
+    if 'my_retro_cursors' not in st.session_state:
+        st.session_state.my_retro_cursors = [None]
+    if 'expanded_retrospective_id' not in st.session_state:
+        st.session_state.expanded_retrospective_id = None
+
+    cursors = st.session_state.my_retro_cursors
+    retrospectives, next_cursor = db.get_user_retrospectives(user_id, before=cursors[-1])
+
+    if not retrospectives:
+        st.info("📝 아직 작성된 회고가 없습니다. 프로젝트의 회고 탭에서 작성해보세요!")
+        return
+
+    st.markdown("---")
+
+    for retro in retrospectives:
+        with st.container(border=True):
+            col1, col2 = st.columns([4, 1])
+
+            with col1:
+                st.markdown(f"**📋 {retro['project_name']}**")
+                st.caption(f"📅 {utils.format_datetime(retro['created_at'])}")
+
+            is_expanded = st.session_state.expanded_retrospective_id == retro['id']
+
+            with col2:
+                if st.button("접기" if is_expanded else "펼치기",
+                             key=f"toggle_retro_{retro['id']}", use_container_width=True):
+                    st.session_state.expanded_retrospective_id = None if is_expanded else retro['id']
+                    st.rerun()
+
+            if is_expanded:
+                # 펼친 항목만 전체 내용 조회
+                render_retrospective_full(db.get_retrospective(retro['project_id']))
+            else:
+                _render_retrospective_preview(retro)
+
+    # 페이지 이동
+    col_prev, _, col_next = st.columns([1, 3, 1])
+
+    with col_prev:
+        if len(cursors) > 1 and st.button("◀️ 이전", use_container_width=True):
+            cursors.pop()
+            st.rerun()
+
+    with col_next:
+        if next_cursor and st.button("다음 ▶️", use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
+
+
+def _render_retrospective_preview(retro):
+    """회고 미리보기 렌더링"""
+
+    previews = [
+        ("🟢", retro.get('keep_preview')),
+        ("🔴", retro.get('problem_preview')),
+        ("🟡", retro.get('try_preview')),
+        ("📚", retro.get('learning_preview')),
+    ]
+
+    for icon, preview in previews:
+        if preview:
+            st.caption(f"{icon} {utils.truncate_text(preview.replace(chr(10), ' '), 70)}")
+
+
+def render_retrospective_full(retrospective):
+    """회고 전체 내용 렌더링"""
+
+    if not retrospective:
+        st.caption("_회고를 불러올 수 없습니다._")
+        return
+
+    sections = [
+        ("### 🟢 Keep (계속할 것)", retrospective.get('keep_content')),
+        ("### 🔴 Problem (문제점)", retrospective.get('problem_content')),
+        ("### 🟡 Try (시도할 것)", retrospective.get('try_content')),
+        ("### 📚 Learning (배운 점)", retrospective.get('learning_content')),
+    ]
+
+    for header, content in sections:
+        st.markdown(header)
+        if content:
+            st.markdown(content)
+        else:
+            st.caption("_작성된 내용이 없습니다._")